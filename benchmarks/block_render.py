@@ -0,0 +1,51 @@
+"""Compares the render engines of `BlockImage` across image sizes.
+
+Run from the project root with::
+
+    python benchmarks/block_render.py [image] [repeat]
+
+NumPy must be installed for the array-backed engine to be compared.
+"""
+
+import sys
+from timeit import repeat as time_repeat
+
+from term_image import disable_queries
+from term_image.image import BlockImage, block
+
+SIZES = ((20, 10), (50, 25), (100, 50), (200, 100), (400, 200))
+
+
+def time_render(image, alpha):
+    return min(
+        time_repeat(
+            lambda: image._renderer(image._render_image, alpha),
+            number=1,
+            repeat=n_repeat,
+        )
+    )
+
+
+if __name__ == "__main__":
+    source = sys.argv[1] if len(sys.argv) > 1 else "tests/images/python.png"
+    n_repeat = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+    numpy = block.numpy
+    if not numpy:
+        sys.exit("NumPy is not installed")
+
+    disable_queries()
+    image = BlockImage.from_file(source)
+    print(
+        f"{'size':>10} {'alpha':>8} {'loop (ms)':>10} {'numpy (ms)':>11} {'speedup':>8}"
+    )
+    for size in SIZES:
+        image.set_size(*size)
+        for alpha in (0.1568, None):
+            block.numpy = None
+            loop = time_render(image, alpha)
+            block.numpy = numpy
+            vectorized = time_render(image, alpha)
+            print(
+                f"{'x'.join(map(str, size)):>10} {alpha!s:>8} {loop * 1000:>10.2f} "
+                f"{vectorized * 1000:>11.2f} {loop / vectorized:>7.1f}x"
+            )
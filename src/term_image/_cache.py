@@ -0,0 +1,282 @@
+"""
+.. Caching utilities
+"""
+
+from __future__ import annotations
+
+__all__ = ("CacheInfo", "DiskCache", "FrameCache", "LRUCache", "write_file_atomic")
+
+import mmap
+import os
+from collections import OrderedDict
+from hashlib import sha256
+from tempfile import mkstemp
+from threading import RLock
+from typing import Callable, Generic, Hashable, NamedTuple, Optional, TypeVar
+
+from .utils import arg_type_error, arg_value_error_range
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LRUCache(Generic[K, V]):
+    """A thread-safe least-recently-used cache with a size budget.
+
+    Args:
+        max_size: The maximum total size of the cached values. If zero, nothing is
+          cached.
+        sizeof: Returns the size of a value.
+        on_evict: If not ``None``, called with the key and value of every evicted or
+          replaced value, while the cache is locked.
+
+    Values are evicted, least-recently-used first, whenever the total size would
+    exceed *max_size*. A value larger than *max_size* is never cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        sizeof: Callable[[V], int],
+        on_evict: Optional[Callable[[K, V], None]] = None,
+    ) -> None:
+        self._entries: OrderedDict[K, tuple[V, int]] = OrderedDict()
+        self._lock = RLock()
+        self._max_size = 0
+        self._size = 0
+        self._sizeof = sizeof
+        self._on_evict = on_evict
+        self.max_size = max_size
+
+    def __contains__(self, key: K) -> bool:
+        return key in self._entries
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def max_size(self) -> int:
+        """The maximum total size of the cached values
+
+        Setting this property evicts values as required.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size: int) -> None:
+        if not isinstance(max_size, int):
+            raise arg_type_error("max_size", max_size)
+        if max_size < 0:
+            raise arg_value_error_range("max_size", max_size)
+
+        with self._lock:
+            self._max_size = max_size
+            self._trim(max_size)
+
+    @property
+    def size(self) -> int:
+        """The total size of the cached values"""
+        return self._size
+
+    def clear(self) -> None:
+        """Evicts all values."""
+        with self._lock:
+            if self._on_evict:
+                for key, (value, _) in self._entries.items():
+                    self._on_evict(key, value)
+            self._entries.clear()
+            self._size = 0
+
+    def discard(self, predicate: Callable[[K], bool]) -> None:
+        """Evicts all values whose keys satisfy *predicate*."""
+        with self._lock:
+            for key in [key for key in self._entries if predicate(key)]:
+                self._evict(key)
+
+    def get(self, key: K) -> Optional[V]:
+        """Returns the value cached for *key* (and marks it as most-recently-used) or
+        ``None``, if not cached.
+        """
+        with self._lock:
+            try:
+                self._entries.move_to_end(key)
+            except KeyError:
+                return None
+
+            return self._entries[key][0]
+
+    def put(self, key: K, value: V) -> None:
+        """Caches *value* for *key*, evicting other values as required."""
+        size = self._sizeof(value)
+        with self._lock:
+            if key in self._entries:
+                self._evict(key)
+            if size > self._max_size:
+                return
+            self._trim(self._max_size - size)
+            self._entries[key] = (value, size)
+            self._size += size
+
+    def _evict(self, key: K) -> None:
+        value, size = self._entries.pop(key)
+        self._size -= size
+        if self._on_evict:
+            self._on_evict(key, value)
+
+    def _trim(self, max_size: int) -> None:
+        """Evicts least-recently-used values until the total size is at most
+        *max_size*.
+        """
+        entries = self._entries
+        while self._size > max_size:
+            self._evict(next(iter(entries)))
+
+
+class CacheInfo(NamedTuple):
+    """Statistics of a :py:class:`FrameCache`."""
+
+    #: The number of lookups that found a valid frame.
+    hits: int
+    #: The number of lookups that found no valid frame.
+    misses: int
+    #: The number of cached frames.
+    frames: int
+    #: The total size of the cached frames.
+    size: int
+    #: The maximum total size of the cached frames. Zero implies unlimited.
+    max_size: int
+
+
+class FrameCache(Generic[V]):
+    """A cache of the rendered frames of an animation, with a size budget.
+
+    Args:
+        max_size: The maximum total size of the cached frames. If zero, the size is
+          unlimited.
+        sizeof: Returns the size of a frame.
+
+    Each frame is cached along with a key identifying the parameters it was rendered
+    with (e.g the render size) and is only valid for the same key.
+
+    The frames of an animation are required in a cycle, for which least-recently-used
+    eviction always evicts the frame that will be required soonest. Hence, once the
+    budget is exhausted, only invalid frames (i.e cached with a different key than
+    that of the frame being cached) are evicted to make room and valid frames are
+    never evicted, such that whichever frames fit remain cached across loops.
+    """
+
+    def __init__(self, max_size: int, sizeof: Callable[[V], int]) -> None:
+        self._entries: dict[int, tuple[V, Hashable, int]] = {}
+        self._max_size = max_size
+        self._size = 0
+        self._sizeof = sizeof
+        self._hits = self._misses = 0
+
+    def __getitem__(self, number: int) -> tuple[V, Hashable]:
+        """Returns the cached frame with the given number and its key.
+
+        Raises:
+            KeyError: The frame is not cached.
+        """
+        frame, key, _ = self._entries[number]
+        return frame, key
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def clear(self) -> None:
+        """Evicts all frames. The statistics are retained."""
+        self._entries.clear()
+        self._size = 0
+
+    def get(self, number: int, key: Hashable) -> Optional[V]:
+        """Returns the frame with the given number, if it's cached with *key*.
+        Otherwise, ``None``.
+        """
+        entry = self._entries.get(number)
+        if entry and entry[1] == key:
+            self._hits += 1
+            return entry[0]
+        self._misses += 1
+        return None
+
+    def info(self) -> CacheInfo:
+        """Returns the statistics of the cache."""
+        return CacheInfo(
+            self._hits, self._misses, len(self._entries), self._size, self._max_size
+        )
+
+    def put(self, number: int, key: Hashable, frame: V) -> None:
+        """Caches *frame* with the given number and *key*, if it fits."""
+        size = self._sizeof(frame)
+        entries = self._entries
+        if number in entries:
+            self._size -= entries.pop(number)[2]
+
+        max_size = self._max_size
+        if max_size and self._size + size > max_size:
+            if size > max_size:
+                return
+            for invalid in [n for n, entry in entries.items() if entry[1] != key]:
+                self._size -= entries.pop(invalid)[2]
+                if self._size + size <= max_size:
+                    break
+            else:
+                if self._size + size > max_size:
+                    return
+
+        entries[number] = (frame, key, size)
+        self._size += size
+
+
+class DiskCache:
+    """An on-disk cache of strings.
+
+    Args:
+        directory: The directory in which values are cached. It's created when the
+          first value is cached, if it doesn't exist.
+
+    Each value is stored (UTF-8-encoded) in a file named after the SHA-256 digest of
+    its key and read back via a memory map.
+
+    Files are written atomically, hence the cache may be shared by multiple threads
+    and processes. Values are never evicted.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def get(self, key: str) -> Optional[str]:
+        """Returns the value cached for *key* or ``None``, if not cached."""
+        try:
+            with (
+                open(self._path(key), "rb") as file,
+                mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data,
+            ):
+                return str(data, "utf-8")
+        except (OSError, ValueError):  # Not cached, empty or corrupted
+            return None
+
+    def put(self, key: str, value: str) -> None:
+        """Caches *value* for *key*.
+
+        Raises:
+            OSError: The cache directory or file could not be written.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        write_file_atomic(self._path(key), value.encode())
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, sha256(key.encode()).hexdigest())
+
+
+def write_file_atomic(path: str, data: bytes) -> None:
+    """Writes a file such that it's never observed partially written."""
+    fd, temp_path = mkstemp(dir=os.path.dirname(path))
+    try:
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.remove(temp_path)
+        raise
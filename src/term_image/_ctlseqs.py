@@ -10,6 +10,7 @@ from __future__ import annotations
 __all__: list[str] = []  # Updated later on
 
 import re
+from typing import Any
 
 # Parameters ===========================================================================
 
@@ -55,10 +56,12 @@ ST_b: bytes
 
 DA1 = f"{CSI}c"
 ERASE_CHARS = f"{CSI}{Ps}X"
+REP = f"{CSI}{Ps}b"
 XTVERSION = f"{CSI}>q"
 
 DA1_b: bytes
 ERASE_CHARS_b: bytes
+REP_b: bytes
 XTVERSION_b: bytes
 
 # # Cursor Movement ====================================================================
@@ -79,17 +82,27 @@ SGR = f"{CSI}{Pt}m"
 
 SGR_b: bytes
 
+SGR_BG_DEFAULT = SGR % "49"
 SGR_BG_DIRECT = SGR % f"48;2;{Pm(3)}"
 SGR_BG_DIRECT_2 = SGR % f"48:2::{Ps}:{Ps}:{Ps}"
 SGR_DEFAULT = SGR % ""
+SGR_FG_BG_DIRECT = SGR % f"38;2;{Pm(3)};48;2;{Pm(3)}"
+SGR_FG_DEFAULT = SGR % "39"
 SGR_FG_DIRECT = SGR % f"38;2;{Pm(3)}"
 SGR_FG_DIRECT_2 = SGR % f"38:2::{Ps}:{Ps}:{Ps}"
+SGR_BG_INDEXED = SGR % f"48;5;{Ps}"
+SGR_FG_INDEXED = SGR % f"38;5;{Ps}"
 
+SGR_BG_DEFAULT_b: bytes
 SGR_BG_DIRECT_b: bytes
 SGR_BG_DIRECT_2_b: bytes
 SGR_DEFAULT_b: bytes
+SGR_FG_BG_DIRECT_b: bytes
+SGR_FG_DEFAULT_b: bytes
 SGR_FG_DIRECT_b: bytes
 SGR_FG_DIRECT_2_b: bytes
+SGR_BG_INDEXED_b: bytes
+SGR_FG_INDEXED_b: bytes
 
 # # DEC Modes ==========================================================================
 
@@ -174,12 +187,21 @@ KITTY_END_CHUNKED = KITTY_TRANSMISSION % ("q=1,m=0", "")
 KITTY_DELETE_ALL = KITTY_DELETE % "A"
 KITTY_DELETE_CURSOR = KITTY_DELETE % "C"
 KITTY_DELETE_Z_INDEX = KITTY_DELETE_EXTRA % ("Z", f"z={Ps}")
+KITTY_DELETE_ID = KITTY_DELETE_EXTRA % ("I", f"i={Ps},q=2")
+# # Delete only placements, keeping the image data
+KITTY_DELETE_ALL_PLACEMENTS = KITTY_DELETE % "a"
+KITTY_DELETE_CURSOR_PLACEMENTS = KITTY_DELETE % "c"
+KITTY_DELETE_Z_INDEX_PLACEMENTS = KITTY_DELETE_EXTRA % ("z", f"z={Ps}")
 
 KITTY_SUPPORT_QUERY_b: bytes
 KITTY_END_CHUNKED_b: bytes
 KITTY_DELETE_ALL_b: bytes
 KITTY_DELETE_CURSOR_b: bytes
 KITTY_DELETE_Z_INDEX_b: bytes
+KITTY_DELETE_ID_b: bytes
+KITTY_DELETE_ALL_PLACEMENTS_b: bytes
+KITTY_DELETE_CURSOR_PLACEMENTS_b: bytes
+KITTY_DELETE_Z_INDEX_PLACEMENTS_b: bytes
 
 
 # `bytes` Versions of Control Sequences ================================================
@@ -233,6 +255,7 @@ del Response
 # Other Definitions ====================================================================
 
 __all__ += (
+    "SGRState",
     "cursor_backward",
     "cursor_down",
     "cursor_forward",
@@ -241,6 +264,96 @@ __all__ += (
 )
 
 
+class SGRState:
+    """Tracks the active foreground and background colours of a stream of text and
+    returns only the SGR control sequences required to change them.
+
+    A colour is an RGB tuple (direct colour), an integer (indexed colour) or ``None``
+    for the terminal's default colour.
+    Initially, both colours are unknown, hence the first sequence(s) set them
+    explicitly.
+
+    NOTE:
+        The state is only valid as long as every SGR sequence written to the stream
+        is obtained from the instance.
+    """
+
+    __slots__ = ("fg", "bg")
+
+    _UNKNOWN: Any = object()
+
+    def __init__(self) -> None:
+        self.fg: tuple[int, int, int] | int | None = self._UNKNOWN
+        self.bg: tuple[int, int, int] | int | None = self._UNKNOWN
+
+    def invalidate(self) -> None:
+        """Marks both colours as unknown.
+
+        Should be called whenever the state of the stream can no longer be relied on
+        e.g at the start of an output segment that may be written independently of
+        what precedes it.
+        """
+        self.fg = self.bg = self._UNKNOWN
+
+    def reset(self) -> str:
+        """Returns the sequence to reset all graphic rendition attributes."""
+        self.fg = self.bg = None
+
+        return SGR_DEFAULT
+
+    def set(
+        self,
+        fg: tuple[int, int, int] | int | None,
+        bg: tuple[int, int, int] | int | None,
+    ) -> str:
+        """Returns the sequence to set the foreground and background colours.
+
+        An empty string is returned if both colours are already active. If both
+        change, they're set by a single sequence.
+        """
+        if fg == self.fg:
+            return self.set_bg(bg)
+        if bg == self.bg:
+            return self.set_fg(fg)
+
+        self.fg = fg
+        self.bg = bg
+        if fg is None and bg is None:
+            return SGR_DEFAULT
+        if isinstance(fg, tuple) and isinstance(bg, tuple):
+            return SGR_FG_BG_DIRECT % (*fg, *bg)
+
+        return SGR % f"{_sgr_fg_params(fg)};{_sgr_bg_params(bg)}"
+
+    def set_bg(self, bg: tuple[int, int, int] | int | None) -> str:
+        """Returns the sequence to set the background colour.
+
+        An empty string is returned if the colour is already active.
+
+        NOTE:
+            If the foreground colour is unknown or the default and *bg* is ``None``,
+            all attributes are reset, since the sequence for that is the shortest.
+        """
+        if bg == self.bg:
+            return ""
+        if bg is None and (self.fg is None or self.fg is self._UNKNOWN):
+            return self.reset()
+        self.bg = bg
+
+        return SGR % _sgr_bg_params(bg)
+
+    def set_fg(self, fg: tuple[int, int, int] | int | None) -> str:
+        """Returns the sequence to set the foreground colour.
+
+        An empty string is returned if the colour is already active.
+        """
+        if fg == self.fg:
+            return ""
+        self.fg = fg
+
+        return SGR % _sgr_fg_params(fg)
+
+
 def cursor_backward(columns: int) -> str:
     return CURSOR_BACKWARD % columns if columns > 0 else ""
 
@@ -257,6 +370,35 @@ def cursor_up(lines: int) -> str:
     return CURSOR_UP % lines if lines > 0 else ""
 
 
+def _sgr_params(sequence: str) -> str:
+    """Returns the parameters (or parameter template) of an SGR sequence."""
+    return sequence[len(CSI) : -1]
+
+
+_SGR_BG_DEFAULT_PARAMS = _sgr_params(SGR_BG_DEFAULT)
+_SGR_BG_DIRECT_PARAMS = _sgr_params(SGR_BG_DIRECT)
+_SGR_BG_INDEXED_PARAMS = _sgr_params(SGR_BG_INDEXED)
+_SGR_FG_DEFAULT_PARAMS = _sgr_params(SGR_FG_DEFAULT)
+_SGR_FG_DIRECT_PARAMS = _sgr_params(SGR_FG_DIRECT)
+_SGR_FG_INDEXED_PARAMS = _sgr_params(SGR_FG_INDEXED)
+
+
+def _sgr_bg_params(color: tuple[int, int, int] | int | None) -> str:
+    if color is None:
+        return _SGR_BG_DEFAULT_PARAMS
+    if isinstance(color, int):
+        return _SGR_BG_INDEXED_PARAMS % color
+    return _SGR_BG_DIRECT_PARAMS % color
+
+
+def _sgr_fg_params(color: tuple[int, int, int] | int | None) -> str:
+    if color is None:
+        return _SGR_FG_DEFAULT_PARAMS
+    if isinstance(color, int):
+        return _SGR_FG_INDEXED_PARAMS % color
+    return _SGR_FG_DIRECT_PARAMS % color
+
+
 def x_parse_color(spec: str) -> tuple[int, int, int]:
     """Converts an RGB device specification according to ``XParseColor``
 
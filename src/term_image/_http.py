@@ -0,0 +1,172 @@
+"""
+.. HTTP utilities
+"""
+
+from __future__ import annotations
+
+__all__ = ("CacheEntry", "HTTPCache", "fetch", "session")
+
+import json
+import os
+import warnings
+from hashlib import sha256
+from typing import NamedTuple, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from ._cache import write_file_atomic
+from .exceptions import TermImageError, TermImageUserWarning, URLNotFoundError
+
+#: Shared by all requests, such that connections are pooled and reused.
+session = requests.Session()
+# Enough connections per host for concurrent requests by `BaseImage.from_urls()`
+for _prefix in ("http://", "https://"):
+    session.mount(_prefix, HTTPAdapter(pool_maxsize=32))
+
+
+class CacheEntry(NamedTuple):
+    """A response cached by :py:class:`HTTPCache`."""
+
+    etag: Optional[str]
+    last_modified: Optional[str]
+    data: bytes
+
+
+class HTTPCache:
+    """A content-addressed on-disk cache of HTTP response bodies.
+
+    Args:
+        directory: The directory in which responses are cached. It's created when
+          the first response is cached, if it doesn't exist.
+
+    The body of a response is stored in a file named after the SHA-256 digest of
+    its contents, such that identical contents (e.g from different URLs) are stored
+    once. The validators (``ETag`` and ``Last-Modified``) of the response and the
+    digest of its body are stored in a file named after the SHA-256 digest of the
+    URL.
+
+    Files are written atomically, hence the cache may be shared by multiple threads
+    and processes. Bodies no longer referenced by any URL are not removed.
+    """
+
+    def __init__(self, directory: str) -> None:
+        self.directory = directory
+
+    def get(self, url: str) -> Optional[CacheEntry]:
+        """Returns the response cached for *url* or ``None``, if not cached."""
+        try:
+            with open(self._url_path(url), encoding="utf-8") as file:
+                info = json.load(file)
+            if info["url"] != url:  # Highly unlikely
+                return None
+            with open(self._data_path(info["digest"]), "rb") as file:
+                data = file.read()
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+        if sha256(data).hexdigest() != info["digest"]:  # Corrupted
+            return None
+
+        return CacheEntry(info.get("etag"), info.get("last_modified"), data)
+
+    def put(self, url: str, entry: CacheEntry) -> None:
+        """Caches the response *entry* for *url*.
+
+        Raises:
+            OSError: The cache directory or a file could not be written.
+        """
+        os.makedirs(os.path.join(self.directory, "data"), exist_ok=True)
+        os.makedirs(os.path.join(self.directory, "urls"), exist_ok=True)
+
+        digest = sha256(entry.data).hexdigest()
+        data_path = self._data_path(digest)
+        if not os.path.exists(data_path):
+            write_file_atomic(data_path, entry.data)
+
+        info = {
+            "url": url,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+            "digest": digest,
+        }
+        write_file_atomic(self._url_path(url), json.dumps(info).encode())
+
+    def _data_path(self, digest: str) -> str:
+        return os.path.join(self.directory, "data", digest)
+
+    def _url_path(self, url: str) -> str:
+        return os.path.join(
+            self.directory, "urls", sha256(url.encode()).hexdigest() + ".json"
+        )
+
+
+def fetch(url: str, max_bytes: int = 0, cache: Optional[HTTPCache] = None) -> bytes:
+    """Returns the body of the response to a GET request for *url*.
+
+    Args:
+        url: The URL.
+        max_bytes: The maximum size of the body. If zero, the size is unlimited.
+        cache: If not ``None``, the body is read from or written to this cache.
+          A cached body is revalidated with the server before it's returned.
+
+    Raises:
+        term_image.exceptions.URLNotFoundError: The URL does not exist.
+        term_image.exceptions.TermImageError: The body is larger than *max_bytes*.
+
+    Also propagates connection-related exceptions from :py:mod:`requests`.
+
+    The body is streamed, such that a body larger than *max_bytes* is never
+    completely downloaded.
+    Only responses with an ``ETag`` or ``Last-Modified`` header, and without
+    ``Cache-Control: no-store``, are cached.
+    """
+    entry = cache and cache.get(url)
+    headers = {}
+    if entry:
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+
+    with session.get(url, headers=headers, stream=True) as response:
+        if entry and response.status_code == 304:
+            return entry.data
+        if response.status_code == 404:
+            raise URLNotFoundError(f"URL {url!r} does not exist.")
+
+        too_large = TermImageError(
+            f"The data at URL {url!r} is larger than {max_bytes} bytes"
+        )
+        try:
+            size = int(response.headers.get("Content-Length"))
+        except (TypeError, ValueError):
+            pass
+        else:
+            if max_bytes and size > max_bytes:
+                raise too_large
+
+        buffer = bytearray()
+        for chunk in response.iter_content(2**16):
+            buffer += chunk
+            if max_bytes and len(buffer) > max_bytes:
+                raise too_large
+        data = bytes(buffer)
+
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if (
+            cache
+            and response.status_code == 200
+            and (etag or last_modified)
+            and "no-store" not in response.headers.get("Cache-Control", "")
+        ):
+            try:
+                cache.put(url, CacheEntry(etag, last_modified, data))
+            except OSError as e:
+                warnings.warn(
+                    f"Could not cache the data at URL {url!r}: {e}",
+                    TermImageUserWarning,
+                )
+
+    return data
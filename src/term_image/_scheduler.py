@@ -0,0 +1,110 @@
+"""
+.. Animation scheduling utilities
+"""
+
+from __future__ import annotations
+
+__all__ = ("FrameScheduler",)
+
+from time import perf_counter_ns, sleep
+
+from .utils import arg_type_error, arg_value_error_range
+
+
+class FrameScheduler:
+    """Schedules the frames of an animation on an absolute timeline.
+
+    Args:
+        frame_skip: The maximum number of consecutive late frames that may be
+          dropped.
+
+    Raises:
+        TypeError: *frame_skip* is not an integer.
+        ValueError: *frame_skip* is negative.
+
+    Each frame is due when the durations of all frames before it have elapsed since
+    the first frame was drawn, such that the time spent rendering and drawing frames
+    does not accumulate as drift.
+
+    A frame that is ready within its own duration is drawn immediately. A frame
+    that is ready only after its entire duration has elapsed is dropped, unless
+    *frame_skip* consecutive frames have already been dropped. In that case, it's drawn
+    and the timeline restarts from it. A frame that is already late before it's
+    rendered can be dropped without being rendered, using :py:meth:`skip`.
+
+    Time is measured with the monotonic :py:func:`~time.perf_counter_ns` clock.
+    """
+
+    def __init__(self, frame_skip: int = 0) -> None:
+        if not isinstance(frame_skip, int) or isinstance(frame_skip, bool):
+            raise arg_type_error("frame_skip", frame_skip)
+        if frame_skip < 0:
+            raise arg_value_error_range("frame_skip", frame_skip)
+
+        self.frame_skip = frame_skip
+        #: The number of frames dropped so far.
+        self.dropped = 0
+        self._skipped = 0
+        self._due = 0  # When the next frame is due, in nanoseconds
+
+    def start(self, duration: int) -> None:
+        """Starts the timeline, just before the first frame is drawn.
+
+        Args:
+            duration: The duration of the first frame, in nanoseconds.
+        """
+        self._due = perf_counter_ns() + duration
+
+    def wait(self, duration: int) -> bool:
+        """Waits until the next frame is due.
+
+        Args:
+            duration: The duration of the next frame, in nanoseconds.
+
+        Returns:
+            ``True``, if the frame should be drawn. Otherwise, ``False``, if the frame
+            should be dropped.
+        """
+        due = self._due
+        self._due += duration
+        now = perf_counter_ns()
+        if now < due:
+            sleep((due - now) / 10**9)
+        elif now >= self._due:
+            if self._skipped < self.frame_skip:
+                self._skipped += 1
+                self.dropped += 1
+                return False
+            self._due = now + duration
+
+        self._skipped = 0
+        return True
+
+    def skip(self, duration: int) -> bool:
+        """Drops the next frame, before it's rendered, if its entire duration has
+        already elapsed.
+
+        Args:
+            duration: The duration of the next frame, in nanoseconds.
+
+        Returns:
+            ``True``, if the frame is dropped and should not be rendered. Otherwise,
+            ``False``, in which case the frame should be rendered and then passed to
+            :py:meth:`wait`.
+
+        As with :py:meth:`wait`, at most *frame_skip* consecutive frames are dropped.
+        """
+        if (
+            self._skipped < self.frame_skip
+            and perf_counter_ns() >= self._due + duration
+        ):
+            self._due += duration
+            self._skipped += 1
+            self.dropped += 1
+            return True
+
+        return False
+
+    def finish(self) -> None:
+        """Waits until the last frame's duration has elapsed."""
+        sleep(max(0, self._due - perf_counter_ns()) / 10**9)
@@ -7,8 +7,12 @@ from __future__ import annotations
 __all__ = (
     "auto_image_class",
     "AutoImage",
+    "from_buffer",
+    "from_bytes",
     "from_file",
+    "from_files",
     "from_url",
+    "from_urls",
     "ImageSource",
     "Size",
     "BaseImage",
@@ -21,7 +25,7 @@ __all__ = (
 )
 
 import os
-from typing import Optional, Union
+from typing import Any, Iterable, List, Optional, Union
 
 import PIL
 
@@ -68,6 +72,34 @@ def AutoImage(
     return auto_image_class()(image, width=width, height=height)
 
 
+def from_buffer(buffer: Any, **kwargs: Union[None, int]) -> BaseImage:
+    """Creates an image instance from the data of an image file, in any object
+    supporting the buffer protocol.
+
+    Returns:
+        An instance of the automatically selected image render style (as returned by
+        :py:func:`auto_image_class`).
+
+    Same arguments and raised exceptions as :py:meth:`BaseImage.from_buffer`.
+    """
+    return auto_image_class().from_buffer(buffer, **kwargs)
+
+
+def from_bytes(
+    data: Union[bytes, bytearray, memoryview],
+    **kwargs: Union[None, int],
+) -> BaseImage:
+    """Creates an image instance from the data of an image file.
+
+    Returns:
+        An instance of the automatically selected image render style (as returned by
+        :py:func:`auto_image_class`).
+
+    Same arguments and raised exceptions as :py:meth:`BaseImage.from_bytes`.
+    """
+    return auto_image_class().from_bytes(data, **kwargs)
+
+
 def from_file(
     filepath: Union[str, os.PathLike],
     **kwargs: Union[None, int],
@@ -83,6 +115,24 @@ def from_file(
     return auto_image_class().from_file(filepath, **kwargs)
 
 
+def from_files(
+    filepaths: Iterable[Union[str, os.PathLike]],
+    *,
+    max_workers: int = 8,
+    **kwargs: Union[None, int],
+) -> List[Union[BaseImage, Exception]]:
+    """Creates image instances from image files, concurrently.
+
+    Returns:
+        A list containing, for each path (in the same order), either an instance of
+        the automatically selected image render style (as returned by
+        :py:func:`auto_image_class`) or the exception raised while creating it.
+
+    Same arguments and raised exceptions as :py:meth:`BaseImage.from_files`.
+    """
+    return auto_image_class().from_files(filepaths, max_workers=max_workers, **kwargs)
+
+
 def from_url(
     url: str,
     **kwargs: Union[None, int],
@@ -98,5 +148,23 @@ def from_url(
     return auto_image_class().from_url(url, **kwargs)
 
 
+def from_urls(
+    urls: Iterable[str],
+    *,
+    max_workers: int = 8,
+    **kwargs: Union[None, int],
+) -> List[Union[BaseImage, Exception]]:
+    """Creates image instances from image URLs, concurrently.
+
+    Returns:
+        A list containing, for each URL (in the same order), either an instance of
+        the automatically selected image render style (as returned by
+        :py:func:`auto_image_class`) or the exception raised while creating it.
+
+    Same arguments and raised exceptions as :py:meth:`BaseImage.from_urls`.
+    """
+    return auto_image_class().from_urls(urls, max_workers=max_workers, **kwargs)
+
+
 # In order of preference, based on image quality and style performance/functionality
 _styles = (KittyImage, ITerm2Image, BlockImage)
@@ -4,27 +4,297 @@ __all__ = ("BlockImage",)
 
 import io
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor, wait
+from functools import lru_cache, partial
+from itertools import count, islice, product, repeat
 from math import ceil
 from operator import mul
-from typing import Optional, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 
 import PIL
 
-from .._ctlseqs import SGR_BG_DIRECT, SGR_DEFAULT, SGR_FG_DIRECT
-from ..utils import get_fg_bg_colors
+from .._ctlseqs import REP, SGRState, cursor_down, cursor_forward, cursor_up
+from .._scheduler import FrameScheduler
+from ..utils import get_fg_bg_colors, get_terminal_name_version
 from .common import TextImage
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None
+
+try:
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # pragma: no cover
+    SharedMemory = None
+
 LOWER_PIXEL = "\u2584"  # lower-half block element
 UPPER_PIXEL = "\u2580"  # upper-half block element
 
+# Render methods
+DIRECT = "direct"
+INDEXED = "indexed"
+
+# Terminal emulators known to support REP (repeat the preceding graphic character)
+REP_TERMINALS = {"contour", "foot", "kitty", "wezterm", "xterm"}
+
+# An RGB tuple (direct color) or a palette index (indexed color)
+Color = Union[Tuple[int, int, int], int]
+# A run of identical cells on a line: (upper_color, lower_color, upper_a, lower_a, n)
+Run = Tuple[Color, Color, int, int, int]
+
+
+class TerminalCapabilities(NamedTuple):
+    """The properties of the :term:`active terminal` on which the render output
+    depends.
+
+    Determined beforehand, such that render outputs can be produced without
+    querying the terminal e.g in other processes.
+    """
+
+    bg_color: Optional[Tuple[int, int, int]]
+    is_on_kitty: bool
+    rep_supported: bool
+
+
+# Levels of each component in the 6x6x6 colour cube of the xterm 256-color palette
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)
+
+# The xterm 256-color palette excluding the 16 system colours, which are usually
+# user-configurable: {index: RGB}
+INDEXED_PALETTE = {
+    **{
+        16 + 36 * r + 6 * g + b: (CUBE_LEVELS[r], CUBE_LEVELS[g], CUBE_LEVELS[b])
+        for r in range(6)
+        for g in range(6)
+        for b in range(6)
+    },
+    **{232 + n: (8 + 10 * n,) * 3 for n in range(24)},  # grayscale ramp
+}
+PALETTE_INDEX = {rgb: index for index, rgb in INDEXED_PALETTE.items()}
+
+LUT_BITS = 5  # Significant bits per colour component in the quantization LUT
+
 
 class BlockImage(TextImage):
-    """A render style using unicode half blocks and direct-color colour escape
-    sequences.
+    """A render style using unicode half blocks and direct-color or indexed-color
+    colour escape sequences.
 
     See :py:class:`TextImage` for the description of the constructor.
+
+    |
+
+    **Render Methods**
+
+    :py:class:`BlockImage` provides two methods of :term:`rendering` images, namely:
+
+    DIRECT (default)
+       Renders an image using direct-color (24-bit) colour escape sequences.
+
+       Pros:
+
+       * Colours are reproduced exactly.
+
+    INDEXED
+       Renders an image using indexed-color (256-color) colour escape sequences i.e
+       the colours of the image are quantized to the 240 fixed colours of the
+       xterm 256-color palette (the 16 system colours are excluded since they're
+       usually user-configurable).
+
+       Pros:
+
+       * Supported by terminal emulators (and multiplexers) that don't support
+         direct-color.
+       * Render results are more compact (i.e less in character count) than with
+         the **DIRECT** method, both due to the shorter escape sequences and since
+         quantized cells form longer runs.
+
+    The render method can be set with
+    :py:meth:`set_render_method() <BaseImage.set_render_method>` using the names
+    specified above.
+
+    |
+
+    **Style-Specific Render Parameters**
+
+    See :py:meth:`BaseImage.draw` (particularly the *style* parameter).
+
+    * **method** (*None | str*) → Render method override.
+
+      * ``None`` → the current effective render method of the instance is used.
+      * *default* → ``None``
+
+    * **delta** (*float | int*) → Damage threshold for delta rendering of animations.
+
+      * ``0.0`` → delta rendering is disabled i.e every frame is drawn in full
+      * ``0.0`` < *delta* <= ``1.0`` → only the cells that changed since the previous
+        frame are drawn, unless the fraction of changed cells is greater than
+        *delta*, in which case the frame is drawn in full
+      * *default* → ``0.0``
+      * Significantly reduces the amount of data written per frame for animations
+        wherein only small portions of the image change between frames.
+      * Applies only to animations drawn with :py:meth:`~BaseImage.draw`, hence, it
+        has no format specifier field.
+
+    * **tolerance** (*int*) → Colour difference tolerance for runs of cells.
+
+      * ``0`` <= *tolerance* <= ``255``
+      * ``0`` → only cells with identical colours form a run
+      * ``> 0`` → a cell joins the current run if the colours of its pixels differ
+        from those of the first cell of the run by at most *tolerance*, in which case
+        it takes the colours of the first cell
+      * *default* → ``0``
+      * The difference between two colours is a perceptual approximation (known as
+        "redmean"), on a scale of ``0`` to ``255``.
+      * Results in a trade-off between image quality and render output size/draw
+        speed, since fewer runs require fewer colour escape sequences. Particularly
+        useful for photographic images, in which adjacent pixels are rarely
+        identical.
+
+    * **compress** (*bool*) → Run-length compression.
+
+      * ``False`` → every cell is written out
+      * ``True`` → long runs of identical cells are written as a single cell followed
+        by a ``REP`` (repeat) control sequence, if the :term:`active terminal` is
+        known to support it. Otherwise, this has no effect.
+      * *default* → ``False``
+      * Significantly reduces the size of render outputs for images with large areas
+        of uniform colour.
+      * Only applicable to render outputs written directly to a terminal that
+        supports the sequence.
+
+    * **workers** (*int*) → Number of processes across which to render.
+
+      * ``0`` or ``1`` → the image is rendered in the current process
+      * ``> 1`` → the image is split into up to *workers* horizontal bands of lines,
+        which are rendered in parallel by a pool of *workers* processes
+      * *default* → ``0``
+      * Only worthwhile for very large renders (e.g wallpapers on high-resolution
+        terminals), since the pixel data must be passed to the other processes.
+      * Doesn't affect the render output, hence, it has no format specifier field.
+      * The pool of processes is started upon the first such render and reused by
+        subsequent renders with the same number of workers.
+
+    |
+
+    **Format Specification**
+
+    See :ref:`format-spec`.
+
+    ::
+
+        [ <method> ]  [ t <tolerance> ]  [ c <compress> ]
+
+    * ``method`` → render method override
+
+      * ``D`` → **DIRECT** render method (current frame only, for animated images)
+      * ``I`` → **INDEXED** render method (current frame only, for animated images)
+      * *default* → Current effective render method of the image
+
+    * ``t`` → colour difference tolerance
+
+      * ``tolerance`` → tolerance
+
+        * An integer in the range ``0`` <= ``tolerance`` <= ``255``
+        * ``0`` → only cells with identical colours form a run
+
+      * *default* → ``t0``
+      * e.g ``t0``, ``t8``, ``t255``
+      * results in a trade-off between image quality and render output size/draw
+        speed
+
+    * ``c`` → run-length compression
+
+      * ``compress`` → compression policy
+
+        * ``0`` → every cell is written out
+        * ``1`` → long runs of identical cells are compressed, if supported by the
+          active terminal
+
+      * *default* → ``c0``
+      * e.g ``c0``, ``c1``
+
+    |
+
+    TIP:
+        If `NumPy <https://numpy.org>`_ is installed, run boundaries are computed in
+        bulk, which is significantly faster for images with large areas of uniform
+        colour. The render output is the same either way.
     """
 
+    _FORMAT_SPEC: Tuple[re.Pattern] = tuple(
+        map(re.compile, r"[DI] t\d{1,3} c[01]".split(" "))
+    )
+    _render_methods: Set[str] = {DIRECT, INDEXED}
+    _default_render_method: str = DIRECT
+    _render_method: str = DIRECT
+    _rep_supported: Optional[bool] = None
+    _style_args = {
+        "method": (
+            None,
+            (
+                lambda x: isinstance(x, str),
+                "Render method must be a string",
+            ),
+            (
+                lambda x: x.lower() in __class__._render_methods,
+                "Unknown render method for 'block' render style",
+            ),
+        ),
+        "tolerance": (
+            0,
+            (
+                lambda x: isinstance(x, int) and not isinstance(x, bool),
+                "Colour difference tolerance must be an integer",
+            ),
+            (
+                lambda x: 0 <= x <= 255,
+                "Colour difference tolerance must be between 0 and 255, both "
+                "inclusive",
+            ),
+        ),
+        "compress": (
+            False,
+            (
+                lambda x: isinstance(x, bool),
+                "Compression policy must be a boolean",
+            ),
+            (lambda _: True, ""),
+        ),
+        "workers": (
+            0,
+            (
+                lambda x: isinstance(x, int) and not isinstance(x, bool),
+                "Number of workers must be an integer",
+            ),
+            (lambda x: x >= 0, "Number of workers must be non-negative"),
+        ),
+        "delta": (
+            0.0,
+            (
+                lambda x: isinstance(x, (int, float)) and not isinstance(x, bool),
+                "Damage threshold must be a number",
+            ),
+            (
+                lambda x: 0.0 <= x <= 1.0,
+                "Damage threshold must be between 0.0 and 1.0, both inclusive",
+            ),
+        ),
+    }
+
     @classmethod
     def is_supported(cls):
         if cls._supported is None:
@@ -36,9 +306,228 @@ class BlockImage(TextImage):
 
         return cls._supported
 
+    @classmethod
+    def _check_style_format_spec(cls, spec: str, original: str) -> Dict[str, Any]:
+        parent, (method, tolerance, compress) = cls._get_style_format_spec(
+            spec, original
+        )
+        args = {}
+        if parent:
+            args.update(super()._check_style_format_spec(parent, original))
+        if method:
+            args["method"] = DIRECT if method == "D" else INDEXED
+        if tolerance:
+            args["tolerance"] = int(tolerance[1:])
+        if compress:
+            args["compress"] = bool(int(compress[-1]))
+
+        return cls._check_style_args(args)
+
+    def _display_animated(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        fmt: Tuple[Union[None, str, int]],
+        repeat: int,
+        cached: Union[bool, int],
+        *,
+        frame_skip: int = 0,
+        method: Optional[str] = None,
+        tolerance: int = 0,
+        compress: bool = False,
+        delta: float = 0.0,
+        **style_args: Any,
+    ) -> None:
+        """See :py:meth:`BaseImage._display_animated`.
+
+        With *delta*, each frame is compared (cell-wise) with the previous one and only
+        the changed spans of cells are drawn, unless the fraction of changed cells is
+        greater than *delta*.
+        """
+        if not delta:
+            super()._display_animated(
+                img,
+                alpha,
+                fmt,
+                repeat,
+                cached,
+                frame_skip=frame_skip,
+                method=method,
+                tolerance=tolerance,
+                compress=compress,
+                **style_args,
+            )
+            return
+
+        h_align, width, v_align, height = fmt
+        cols, lines = self.rendered_size
+        left = (
+            0
+            if width <= cols or h_align == "<"
+            else width - cols if h_align == ">" else (width - cols) // 2
+        )
+        top = (
+            0
+            if height <= lines or v_align == "^"
+            else height - lines if v_align == "_" else (height - lines) // 2
+        )
+        indexed = (method or self._render_method).lower() == INDEXED
+        capabilities = self._get_capabilities()
+        to_first_line = "\r" + cursor_up(max(height, lines) - 1)
+        to_last_line = "\r" + cursor_down(max(height, lines) - 1)
+        prev_seek_pos = self._seek_position
+        duration = int(self._frame_duration * 10**9)
+        n_frames = self.n_frames
+        scheduler = FrameScheduler(frame_skip)
+
+        try:
+            prev_runs = self._get_runs(
+                img, alpha, frame=True, indexed=indexed, tolerance=tolerance
+            )
+            scheduler.start(duration)
+            print(
+                self._format_render(
+                    self._write_runs(prev_runs, compress=compress), *fmt
+                ),
+                end="",
+                flush=True,
+            )  # First frame
+            n = 1
+            while repeat:
+                while n < n_frames:
+                    # Late frames are dropped before they're rendered
+                    if scheduler.skip(duration):
+                        n += 1
+                        continue
+
+                    self._seek_position = n
+                    runs = self._get_runs(
+                        img, alpha, frame=True, indexed=indexed, tolerance=tolerance
+                    )
+                    output = _write_damage(
+                        prev_runs,
+                        runs,
+                        delta,
+                        top,
+                        left,
+                        partial(
+                            _get_run_writer,
+                            capabilities=capabilities,
+                            compress=compress,
+                        ),
+                    )
+                    if output is None:
+                        output = self._format_render(
+                            self._write_runs(runs, compress=compress), *fmt
+                        )
+                    else:
+                        output += to_last_line
+                    # The damage is computed against the last drawn frame
+                    if scheduler.wait(duration):
+                        print(to_first_line, output, sep="", end="", flush=True)
+                        prev_runs = runs
+                    n += 1
+
+                n = 0
+                if repeat > 0:  # Avoid infinitely large negative numbers
+                    repeat -= 1
+        except KeyboardInterrupt:
+            self._handle_interrupted_draw()
+        except Exception:
+            self._handle_interrupted_draw()
+            raise
+        finally:
+            self._dropped_frames = scheduler.dropped
+            self._close_image(img)
+            self._seek_position = prev_seek_pos
+            # Move the cursor to the last line of the image to prevent "overlaid"
+            # output in the terminal
+            print(cursor_down(max(height, lines)), end="")
+
+    @classmethod
+    def _get_capabilities(cls) -> TerminalCapabilities:
+        """Returns the properties of the active terminal required to render."""
+        return TerminalCapabilities(
+            get_fg_bg_colors()[1], cls._is_on_kitty(), cls._is_rep_supported()
+        )
+
+    def _get_render_cache_params(self) -> Tuple[Any, ...]:
+        return (*super()._get_render_cache_params(), self._get_capabilities())
+
     def _get_render_size(self) -> Tuple[int, int]:
         return tuple(map(mul, self.rendered_size, (1, 2)))
 
+    def _get_runs(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        *,
+        frame: bool = False,
+        indexed: bool = False,
+        tolerance: int = 0,
+    ) -> List[List[Run]]:
+        """Returns the runs of identical cells on every line of the render.
+
+        See :py:meth:`_iter_runs`.
+        """
+        return list(
+            self._iter_runs(
+                img, alpha, frame=frame, indexed=indexed, tolerance=tolerance
+            )
+        )
+
+    @classmethod
+    def _is_rep_supported(cls) -> bool:
+        """Returns ``True`` if the active terminal is known to support ``REP``."""
+        if cls._rep_supported is None:
+            cls._rep_supported = get_terminal_name_version()[0] in REP_TERMINALS
+
+        return cls._rep_supported
+
+    def _iter_runs(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        *,
+        frame: bool = False,
+        indexed: bool = False,
+        tolerance: int = 0,
+    ) -> Iterator[List[Run]]:
+        """Returns an iterator which yields the runs of identical cells on each line
+        of the render, one line at a time.
+
+        Each run is a tuple ``(upper_color, lower_color, upper_a, lower_a, length)``
+        where ``upper_a`` and ``lower_a`` are ``0`` (transparent) or ``255`` (opaque).
+        The colours are RGB tuples or, if *indexed* is ``True``, indexes into
+        the xterm 256-color palette.
+
+        With a non-zero *tolerance*, a cell belongs to the current run if the colours
+        of its pixels differ from those of the first cell of the run by at most
+        *tolerance*, in which case the colours of the first cell represent the run.
+
+        See :py:meth:`_render_lines` for the description of the other parameters.
+        """
+        frame_img = img if frame else None
+        img, rgb, a = self._get_render_data(
+            img, alpha, round_alpha=True, frame=frame, buffer=bool(numpy)
+        )
+        alpha = img.mode == "RGBA"
+
+        # clean up (ImageIterator uses one PIL image throughout)
+        if frame_img is not img:
+            self._close_image(img)
+
+        if numpy:
+            return _iter_array_runs(
+                numpy.frombuffer(rgb.data, numpy.uint8).reshape(
+                    rgb.size[1], rgb.size[0], rgb.bands
+                ),
+                indexed,
+                tolerance,
+            )
+
+        return _iter_list_runs(rgb, a, img.size[0], alpha, indexed, tolerance)
+
     @staticmethod
     def _pixels_cols(
         *, pixels: Optional[int] = None, cols: Optional[int] = None
@@ -52,125 +541,789 @@ class BlockImage(TextImage):
         return ceil(pixels / 2) if pixels is not None else lines * 2
 
     def _render_image(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        **kwargs: Any,
+    ) -> str:
+        return "".join(self._render_lines(img, alpha, **kwargs))
+
+    def _render_lines(
         self,
         img: PIL.Image.Image,
         alpha: Union[None, float, str],
         *,
         frame: bool = False,
         split_cells: bool = False,
-    ) -> str:
-        # NOTE:
-        # It's more efficient to write separate strings to the buffer separately
-        # than concatenate and write together.
-
-        def update_buffer():
-            if alpha:
-                no_alpha = False
-                if a_cluster1 == 0 == a_cluster2:
-                    buf_write(SGR_DEFAULT)
-                    buf_write(blank * n)
-                elif a_cluster1 == 0:  # up is transparent
-                    buf_write(SGR_DEFAULT)
-                    buf_write(SGR_FG_DIRECT % cluster2)
-                    buf_write(lower_pixel * n)
-                elif a_cluster2 == 0:  # down is transparent
-                    buf_write(SGR_DEFAULT)
-                    buf_write(SGR_FG_DIRECT % cluster1)
-                    buf_write(upper_pixel * n)
-                else:
-                    no_alpha = True
+        method: Optional[str] = None,
+        tolerance: int = 0,
+        compress: bool = False,
+        workers: int = 0,
+        delta: float = 0.0,  # Only used by `_display_animated()`
+    ) -> Iterator[str]:
+        indexed = (method or self._render_method).lower() == INDEXED
+        if workers > 1 and SharedMemory:
+            return self._render_bands(
+                img,
+                alpha,
+                workers,
+                frame=frame,
+                split_cells=split_cells,
+                indexed=indexed,
+                tolerance=tolerance,
+                compress=compress,
+            )
 
-            if not alpha or no_alpha:
-                r, g, b = cluster2
-                # Kitty does not render BG colors equal to the default BG color
-                if is_on_kitty and cluster2 == bg_color:
-                    r += r < 255 or -1
-                buf_write(SGR_BG_DIRECT % (r, g, b))
-                if cluster1 == cluster2:
-                    buf_write(blank * n)
-                else:
-                    buf_write(SGR_FG_DIRECT % cluster1)
-                    buf_write(upper_pixel * n)
-
-        buffer = io.StringIO()
-        buf_write = buffer.write  # Eliminate attribute resolution cost
-
-        bg_color = get_fg_bg_colors()[1]
-        is_on_kitty = self._is_on_kitty()
-        if split_cells:
-            blank = " \0"
-            lower_pixel = LOWER_PIXEL + "\0"
-            upper_pixel = UPPER_PIXEL + "\0"
-        else:
-            blank = " "
-            lower_pixel = LOWER_PIXEL
-            upper_pixel = UPPER_PIXEL
-        end_of_line = SGR_DEFAULT + "\n"
+        return _iter_lines(
+            self._iter_runs(
+                img, alpha, frame=frame, indexed=indexed, tolerance=tolerance
+            ),
+            self._get_capabilities(),
+            compress=compress,
+            split_cells=split_cells,
+        )
+
+    def _render_bands(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        workers: int,
+        *,
+        frame: bool = False,
+        split_cells: bool = False,
+        indexed: bool = False,
+        tolerance: int = 0,
+        compress: bool = False,
+    ) -> Iterator[str]:
+        """Renders horizontal bands of lines of an image in parallel, using a pool of
+        *workers* processes.
 
-        width, height = self._get_render_size()
+        Yields:
+            The output of each band, in order, as soon as it's ready, with the
+            newline between consecutive bands yielded separately.
+
+        The pixel data is shared with the workers via shared memory and the
+        properties of the active terminal are passed to them, such that no worker
+        queries the terminal.
+
+        See :py:meth:`_render_lines` for the description of the other parameters.
+        """
         frame_img = img if frame else None
-        img, rgb, a = self._get_render_data(img, alpha, round_alpha=True, frame=frame)
-        alpha = img.mode == "RGBA"
+        img, pixels, _ = self._get_render_data(
+            img, alpha, round_alpha=True, frame=frame, buffer=True
+        )
 
         # clean up (ImageIterator uses one PIL image throughout)
         if frame_img is not img:
             self._close_image(img)
 
-        rgb_pairs = (
-            (
-                zip(rgb[x : x + width], rgb[x + width : x + width * 2]),
-                (rgb[x], rgb[x + width]),
-            )
-            for x in range(0, len(rgb), width * 2)
-        )
-        a_pairs = (
-            (
-                zip(a[x : x + width], a[x + width : x + width * 2]),
-                (a[x], a[x + width]),
+        n_lines = pixels.size[1] // 2
+        n_bands = min(workers, n_lines)
+        width, bands = pixels.size[0], pixels.bands
+        line_size = pixels.stride * 2
+        # The bands differ in size by at most one line
+        bounds = [n_lines * band // n_bands * line_size for band in range(n_bands + 1)]
+        capabilities = self._get_capabilities()
+        futures = []
+
+        shared_memory = SharedMemory(create=True, size=len(pixels.data))
+        try:
+            shared_memory.buf[: len(pixels.data)] = pixels.data
+            del pixels
+            executor = _get_executor(workers)
+            for start, end in zip(bounds, bounds[1:]):
+                futures.append(
+                    executor.submit(
+                        _render_band,
+                        shared_memory.name,
+                        slice(start, end),
+                        width,
+                        bands,
+                        capabilities,
+                        indexed=indexed,
+                        tolerance=tolerance,
+                        compress=compress,
+                        split_cells=split_cells,
+                    )
+                )
+
+            yield futures[0].result()
+            for future in futures[1:]:
+                yield "\n"
+                yield future.result()
+        finally:
+            # The shared memory must outlive its use by the workers
+            for future in futures:
+                future.cancel()
+            wait(futures)
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def _write_runs(
+        self,
+        lines: List[List[Run]],
+        *,
+        compress: bool = False,
+        split_cells: bool = False,
+    ) -> str:
+        """Converts the runs of cells on every line of a render into the render
+        output.
+
+        See :py:func:`_iter_lines`.
+        """
+        return "".join(
+            _iter_lines(
+                lines,
+                self._get_capabilities(),
+                compress=compress,
+                split_cells=split_cells,
             )
-            for x in range(0, len(a), width * 2)
         )
 
-        row_no = 0
-        # Two rows of pixels per line
-        for (rgb_pair, (cluster1, cluster2)), (a_pair, (a_cluster1, a_cluster2)) in zip(
-            rgb_pairs, a_pairs
+
+# The squared redmean colour difference, multiplied by ``512`` (to eliminate
+# fractions), of a (scaled) colour difference of ``1``
+_COLOR_DIFF_SCALE = 512 * 3**2
+
+# The pool of processes for parallel renders, with its number of workers
+_executor: Optional[Tuple[int, ProcessPoolExecutor]] = None
+
+# The minimum length of a run of a cell for which ``REP`` is shorter than the run
+_MIN_REP_RUN = {
+    cell: next(
+        n
+        for n in count(2)
+        if len((cell * n).encode()) > len((cell + REP % (n - 1)).encode())
+    )
+    for cell in (" ", LOWER_PIXEL, UPPER_PIXEL)
+}
+
+
+def _index_line(line: List[Run]) -> List[Run]:
+    """Replaces the (palette) RGB colours in the runs on a line with their palette
+    indexes.
+    """
+    index = PALETTE_INDEX
+
+    return [(index[upper], index[lower], a1, a2, n) for upper, lower, a1, a2, n in line]
+
+
+@lru_cache(maxsize=None)
+def _get_indexed_lut() -> bytes:
+    """Returns the lookup table for quantizing colours to :py:data:`INDEXED_PALETTE`.
+
+    The table is a flattened 3D array with :py:data:`LUT_BITS` significant bits of
+    each (red, green, blue) component as the indexes (in that order), mapping to the
+    index of the nearest (by euclidean distance) palette colour.
+
+    The table is built only once per process.
+    """
+    # Only the nearest colour in the cube and the nearest gray need to be compared,
+    # both of which can be found directly.
+    nearest_level = [
+        min(range(6), key=lambda i: abs(CUBE_LEVELS[i] - x)) for x in range(256)
+    ]
+    step = 1 << (8 - LUT_BITS)
+    components = range(step // 2, 256, step)  # The centre of each bucket
+    lut = bytearray()
+    for r, g, b in product(components, components, components):
+        r_i, g_i, b_i = nearest_level[r], nearest_level[g], nearest_level[b]
+        cube_r, cube_g, cube_b = CUBE_LEVELS[r_i], CUBE_LEVELS[g_i], CUBE_LEVELS[b_i]
+        gray_i = min(23, max(0, round(((r + g + b) / 3 - 8) / 10)))
+        gray = 8 + 10 * gray_i
+        if (r - cube_r) ** 2 + (g - cube_g) ** 2 + (b - cube_b) ** 2 <= (
+            (r - gray) ** 2 + (g - gray) ** 2 + (b - gray) ** 2
         ):
-            row_no += 2
-            n = 0
-            for (px1, px2), (a1, a2) in zip(rgb_pair, a_pair):
-                # Color-code characters and write to buffer
-                # when upper and/or lower pixel color/alpha-level changes
-                if not (alpha and a1 == a_cluster1 == 0 == a_cluster2 == a2) and (
-                    px1 != cluster1
-                    or px2 != cluster2
-                    or alpha
-                    and (
-                        # From non-transparent to transparent
-                        a_cluster1 != a1 == 0
-                        or a_cluster2 != a2 == 0
-                        # From transparent to non-transparent
-                        or 0 == a_cluster1 != a1
-                        or 0 == a_cluster2 != a2
-                    )
-                ):
-                    update_buffer()
-                    cluster1 = px1
-                    cluster2 = px2
-                    if alpha:
-                        a_cluster1 = a1
-                        a_cluster2 = a2
-                    n = 0
-                n += 1
-
-            update_buffer()  # Rest of the line
+            lut.append(16 + 36 * r_i + 6 * g_i + b_i)
+        else:
+            lut.append(232 + gray_i)
+
+    return bytes(lut)
+
+
+def _quantize(rgb: List[Tuple[int, int, int]]) -> List[Tuple[int, int, int]]:
+    """Quantizes colours to :py:data:`INDEXED_PALETTE`.
+
+    Returns:
+        The palette colours.
+    """
+    lut = _get_indexed_lut()
+    palette = INDEXED_PALETTE
+    shift = 8 - LUT_BITS
+    r_shift = LUT_BITS * 2
+    g_shift = LUT_BITS
+
+    return [
+        palette[lut[(r >> shift << r_shift) | (g >> shift << g_shift) | b >> shift]]
+        for r, g, b in rgb
+    ]
+
+
+def _quantize_array(pixels: numpy.ndarray) -> numpy.ndarray:
+    """Quantizes the colours of an array of pixels to :py:data:`INDEXED_PALETTE`.
+
+    Args:
+        pixels: Pixel data of shape ``(..., 3 or 4)``.
+
+    Returns:
+        A copy of *pixels* with the colours replaced by the palette colours.
+    """
+    size = 1 << LUT_BITS
+    lut = numpy.frombuffer(_get_indexed_lut(), numpy.uint8).reshape(size, size, size)
+    palette = numpy.zeros((256, 3), numpy.uint8)
+    palette[list(INDEXED_PALETTE)] = list(INDEXED_PALETTE.values())
+    components = pixels[..., :3] >> (8 - LUT_BITS)
+
+    quantized = pixels.copy()
+    quantized[..., :3] = palette[
+        lut[components[..., 0], components[..., 1], components[..., 2]]
+    ]
+
+    return quantized
+
+
+def _get_run_writer(
+    buf_write: Callable[[str], Any],
+    sgr: SGRState,
+    capabilities: TerminalCapabilities,
+    *,
+    compress: bool = False,
+    split_cells: bool = False,
+) -> Callable[[Color, Color, int, int, int], None]:
+    """Returns a function which writes a run of cells via *buf_write*.
+
+    The returned function accepts the items of a run (see
+    :py:meth:`BlockImage._iter_runs`) as positional arguments. Colours are set via
+    *sgr*, hence only the colours that change between runs are written.
+
+    If *compress* is ``True`` and the terminal supports ``REP``, runs are
+    compressed wherever that's shorter. Ignored if *split_cells* is ``True``.
+    """
+    # NOTE:
+    # It's more efficient to write separate strings to the buffer separately
+    # than concatenate and write together.
+
+    def write_run(cluster1, cluster2, a_cluster1, a_cluster2, n):
+        # The FG color of a blank cell is irrelevant
+        if a_cluster1 == 0 == a_cluster2:
+            buf_write(set_bg(None))
+            buf_write(cells(blank, n))
+        elif a_cluster1 == 0:  # up is transparent
+            buf_write(set_fg_bg(cluster2, None))
+            buf_write(cells(lower_pixel, n))
+        elif a_cluster2 == 0:  # down is transparent
+            buf_write(set_fg_bg(cluster1, None))
+            buf_write(cells(upper_pixel, n))
+        else:
+            bg = cluster2
+            # Kitty does not render BG colors equal to the default BG color
+            # (never the case for indexed colors)
+            if is_on_kitty and cluster2 == bg_color:
+                r, g, b = cluster2
+                bg = (r + (r < 255 or -1), g, b)
+            if cluster1 == cluster2:
+                buf_write(set_bg(bg))
+                buf_write(cells(blank, n))
+            else:
+                buf_write(set_fg_bg(cluster1, bg))
+                buf_write(cells(upper_pixel, n))
+
+    def compressed_cells(cell, n):
+        return cell + REP % (n - 1) if n >= min_rep_run[cell] else cell * n
+
+    if split_cells:
+        # Every run should be self-contained, since the cells of a line may be
+        # trimmed and written separately e.g by `UrwidImageCanvas`
+
+        def set_bg(bg):
+            sgr.invalidate()
+            return sgr.set_bg(bg)
+
+        def set_fg_bg(fg, bg):
+            sgr.invalidate()
+            return sgr.set(fg, bg)
+
+    else:
+        set_bg = sgr.set_bg
+        set_fg_bg = sgr.set
+    bg_color, is_on_kitty, rep_supported = capabilities
+    if split_cells:
+        blank = " \0"
+        lower_pixel = LOWER_PIXEL + "\0"
+        upper_pixel = UPPER_PIXEL + "\0"
+    else:
+        blank = " "
+        lower_pixel = LOWER_PIXEL
+        upper_pixel = UPPER_PIXEL
+    if compress and not split_cells and rep_supported:
+        cells = compressed_cells
+        min_rep_run = _MIN_REP_RUN
+    else:
+        cells = mul
+
+    return write_run
+
+
+def _iter_lines(
+    lines: Iterable[List[Run]],
+    capabilities: TerminalCapabilities,
+    *,
+    compress: bool = False,
+    split_cells: bool = False,
+) -> Iterator[str]:
+    """Converts the runs of cells on every line of a render into the render
+    output, line by line.
+
+    Yields:
+        The output of each line, preceded by a newline for all but the first line.
+
+    See :py:meth:`BlockImage._iter_runs` and :py:func:`_get_run_writer`.
+    """
+    buffer = io.StringIO()
+    buf_write = buffer.write  # Eliminate attribute resolution cost
+    sgr = SGRState()
+    write_run = _get_run_writer(
+        buf_write, sgr, capabilities, compress=compress, split_cells=split_cells
+    )
+    newline = ""
+
+    with buffer:
+        for line in lines:
+            buffer.seek(0)
+            buffer.truncate()
+            buf_write(newline)
+            # A line may be written independently of the preceding output
+            sgr.invalidate()
+            for run in line:
+                write_run(*run)
             if split_cells:
                 # Set the last "\0" to be overwritten by the next byte
                 buffer.seek(buffer.tell() - 1)
-            if row_no < height:  # last line not yet rendered
-                buf_write(end_of_line)
+            # Every line ends with the default colors, such that lines can be
+            # written independently e.g padded
+            buf_write(sgr.reset())
+            buffer.truncate()
+            yield buffer.getvalue()
+            newline = "\n"
+
+
+def _get_executor(workers: int) -> ProcessPoolExecutor:
+    """Returns the pool of processes for parallel renders.
+
+    The pool is replaced if it has a different number of workers.
+    """
+    global _executor
+
+    if not _executor or _executor[0] != workers:
+        if _executor:
+            _executor[1].shutdown(wait=False, cancel_futures=True)
+        _executor = (workers, ProcessPoolExecutor(workers))
+
+    return _executor[1]
+
+
+def _iter_array_runs(
+    pixels: numpy.ndarray, indexed: bool = False, tolerance: int = 0
+) -> Iterator[List[Run]]:
+    """Vectorized form of :py:func:`_iter_list_runs`.
+
+    Args:
+        pixels: See :py:func:`_find_runs`.
+
+    See :py:meth:`BlockImage._iter_runs` for the description of the other parameters.
+    """
+    runs_per_line, runs = _find_runs(
+        _quantize_array(pixels) if indexed else pixels, tolerance
+    )
+    lines = (list(islice(runs, n_runs)) for n_runs in runs_per_line)
+
+    return map(_index_line, lines) if indexed else lines
+
+
+def _iter_list_runs(
+    rgb: List[Tuple[int, int, int]],
+    a: List[int],
+    width: int,
+    alpha: bool,
+    indexed: bool = False,
+    tolerance: int = 0,
+) -> Iterator[List[Run]]:
+    """Finds the runs of identical cells on each line of a render, one line at a
+    time, from per-pixel data (as returned by
+    :py:meth:`~term_image.image.BaseImage._get_render_data`).
+
+    Args:
+        width: The width of the image, in pixels.
+        alpha: Whether the image has transparency.
+
+    See :py:meth:`BlockImage._iter_runs` for the description of the other parameters.
+    """
+    if indexed:
+        rgb = _quantize(rgb)
+    colors_differ = _colors_differ
+    rgb_pairs = (
+        (
+            zip(rgb[x : x + width], rgb[x + width : x + width * 2]),
+            (rgb[x], rgb[x + width]),
+        )
+        for x in range(0, len(rgb), width * 2)
+    )
+    a_pairs = (
+        (
+            zip(a[x : x + width], a[x + width : x + width * 2]),
+            (a[x], a[x + width]),
+        )
+        for x in range(0, len(a), width * 2)
+    )
+
+    # Two rows of pixels per line
+    for (rgb_pair, (cluster1, cluster2)), (a_pair, (a_cluster1, a_cluster2)) in zip(
+        rgb_pairs, a_pairs
+    ):
+        line = []
+        n = 0
+        for (px1, px2), (a1, a2) in zip(rgb_pair, a_pair):
+            # End the current run when upper and/or lower pixel color/alpha-level
+            # changes
+            if not (alpha and a1 == a_cluster1 == 0 == a_cluster2 == a2) and (
+                (px1 != cluster1 or px2 != cluster2)
+                and (
+                    not tolerance
+                    or colors_differ(px1, cluster1, tolerance)
+                    or colors_differ(px2, cluster2, tolerance)
+                )
+                or alpha
+                and (
+                    # From non-transparent to transparent
+                    a_cluster1 != a1 == 0
+                    or a_cluster2 != a2 == 0
+                    # From transparent to non-transparent
+                    or 0 == a_cluster1 != a1
+                    or 0 == a_cluster2 != a2
+                )
+            ):
+                line.append((cluster1, cluster2, a_cluster1, a_cluster2, n))
+                cluster1 = px1
+                cluster2 = px2
+                if alpha:
+                    a_cluster1 = a1
+                    a_cluster2 = a2
+                n = 0
+            n += 1
+
+        line.append((cluster1, cluster2, a_cluster1, a_cluster2, n))  # Rest of line
+        yield _index_line(line) if indexed else line
+
+
+def _render_band(
+    name: str,
+    span: slice,
+    width: int,
+    bands: int,
+    capabilities: TerminalCapabilities,
+    *,
+    indexed: bool = False,
+    tolerance: int = 0,
+    compress: bool = False,
+    split_cells: bool = False,
+) -> str:
+    """Renders a horizontal band of lines of an image, in a worker process.
+
+    Args:
+        name: The name of the shared memory block holding the pixel data, as
+          returned by :py:meth:`~term_image.image.BaseImage._get_render_data` in
+          buffer mode.
+        span: The span of the pixel data (in bytes) covered by the band.
+        width: The width of the image, in pixels.
+        bands: The number of bands (channels) of the image.
+        capabilities: The properties of the active terminal.
+
+    Returns:
+        The render output of the band.
+
+    See :py:meth:`BlockImage._render_lines` for the description of the other
+    parameters.
+    """
+
+    shared_memory = SharedMemory(name)
+    try:
+        with shared_memory.buf[span] as view:
+            data = bytes(view)
+    finally:
+        shared_memory.close()
+
+    if numpy:
+        lines = _iter_array_runs(
+            numpy.frombuffer(data, numpy.uint8).reshape(-1, width, bands),
+            indexed,
+            tolerance,
+        )
+    else:
+        rgb = list(zip(data[::bands], data[1::bands], data[2::bands]))
+        a = list(data[3::4]) if bands == 4 else [255] * len(rgb)
+        lines = _iter_list_runs(rgb, a, width, bands == 4, indexed, tolerance)
+
+    return "".join(
+        _iter_lines(lines, capabilities, compress=compress, split_cells=split_cells)
+    )
+
+
+def _find_runs(
+    pixels: numpy.ndarray, tolerance: int = 0
+) -> Tuple[List[int], Iterator[Run]]:
+    """Finds the runs of identical cells on every line of a render.
+
+    Args:
+        pixels: Pixel data of shape ``(height, width, 3 or 4)``, where *height* is
+          even and the alpha channel, if present, is bi-level (``0`` or ``255``).
+        tolerance: Colour difference tolerance (see :py:func:`_colors_differ`).
+
+    Returns:
+        The number of runs on each line and an iterator of
+        ``(upper_rgb, lower_rgb, upper_a, lower_a, length)`` tuples (one per run, in
+        line-major order).
+
+    The boundaries are exactly those found by the pure-Python loop in
+    :py:meth:`BlockImage._get_runs` i.e a new run starts wherever any pixel colour
+    or alpha level of a cell differs from that of the previous cell, except within
+    fully transparent spans (cells whose both pixels are transparent), the colours of
+    which are irrelevant.
+    With a non-zero *tolerance*, pixel colours are compared with those of the first
+    cell of the current run instead, in the same manner as the pure-Python loop.
+    """
+    height, width = pixels.shape[:2]
+    n_lines = height // 2
+    lines = pixels.reshape(n_lines, 2, width, -1)
+    upper, lower = lines[:, 0, :, :3], lines[:, 1, :, :3]
+    has_alpha = pixels.shape[2] == 4
+    opaque = lines[..., 3] != 0 if has_alpha else None
+
+    if tolerance:
+        is_start = _find_tolerant_starts(upper, lower, opaque, tolerance)
+    else:
+        changed = (upper[:, 1:] != upper[:, :-1]).any(2)
+        changed |= (lower[:, 1:] != lower[:, :-1]).any(2)
+        if has_alpha:
+            changed |= (opaque[..., 1:] != opaque[..., :-1]).any(1)
+            transparent = ~opaque.any(1)
+            changed &= ~(transparent[:, 1:] & transparent[:, :-1])
+
+        is_start = numpy.ones((n_lines, width), bool)
+        is_start[:, 1:] = changed
+
+    starts = is_start.ravel().nonzero()[0]
+    # The first cell of every line is always a start, so the end of the last run on
+    # a line is the start of the first run on the next
+    lengths = numpy.diff(starts, append=n_lines * width)
+    line_nos, cols = divmod(starts, width)
+
+    if has_alpha:
+        upper_a = lines[line_nos, 0, cols, 3].tolist()
+        lower_a = lines[line_nos, 1, cols, 3].tolist()
+    else:
+        upper_a = lower_a = repeat(255)
+
+    return (
+        numpy.bincount(line_nos, minlength=n_lines).tolist(),
+        zip(
+            map(tuple, upper[line_nos, cols].tolist()),
+            map(tuple, lower[line_nos, cols].tolist()),
+            upper_a,
+            lower_a,
+            lengths.tolist(),
+        ),
+    )
+
+
+def _find_tolerant_starts(
+    upper: numpy.ndarray,
+    lower: numpy.ndarray,
+    opaque: Optional[numpy.ndarray],
+    tolerance: int,
+) -> numpy.ndarray:
+    """Finds the cells at which runs start, when colours are compared with a
+    tolerance.
+
+    Args:
+        upper: The colours of the upper pixels, of shape ``(lines, width, 3)``.
+        lower: The colours of the lower pixels, of shape ``(lines, width, 3)``.
+        opaque: The opacity of the pixels, of shape ``(lines, 2, width)``, if the
+          pixels have an alpha channel.
+        tolerance: See :py:func:`_colors_differ`.
+
+    Returns:
+        A boolean array of shape ``(lines, width)``.
+
+    Since whether a cell starts a new run depends on the first cell of the current
+    run, the columns are processed one after the other, though all lines at once.
+    """
+    n_lines, width = upper.shape[:2]
+    upper = upper.astype(numpy.int64)
+    lower = lower.astype(numpy.int64)
+    limit = _COLOR_DIFF_SCALE * tolerance**2
+
+    is_start = numpy.ones((n_lines, width), bool)
+    run_upper, run_lower = upper[:, 0], lower[:, 0]
+    if opaque is not None:
+        run_opaque = opaque[..., 0]
+    for col in range(1, width):
+        col_upper, col_lower = upper[:, col], lower[:, col]
+        start = _color_diff_array(col_upper, run_upper) > limit
+        start |= _color_diff_array(col_lower, run_lower) > limit
+        if opaque is not None:
+            col_opaque = opaque[..., col]
+            start |= (col_opaque != run_opaque).any(1)
+            start &= col_opaque.any(1) | run_opaque.any(1)
+            run_opaque = numpy.where(start[:, None], col_opaque, run_opaque)
+        is_start[:, col] = start
+        run_upper = numpy.where(start[:, None], col_upper, run_upper)
+        run_lower = numpy.where(start[:, None], col_lower, run_lower)
+
+    return is_start
+
+
+def _color_diff_array(colors1: numpy.ndarray, colors2: numpy.ndarray) -> numpy.ndarray:
+    """Vectorized form of the squared difference computed by
+    :py:func:`_colors_differ`.
+
+    Args:
+        colors1: Integer array of shape ``(..., 3)``.
+        colors2: Integer array of shape ``(..., 3)``.
+    """
+    r_sum = colors1[..., 0] + colors2[..., 0]
+    delta = (colors1 - colors2) ** 2
+
+    return (
+        (1024 + r_sum) * delta[..., 0]
+        + 2048 * delta[..., 1]
+        + (1534 - r_sum) * delta[..., 2]
+    )
+
+
+def _colors_differ(
+    color1: Tuple[int, int, int], color2: Tuple[int, int, int], tolerance: int
+) -> bool:
+    """Compares two colours with a tolerance.
+
+    Returns:
+        ``True`` if the difference between the colours is greater than *tolerance*.
+
+    The difference is the "redmean" approximation of perceptual colour difference,
+    scaled down by a factor of ``3``, such that it ranges from ``0`` to ``255``.
+    """
+    r1, g1, b1 = color1
+    r2, g2, b2 = color2
+    r_sum = r1 + r2
+
+    # Integer arithmetic is used to ensure identical results with
+    # `_color_diff_array()`.
+    return (1024 + r_sum) * (r1 - r2) ** 2 + 2048 * (g1 - g2) ** 2 + (1534 - r_sum) * (
+        b1 - b2
+    ) ** 2 > _COLOR_DIFF_SCALE * tolerance**2
+
+
+def _get_damage(old: List[Run], new: List[Run]) -> Tuple[List[Tuple[int, list]], int]:
+    """Compares the runs of cells on the same line of two renders.
+
+    Returns:
+        A list of ``(column, runs)`` tuples, where *runs* is the runs of *new* that
+        cover a span of changed cells starting from *column*, and the number of
+        changed cells.
+
+    Fully transparent cells are considered equal, regardless of their colours.
+    """
+    spans = []
+    damage = 0
+    old_runs = iter(old)
+    old_run = next(old_runs)
+    old_end = old_run[4]
+    span_end = -1
+    pos = 0
+    for run in new:
+        end = pos + run[4]
+        fully_transparent = run[2] == 0 == run[3]
+        while pos < end:
+            while old_end <= pos:
+                old_run = next(old_runs)
+                old_end += old_run[4]
+            segment_end = min(end, old_end)
+            if old_run[:4] != run[:4] and not (
+                fully_transparent and old_run[2] == 0 == old_run[3]
+            ):
+                n = segment_end - pos
+                if pos == span_end:
+                    span_runs = spans[-1][1]
+                    if span_runs[-1][:4] == run[:4]:
+                        span_runs[-1] = (*run[:4], span_runs[-1][4] + n)
+                    else:
+                        span_runs.append((*run[:4], n))
+                else:
+                    spans.append((pos, [(*run[:4], n)]))
+                span_end = segment_end
+                damage += n
+            pos = segment_end
+
+    return spans, damage
+
+
+def _write_damage(
+    old: List[List[Run]],
+    new: List[List[Run]],
+    threshold: float,
+    top: int,
+    left: int,
+    get_run_writer: Callable[..., Callable[..., None]],
+) -> Optional[str]:
+    """Returns the output required to update a drawn render to another.
+
+    Args:
+        old: The runs of the drawn render.
+        new: The runs of the new render.
+        threshold: The maximum fraction of changed cells.
+        top: The line (within the drawn output) on which the render begins.
+        left: The column (within the drawn output) at which the render begins.
+        get_run_writer: Called with *buf_write* and *sgr* as in
+          :py:func:`_get_run_writer`, it returns a run writer.
+
+    Returns:
+        ``None`` if the renders differ in size or the fraction of changed cells is
+        greater than *threshold*. Otherwise, the output to draw only the changed spans
+        of cells, assuming the cursor is at the beginning of the first line of the
+        drawn output.
+    """
+    width = sum(run[4] for run in new[0])
+    if len(old) != len(new) or sum(run[4] for run in old[0]) != width:
+        return None
+
+    damaged_lines = []
+    total_damage = 0
+    n_cells = width * len(new)
+    for line_no, (old_line, new_line) in enumerate(zip(old, new)):
+        spans, damage = _get_damage(old_line, new_line)
+        if spans:
+            total_damage += damage
+            # Dividing (instead of multiplying *threshold*) avoids rounding errors
+            # when *threshold* is exactly the fraction of changed cells
+            if total_damage / n_cells > threshold:
+                return None
+            damaged_lines.append((line_no, spans))
 
-        buf_write(SGR_DEFAULT)  # Reset color after last line
+    buffer = io.StringIO()
+    buf_write = buffer.write  # Eliminate attribute resolution cost
+    sgr = SGRState()
+    write_run = get_run_writer(buf_write, sgr)
+    current_line = 0
+    for line_no, spans in damaged_lines:
+        buf_write(cursor_down(top + line_no - current_line))
+        current_line = top + line_no
+        for column, runs in spans:
+            buf_write("\r")
+            buf_write(cursor_forward(left + column))
+            for run in runs:
+                write_run(*run)
+            buf_write(sgr.reset())
+    buf_write("\r")
+    buf_write(cursor_up(current_line))
 
-        with buffer:
-            return buffer.getvalue()
+    with buffer:
+        return buffer.getvalue()
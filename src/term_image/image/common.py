@@ -18,30 +18,50 @@ import io
 import os
 import re
 import sys
-import time
+import warnings
 from abc import ABCMeta, abstractmethod
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from enum import Enum
 from functools import wraps
+from hashlib import sha256
 from math import ceil
 from operator import gt, mul
 from shutil import rmtree
 from tempfile import mkdtemp, mkstemp
+from threading import Condition, Thread
 from types import FunctionType, TracebackType
-from typing import Any, Dict, Generator, List, Optional, Set, Tuple, Union
+from typing import (
+    Any,
+    Callable,
+    Deque,
+    Dict,
+    Generator,
+    Iterable,
+    List,
+    NamedTuple,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
 from urllib.parse import urlparse
+from weakref import WeakValueDictionary
 
 import PIL
-import requests
 from PIL import Image, UnidentifiedImageError
 
-from .. import get_cell_ratio
+from .. import __version__, get_cell_ratio
+from .._cache import DiskCache, FrameCache, LRUCache
 from .._ctlseqs import CURSOR_DOWN, CURSOR_UP, HIDE_CURSOR, SGR_DEFAULT, SHOW_CURSOR
+from .._http import HTTPCache, fetch
+from .._scheduler import FrameScheduler
 from ..exceptions import (
     InvalidSizeError,
     RenderError,
     StyleError,
     TermImageError,
-    URLNotFoundError,
+    TermImageUserWarning,
 )
 from ..utils import (
     ClassInstanceMethod,
@@ -69,6 +89,54 @@ _NO_VERTICAL_SPEC = re.compile(
 _ALPHA_BG_FORMAT = re.compile("#([0-9a-fA-F]{6})?", re.ASCII)
 _TEMP_DIR = mkdtemp()
 
+# Modes in which images can be reduced with correct results.
+# See `BaseImage._get_render_data()`.
+_REDUCIBLE_MODES = frozenset({"L", "LA", "RGB", "RGBA", "RGBX", "CMYK", "YCbCr"})
+
+
+def _sizeof_image(img: PIL.Image.Image) -> int:
+    """Returns the (approximate) size of an image's pixel data, in bytes."""
+    return img.width * img.height * len(img.getbands())
+
+
+def _file_signature(path: str) -> Optional[Tuple[int, int]]:
+    """Returns the signature ``(mtime_ns, size)`` of a file or ``None``, if it can't
+    be accessed.
+    """
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+
+# Converted and resized images, shared by all instances.
+# See `BaseImage._get_render_data()` and `BaseImage.resize_cache_max_bytes`.
+_resize_cache: LRUCache[tuple, PIL.Image.Image] = LRUCache(32 * 2**20, _sizeof_image)
+
+# Maps source file paths to their decoded images and the file signatures
+# ``(mtime_ns, size)`` at which they were decoded.
+# See `BaseImage._get_image()` and `BaseImage.decoded_cache_max_bytes`.
+_decoded_cache: LRUCache[str, Tuple[Tuple[int, int], PIL.Image.Image]] = LRUCache(
+    0, lambda entry: _sizeof_image(entry[1])
+)
+
+# Decoded images which are (or were) cached, by ID.
+# These are never closed explicitly, as they may be in use by multiple renders even
+# after being evicted.
+_kept_images: WeakValueDictionary[int, PIL.Image.Image] = WeakValueDictionary()
+
+# See `BaseImage._render_cached()` and `BaseImage.render_cache_dir`.
+_render_cache: Optional[DiskCache] = None
+
+# Rendered and formatted frames of animations, shared by all iterators.
+# See `ImageIterator._animate()` and `BaseImage.frame_cache_max_bytes`.
+_frame_cache: LRUCache[Tuple[str, Tuple[Any, ...]], str] = LRUCache(0, sys.getsizeof)
+
+# See `BaseImage.from_url()`, `BaseImage.url_cache_dir` and `BaseImage.url_max_bytes`.
+_url_cache: Optional[HTTPCache] = None
+_url_max_bytes = 64 * 2**20
+
 
 @no_redecorate
 def _close_validated(func: FunctionType) -> FunctionType:
@@ -131,6 +199,12 @@ class ImageSource(Enum):
     #: :meta hide-value:
     URL = SourceAttr("_url")
 
+    #: The instance was derived from the data of an image file in memory e.g a
+    #: ``bytes`` object or a memory-mapped file.
+    #:
+    #: :meta hide-value:
+    BUFFER = SourceAttr("_source")
+
 
 class Size(Enum):
     """Enumeration for :term:`automatic sizing`."""
@@ -159,6 +233,85 @@ class Size(Enum):
     ORIGINAL = Hidden()
 
 
+class PixelBuffer(NamedTuple):
+    """Raw pixel data of an image, as returned by
+    :py:meth:`BaseImage._get_render_data` in buffer mode.
+
+    The pixels are in a flattened row-major order, each occupying *bands*
+    consecutive bytes (in the order ``R, G, B[, A]``) and each row occupying
+    *stride* bytes.
+    """
+
+    data: memoryview
+    size: Tuple[int, int]
+    bands: int
+    stride: int
+
+    @classmethod
+    def from_image(cls, img: PIL.Image.Image) -> PixelBuffer:
+        bands = len(img.getbands())
+        return cls(memoryview(img.tobytes()), img.size, bands, img.width * bands)
+
+
+class BufferReader(io.RawIOBase):
+    """A read-only binary stream over the data of an object supporting the buffer
+    protocol, such as a ``bytes`` object or a memory-mapped file.
+
+    Args:
+        buffer: The object whose data is read.
+
+    Unlike :py:class:`io.BytesIO`, the data is never copied, except into the
+    buffers passed to :py:meth:`readinto`.
+    """
+
+    def __init__(self, buffer: Any) -> None:
+        self.buffer = buffer
+        self._view = memoryview(buffer).cast("B")
+        self._position = 0
+
+    def close(self) -> None:
+        # Releases the export, so that e.g a memory-mapped file can be closed
+        if not self.closed:
+            self._view.release()
+        super().close()
+
+    def readable(self) -> bool:
+        return True
+
+    def readall(self) -> bytes:
+        data = self._view[self._position :].tobytes()
+        self._position += len(data)
+        return data
+
+    def readinto(self, buffer: Any) -> int:
+        data = self._view[self._position : self._position + len(buffer)]
+        size = len(data)
+        memoryview(buffer).cast("B")[:size] = data
+        self._position += size
+        return size
+
+    def seek(self, offset: int, whence: int = io.SEEK_SET) -> int:
+        if whence == io.SEEK_SET:
+            position = offset
+        elif whence == io.SEEK_CUR:
+            position = self._position + offset
+        elif whence == io.SEEK_END:
+            position = len(self._view) + offset
+        else:
+            raise arg_value_error("whence", whence)
+        if position < 0:
+            raise arg_value_error_range("offset", offset)
+        self._position = position
+
+        return position
+
+    def seekable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self._position
+
+
 class ImageMeta(ABCMeta):
     """Type of all render style classes."""
 
@@ -179,6 +332,122 @@ class ImageMeta(ABCMeta):
 
         self._forced_support = status
 
+    resize_cache_max_bytes = ClassProperty(
+        lambda self: _resize_cache.max_size,
+        doc="""Memory budget of the resized image cache
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @resize_cache_max_bytes.setter
+    def resize_cache_max_bytes(self, max_bytes: int):
+        if not isinstance(max_bytes, int):
+            raise arg_type_error("resize_cache_max_bytes", max_bytes)
+        if max_bytes < 0:
+            raise arg_value_error_range("resize_cache_max_bytes", max_bytes)
+
+        _resize_cache.max_size = max_bytes
+
+    decoded_cache_max_bytes = ClassProperty(
+        lambda self: _decoded_cache.max_size,
+        doc="""Memory budget of the decoded image cache
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @decoded_cache_max_bytes.setter
+    def decoded_cache_max_bytes(self, max_bytes: int):
+        if not isinstance(max_bytes, int):
+            raise arg_type_error("decoded_cache_max_bytes", max_bytes)
+        if max_bytes < 0:
+            raise arg_value_error_range("decoded_cache_max_bytes", max_bytes)
+
+        _decoded_cache.max_size = max_bytes
+
+    frame_cache_max_bytes = ClassProperty(
+        lambda self: _frame_cache.max_size,
+        doc="""Memory budget of the shared frame cache
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @frame_cache_max_bytes.setter
+    def frame_cache_max_bytes(self, max_bytes: int):
+        if not isinstance(max_bytes, int):
+            raise arg_type_error("frame_cache_max_bytes", max_bytes)
+        if max_bytes < 0:
+            raise arg_value_error_range("frame_cache_max_bytes", max_bytes)
+
+        _frame_cache.max_size = max_bytes
+
+    render_cache_dir = ClassProperty(
+        lambda self: _render_cache and _render_cache.directory,
+        doc="""Directory of the on-disk render cache
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @render_cache_dir.setter
+    def render_cache_dir(self, directory: Union[str, os.PathLike, None]):
+        global _render_cache
+
+        if directory is None:
+            _render_cache = None
+            return
+        if not isinstance(directory, (str, os.PathLike)):
+            raise arg_type_error("render_cache_dir", directory)
+
+        directory = os.fspath(directory)
+        if isinstance(directory, bytes):
+            directory = directory.decode()
+        _render_cache = DiskCache(os.path.abspath(directory))
+
+    url_cache_dir = ClassProperty(
+        lambda self: _url_cache and _url_cache.directory,
+        doc="""Directory of the on-disk URL cache
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @url_cache_dir.setter
+    def url_cache_dir(self, directory: Union[str, os.PathLike, None]):
+        global _url_cache
+
+        if directory is None:
+            _url_cache = None
+            return
+        if not isinstance(directory, (str, os.PathLike)):
+            raise arg_type_error("url_cache_dir", directory)
+
+        directory = os.fspath(directory)
+        if isinstance(directory, bytes):
+            directory = directory.decode()
+        _url_cache = HTTPCache(os.path.abspath(directory))
+
+    url_max_bytes = ClassProperty(
+        lambda self: _url_max_bytes,
+        doc="""Maximum size of image data downloaded from a URL
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @url_max_bytes.setter
+    def url_max_bytes(self, max_bytes: int):
+        global _url_max_bytes
+
+        if not isinstance(max_bytes, int):
+            raise arg_type_error("url_max_bytes", max_bytes)
+        if max_bytes < 0:
+            raise arg_value_error_range("url_max_bytes", max_bytes)
+
+        _url_max_bytes = max_bytes
+
 
 class BaseImage(metaclass=ImageMeta):
     """Base of all render styles.
@@ -222,6 +491,7 @@ class BaseImage(metaclass=ImageMeta):
     # Data Attributes
 
     _forced_support: bool = False
+    _mipmap_max_bytes: int = 0
     _supported: Optional[bool] = None
     _render_method: Optional[str] = None
     _render_methods: Set[str] = set()
@@ -245,6 +515,7 @@ class BaseImage(metaclass=ImageMeta):
             raise ValueError("'image' is null-sized")
 
         self._closed = False
+        self._mipmaps: Dict[str, Dict[int, PIL.Image.Image]] = {}
         self._source = image
         self._source_type = ImageSource.PIL_IMAGE
         self._original_size = image.size
@@ -257,6 +528,7 @@ class BaseImage(metaclass=ImageMeta):
         if self._is_animated:
             self._frame_duration = (image.info.get("duration") or 100) / 1000
             self._seek_position = image.tell()
+            self._dropped_frames = None
             self._n_frames = None
 
     def __del__(self) -> None:
@@ -277,7 +549,7 @@ class BaseImage(metaclass=ImageMeta):
         )
 
         return self._format_render(
-            self._renderer(self._render_image, alpha, **style_args),
+            self._renderer(self._render_cached, alpha, **style_args),
             h_align,
             width,
             v_align,
@@ -302,7 +574,7 @@ class BaseImage(metaclass=ImageMeta):
     def __str__(self) -> str:
         """Renders the image with transparency enabled and without alignment"""
         # Only the currently set frame is rendered for animated images
-        return self._renderer(self._render_image, _ALPHA_THRESHOLD)
+        return self._renderer(self._render_cached, _ALPHA_THRESHOLD)
 
     # Properties
 
@@ -318,6 +590,76 @@ class BaseImage(metaclass=ImageMeta):
         """,
     )
 
+    decoded_cache_max_bytes = ClassProperty(
+        lambda self: _decoded_cache.max_size,
+        doc="""Memory budget of the decoded image cache
+
+        :type: int
+
+        GET:
+            Returns the maximum total size (in bytes) of the images in the cache.
+
+        SET:
+            A non-negative integer sets the memory budget of the cache, evicting
+            images as required. ``0`` disables the cache.
+
+            Can not be set on an instance.
+
+        By default, the source file of an image is opened and decoded anew for every
+        render. When this cache is enabled, the decoded image is instead kept and
+        reused by subsequent renders (including those of other instances with the
+        same source file), until the least-recently-used images are evicted to keep
+        within the memory budget.
+
+        A kept image is decoded anew if the modification time or size of the file
+        changes.
+
+        By **default**, the cache is disabled.
+
+        NOTE:
+            * The cache is shared by all instances of all render style classes.
+            * Only non-animated images initialized from files or URLs are cached.
+            * Images are decoded at full resolution, even when they're rendered at
+              a much smaller size.
+            * An image whose decoded size is larger than the memory budget is never
+              cached.
+        """,
+    )
+
+    frame_cache_max_bytes = ClassProperty(
+        lambda self: _frame_cache.max_size,
+        doc="""Memory budget of the shared frame cache
+
+        :type: int
+
+        GET:
+            Returns the maximum total size (in bytes) of the frames in the cache.
+
+        SET:
+            A non-negative integer sets the memory budget of the cache, evicting
+            frames as required. ``0`` disables the cache.
+
+            Can not be set on an instance.
+
+        By default, the frames rendered by an :py:class:`ImageIterator` (including
+        those of animations drawn with :py:meth:`draw`) are cached only within
+        the iterator and discarded when it's closed. When this cache is enabled,
+        rendered frames are also cached process-wide, such that they're reused by all
+        iterators over images with the same source, frame, size, format specifier
+        and render settings, until the least-recently-used frames are evicted to
+        keep within the memory budget.
+
+        By **default**, the cache is disabled.
+
+        NOTE:
+            * The cache is shared by all instances of all render style classes.
+            * Images initialized from PIL images are never cached, since they may be
+              modified in-place.
+            * Frames of an image initialized from a file are rendered anew if the
+              modification time or size of the file changes.
+        """,
+    )
+
     forced_support = ClassProperty(
         lambda self: type(self)._forced_support,
         doc="""Forced render style support
@@ -350,6 +692,103 @@ class BaseImage(metaclass=ImageMeta):
         """,
     )
 
+    render_cache_dir = ClassProperty(
+        lambda self: _render_cache and _render_cache.directory,
+        doc="""Directory of the on-disk render cache
+
+        :type: Optional[str]
+
+        GET:
+            Returns the absolute path of the cache directory or ``None``, if the
+            cache is disabled.
+
+        SET:
+            A path sets the cache directory, which is created when the first render
+            is cached, if it doesn't exist. ``None`` disables the cache.
+
+            Can not be set on an instance.
+
+        When this cache is enabled, the output of rendering an image with
+        :py:func:`str`, :py:func:`format`, :py:meth:`draw` or
+        :py:class:`~term_image.widget.UrwidImage` is stored on disk. Subsequent
+        renders (in any process) with the same parameters read the output from the
+        cache instead of decoding, resizing and encoding the image again.
+
+        The cached output is reused only if all of the following are the same:
+
+        * the source i.e the path, modification time and size of the file for
+          :py:attr:`~term_image.image.ImageSource.FILE_PATH` sources, or the contents
+          for other sources;
+        * the render style, :term:`rendered size` and size in pixels;
+        * the frame number, for animated images;
+        * the transparency setting and style-specific parameters;
+        * the style's render method and other settings which affect the output; and
+        * the :term:`active terminal` (name, version and background colour).
+
+        By **default**, the cache is disabled.
+
+        NOTE:
+            * Images initialized from PIL images are never cached, since they may be
+              modified in-place.
+            * Frames rendered by :py:class:`ImageIterator` (e.g animations) and
+              streamed draws are not cached.
+            * The cache is never pruned automatically.
+        """,
+    )
+
+    resize_cache_max_bytes = ClassProperty(
+        lambda self: _resize_cache.max_size,
+        doc="""Memory budget of the resized image cache
+
+        :type: int
+
+        GET:
+            Returns the maximum total size (in bytes) of the images in the cache.
+
+        SET:
+            A non-negative integer sets the memory budget of the cache, evicting
+            images as required. ``0`` disables the cache.
+
+            Can not be set on an instance.
+
+        :term:`Rendering` an image involves converting and resizing the source,
+        which is comparatively costly for large images. The result of this is cached,
+        such that it's reused by subsequent renders of the same image with the same
+        size, frame and transparency setting, until the least-recently-used images
+        are evicted to keep within the memory budget. For images initialized from
+        files, a cached image is reused only while the file's modification time and
+        size are unchanged.
+
+        By **default**, the memory budget is 32 MiB.
+
+        NOTE:
+            * The cache is shared by all instances of all render style classes.
+            * The images cached for an instance are evicted when the instance's size
+              changes or when it's finalized.
+            * Images initialized from PIL images or rendered as frames of animations
+              (i.e by :py:class:`ImageIterator`) are not cached, since the former
+              may be modified in-place and the latter are cached otherwise.
+        """,
+    )
+
+    dropped_frames = property(
+        lambda self: self._dropped_frames if self._is_animated else None,
+        doc="""Frames dropped by the last animation
+
+        :type: Optional[int]
+
+        GET:
+            Returns:
+
+            * The number of frames dropped (i.e not drawn) by the last animation of
+              the image drawn with :py:meth:`draw`, to keep it in sync with the wall
+              clock.
+            * ``None``, if the image is not animated or has never been animated.
+
+        See the *frame_skip* parameter of :py:meth:`draw`.
+        """,
+    )
+
     frame_duration = property(
         lambda self: self._frame_duration if self._is_animated else None,
         doc="""Duration of a single frame
@@ -418,6 +857,52 @@ class BaseImage(metaclass=ImageMeta):
         """,
     )
 
+    mipmap_max_bytes = property(
+        lambda self: self._mipmap_max_bytes,
+        doc="""Memory budget of the image pyramid
+
+        :type: int
+
+        GET:
+            Returns the maximum total size (in bytes) of the levels of the image
+            pyramid.
+
+        SET:
+            A non-negative integer sets the memory budget of the pyramid, discarding
+            any existing level. ``0`` disables the pyramid.
+
+        When enabled, progressively halved copies (levels) of the image are kept and
+        the image is resized from the smallest level that isn't smaller than twice
+        the required render size, instead of from the source. Hence, resizing a large
+        image frequently (e.g within a resizable TUI) becomes much cheaper, at the
+        cost of memory.
+
+        Levels are created only as they are required. Levels that would exceed the
+        memory budget are created (from the nearest kept level) whenever required but
+        not kept.
+
+        By **default**, the pyramid is disabled.
+
+        NOTE:
+            * Animated images are unaffected.
+            * For an instance initialized with a PIL image, modifications to the
+              PIL image after a level is created are not reflected by renders using
+              that level.
+        """,
+    )
+
+    @mipmap_max_bytes.setter
+    def mipmap_max_bytes(self, max_bytes: int) -> None:
+        if not isinstance(max_bytes, int):
+            raise arg_type_error("mipmap_max_bytes", max_bytes)
+        if max_bytes < 0:
+            raise arg_value_error_range("mipmap_max_bytes", max_bytes)
+
+        self._mipmap_max_bytes = max_bytes
+        self._mipmaps.clear()
+        # Images resized from levels differ slightly from those resized from the source
+        self._uncache_resized()
+
     original_size = property(
         lambda self: self._original_size,
         doc="""Size of the source (in pixels)
@@ -547,10 +1032,13 @@ class BaseImage(metaclass=ImageMeta):
         doc="""
         Image :term:`source`
 
-        :type: Union[PIL.Image.Image, str]
+        :type: Union[PIL.Image.Image, str, bytes, Any]
 
         GET:
             Returns the :term:`source` from which the instance was initialized.
+
+            For instances initialized with :py:meth:`from_buffer`, this is the
+            given buffer object.
         """,
     )
 
@@ -566,6 +1054,60 @@ class BaseImage(metaclass=ImageMeta):
         """,
     )
 
+    url_cache_dir = ClassProperty(
+        lambda self: _url_cache and _url_cache.directory,
+        doc="""Directory of the on-disk URL cache
+
+        :type: Optional[str]
+
+        GET:
+            Returns the absolute path of the cache directory or ``None``, if the
+            cache is disabled.
+
+        SET:
+            A path sets the cache directory, which is created when the first
+            response is cached, if it doesn't exist. ``None`` disables the cache.
+
+            Can not be set on an instance.
+
+        When this cache is enabled, the image data downloaded by :py:meth:`from_url`
+        is stored on disk along with the ``ETag`` and ``Last-Modified`` headers of the
+        response. The next time the same URL is used (in any process), the server is
+        only asked whether the data has changed and the cached data is reused if it
+        hasn't.
+
+        By **default**, the cache is disabled.
+
+        NOTE:
+            * The data is stored by the digest of its contents, hence identical data
+              from different URLs is stored once.
+            * Responses without an ``ETag`` or ``Last-Modified`` header can't be
+              revalidated, hence they're not cached.
+            * The cache is never pruned automatically.
+        """,
+    )
+
+    url_max_bytes = ClassProperty(
+        lambda self: _url_max_bytes,
+        doc="""Maximum size of image data downloaded from a URL
+
+        :type: int
+
+        GET:
+            Returns the maximum size (in bytes).
+
+        SET:
+            A non-negative integer sets the maximum size. ``0`` removes the limit.
+
+            Can not be set on an instance.
+
+        The size is checked while the data is downloaded by :py:meth:`from_url`, such
+        that the download is aborted as soon as the size is exceeded.
+
+        By **default**, the maximum size is 64 MiB.
+        """,
+    )
+
     width = property(
         lambda self: self._size if isinstance(self._size, Size) else self._size[0],
         lambda self, width: self.set_size(width),
@@ -616,6 +1158,8 @@ class BaseImage(metaclass=ImageMeta):
         """
         try:
             if not self._closed:
+                self._uncache_resized()
+                self._mipmaps.clear()
                 if self._source_type is ImageSource.URL:
                     try:
                         os.remove(self._source)
@@ -639,8 +1183,10 @@ class BaseImage(metaclass=ImageMeta):
         animate: bool = True,
         repeat: int = -1,
         cached: Union[bool, int] = 100,
+        frame_skip: int = 0,
         scroll: bool = False,
         check_size: bool = True,
+        stream: bool = False,
         **style: Any,
     ) -> None:
         """Draws the image to standard output.
@@ -686,10 +1232,18 @@ class BaseImage(metaclass=ImageMeta):
               * If :py:class:`int`, caching is enabled only if the framecount of the
                 image is less than or equal to the given number.
 
+            frame_skip: The maximum number of consecutive frames of an animated image
+              that may be dropped (i.e not drawn), when they're rendered only after
+              their duration has elapsed, to keep the animation in sync with the wall
+              clock. See :py:attr:`dropped_frames`.
+
             scroll: Only applies to non-animations. If ``True``, allows the image's
               :term:`rendered height` to be greater than the :term:`terminal height`.
             check_size: If ``False``, rendered size validation is not performed for
               non-animations. Does not affect padding size validation.
+            stream: Only applies to non-animations. If ``True``, the output is
+              written (and flushed) in parts, as soon as each is :term:`rendered`,
+              instead of all at once.
             style: Style-specific render parameters. See each subclass for it's own
               usage.
 
@@ -712,7 +1266,8 @@ class BaseImage(metaclass=ImageMeta):
             dimension ``max(terminal_dimension + frame_dimension, 1)``.
 
         * :term:`padding width` is always validated.
-        * *animate*, *repeat* and *cached* apply to :term:`animated` images only.
+        * *animate*, *repeat*, *cached* and *frame_skip* apply to :term:`animated`
+          images only.
           They are simply ignored for non-animated images.
         * For animations (i.e animated images with *animate* set to ``True``):
 
@@ -754,11 +1309,17 @@ class BaseImage(metaclass=ImageMeta):
                 got_extra=f"terminal_height={terminal_height}, animation={animation}",
             )
 
-        for arg in ("scroll", "check_size"):
+        for arg in ("scroll", "check_size", "stream"):
             arg_value = locals()[arg]
             if not isinstance(arg_value, bool):
                 raise arg_type_error(arg, arg_value)
 
+        if animation:
+            if not isinstance(frame_skip, int) or isinstance(frame_skip, bool):
+                raise arg_type_error("frame_skip", frame_skip)
+            if frame_skip < 0:
+                raise arg_value_error_range("frame_skip", frame_skip)
+
         # Checks for *repeat* and *cached* are delegated to `ImageIterator`.
 
         def render(image: PIL.Image.Image) -> None:
@@ -768,13 +1329,31 @@ class BaseImage(metaclass=ImageMeta):
                 style_args = self._check_style_args(style)
                 if animation:
                     self._display_animated(
-                        image, alpha, fmt, repeat, cached, **style_args
+                        image,
+                        alpha,
+                        fmt,
+                        repeat,
+                        cached,
+                        frame_skip=frame_skip,
+                        **style_args,
                     )
+                elif stream:
+                    write = sys.stdout.write
+                    flush = sys.stdout.flush
+                    try:
+                        for chunk in self._format_render_lines(
+                            self._render_lines(image, alpha, **style_args), *fmt
+                        ):
+                            write(chunk)
+                            flush()
+                    except (KeyboardInterrupt, Exception):
+                        self._handle_interrupted_draw()
+                        raise
                 else:
                     try:
                         print(
                             self._format_render(
-                                self._render_image(image, alpha, **style_args),
+                                self._render_cached(image, alpha, **style_args),
                                 *fmt,
                             ),
                             end="",
@@ -841,6 +1420,119 @@ class BaseImage(metaclass=ImageMeta):
         new._source_type = ImageSource.FILE_PATH
         return new
 
+    @classmethod
+    def from_files(
+        cls,
+        filepaths: Iterable[Union[str, os.PathLike]],
+        *,
+        max_workers: int = 8,
+        **kwargs: Union[None, int],
+    ) -> List[Union[BaseImage, Exception]]:
+        """Creates instances from image files, concurrently.
+
+        Args:
+            filepaths: Relative/Absolute paths to image files.
+            max_workers: The maximum number of files opened at once.
+            kwargs: Same keyword arguments as the class constructor.
+
+        Returns:
+            A list containing, for each path in *filepaths* (in the same order),
+            either a new instance or the exception raised while creating it.
+
+        Raises:
+            TypeError: An argument is of an inappropriate type.
+            ValueError: *max_workers* is not positive.
+
+        Each path is handled as by :py:meth:`from_file`, in a pool of threads.
+        Exceptions are returned rather than raised, such that a failure doesn't
+        affect the other files.
+
+        NOTE:
+            As with :py:meth:`from_file`, only the header of each file is read.
+            The image data is decoded when the image is first rendered and the
+            number of frames of an animated image, when first required.
+        """
+        if not isinstance(filepaths, Iterable) or isinstance(filepaths, (str, bytes)):
+            raise arg_type_error("filepaths", filepaths)
+
+        return cls._create_all(cls.from_file, filepaths, max_workers, kwargs)
+
+    @classmethod
+    def from_bytes(
+        cls,
+        data: Union[bytes, bytearray, memoryview],
+        **kwargs: Union[None, int],
+    ) -> BaseImage:
+        """Creates an instance from the data of an image file.
+
+        Args:
+            data: The contents of an image file.
+            kwargs: Same keyword arguments as the class constructor.
+
+        Returns:
+            A new instance.
+
+        Raises:
+            TypeError: *data* is not a bytes-like object.
+            PIL.UnidentifiedImageError: Propagated from :py:func:`PIL.Image.open`.
+
+        Also propagates exceptions raised or propagated by the class constructor.
+
+        The data is copied, unless *data* is a ``bytes`` object (which is immutable),
+        and is never written to disk.
+
+        TIP:
+            To avoid the copy, see :py:meth:`from_buffer`.
+        """
+        if not isinstance(data, (bytes, bytearray, memoryview)):
+            raise arg_type_error("data", data)
+
+        return cls.from_buffer(bytes(data), **kwargs)
+
+    @classmethod
+    def from_buffer(cls, buffer: Any, **kwargs: Union[None, int]) -> BaseImage:
+        """Creates an instance from the data of an image file, in any object
+        supporting the buffer protocol.
+
+        Args:
+            buffer: An object whose data are the contents of an image file e.g a
+              memory-mapped file (:py:class:`mmap.mmap`) or the buffer of a shared
+              memory block (:py:attr:`multiprocessing.shared_memory.SharedMemory.buf`).
+            kwargs: Same keyword arguments as the class constructor.
+
+        Returns:
+            A new instance.
+
+        Raises:
+            TypeError: *buffer* does not support the buffer protocol.
+            PIL.UnidentifiedImageError: Propagated from :py:func:`PIL.Image.open`.
+
+        Also propagates exceptions raised or propagated by the class constructor.
+
+        The data is read from *buffer* directly (i.e without copying it) whenever
+        the image is rendered.
+
+        WARNING:
+            The data must not be modified, and *buffer* must not be closed or
+            released, until the instance is closed.
+        """
+        try:
+            memoryview(buffer).release()
+        except TypeError:
+            raise arg_type_error("buffer", buffer) from None
+
+        try:
+            img = Image.open(BufferReader(buffer))
+        except UnidentifiedImageError as e:
+            e.args = ("Could not identify the data as an image",)
+            raise
+
+        with img:
+            new = cls(img, **kwargs)
+        new._source = buffer
+        new._source_type = ImageSource.BUFFER
+        return new
+
     @classmethod
     def from_url(
         cls,
@@ -860,11 +1552,16 @@ class BaseImage(metaclass=ImageMeta):
             TypeError: *url* is not a string.
             ValueError: The URL is invalid.
             term_image.exceptions.URLNotFoundError: The URL does not exist.
+            term_image.exceptions.TermImageError: The image data is larger than
+              :py:attr:`url_max_bytes`.
             PIL.UnidentifiedImageError: Propagated from :py:func:`PIL.Image.open`.
 
-        Also propagates connection-related exceptions from :py:func:`requests.get`
+        Also propagates connection-related exceptions from :py:mod:`requests`
         and exceptions raised or propagated by the class constructor.
 
+        Connections are pooled and reused across calls. See also
+        :py:attr:`url_cache_dir`.
+
         NOTE:
             This method creates a temporary file, but only after successful
             initialization. The file is removed:
@@ -880,19 +1577,17 @@ class BaseImage(metaclass=ImageMeta):
             raise arg_value_error_msg("Invalid URL", url)
 
         # Propagates connection-related errors.
-        response = requests.get(url, stream=True)
-        if response.status_code == 404:
-            raise URLNotFoundError(f"URL {url!r} does not exist.")
+        content = fetch(url, _url_max_bytes, _url_cache)
 
         # Ensure initialization is successful before writing to file
         try:
-            new = cls(Image.open(io.BytesIO(response.content)), **kwargs)
+            new = cls(Image.open(io.BytesIO(content)), **kwargs)
         except UnidentifiedImageError as e:
             e.args = (f"The URL {url!r} doesn't link to an identifiable image",)
             raise
 
         fd, filepath = mkstemp("-" + os.path.basename(url), dir=_TEMP_DIR)
-        os.write(fd, response.content)
+        os.write(fd, content)
         os.close(fd)
 
         new._source = filepath
@@ -900,6 +1595,38 @@ class BaseImage(metaclass=ImageMeta):
         new._url = url
         return new
 
+    @classmethod
+    def from_urls(
+        cls,
+        urls: Iterable[str],
+        *,
+        max_workers: int = 8,
+        **kwargs: Union[None, int],
+    ) -> List[Union[BaseImage, Exception]]:
+        """Creates instances from image URLs, concurrently.
+
+        Args:
+            urls: URLs of image files.
+            max_workers: The maximum number of URLs fetched at once.
+            kwargs: Same keyword arguments as the class constructor.
+
+        Returns:
+            A list containing, for each URL in *urls* (in the same order), either a
+            new instance or the exception raised while creating it.
+
+        Raises:
+            TypeError: An argument is of an inappropriate type.
+            ValueError: *max_workers* is not positive.
+
+        Each URL is handled as by :py:meth:`from_url`, in a pool of threads sharing
+        the same connection pool. Exceptions are returned rather than raised, such
+        that a failure doesn't affect the other URLs.
+        """
+        if not isinstance(urls, Iterable) or isinstance(urls, str):
+            raise arg_type_error("urls", urls)
+
+        return cls._create_all(cls.from_url, urls, max_workers, kwargs)
+
     @classmethod
     @abstractmethod
     def is_supported(cls) -> bool:
@@ -1067,6 +1794,7 @@ class BaseImage(metaclass=ImageMeta):
                 )
 
             self._size = width_height
+            self._uncache_resized(keep=width_height)
             return
 
         if not (
@@ -1078,6 +1806,7 @@ class BaseImage(metaclass=ImageMeta):
             raise arg_value_error("frame_size", frame_size)
 
         self._size = self._valid_size(width, height, frame_size)
+        self._uncache_resized(keep=self._size)
 
     def tell(self) -> int:
         """Returns the current image frame number.
@@ -1306,10 +2035,48 @@ class BaseImage(metaclass=ImageMeta):
         return False
 
     def _close_image(self, img: PIL.Image.Image) -> None:
-        """Closes the given PIL image instance if it isn't the instance' source."""
-        if img is not self._source:
+        """Closes the given PIL image instance if it isn't the instance' source or a
+        kept decoded image.
+        """
+        if img is not self._source and _kept_images.get(id(img)) is not img:
             img.close()
 
+    @staticmethod
+    def _create_all(
+        create: Callable[..., BaseImage],
+        sources: Iterable[Any],
+        max_workers: int,
+        kwargs: Dict[str, Any],
+    ) -> List[Union[BaseImage, Exception]]:
+        """Creates instances from multiple sources in a pool of threads.
+
+        Args:
+            create: Creates an instance from a single source.
+            sources: The sources.
+            max_workers: The maximum number of threads.
+            kwargs: Keyword arguments passed on to *create*.
+
+        Returns:
+            For each source, the instance created or the exception raised by
+            *create*, in order.
+        """
+        if not isinstance(max_workers, int) or isinstance(max_workers, bool):
+            raise arg_type_error("max_workers", max_workers)
+        if max_workers < 1:
+            raise arg_value_error_range("max_workers", max_workers)
+
+        def create_one(source: Any) -> Union[BaseImage, Exception]:
+            try:
+                return create(source, **kwargs)
+            except Exception as e:
+                return e
+
+        sources = list(sources)
+        if not sources:
+            return []
+        with ThreadPoolExecutor(min(max_workers, len(sources))) as executor:
+            return list(executor.map(create_one, sources))
+
     def _display_animated(
         self,
         img: PIL.Image.Image,
@@ -1317,40 +2084,50 @@ class BaseImage(metaclass=ImageMeta):
         fmt: Tuple[str | None, int, str | None, int],
         repeat: int,
         cached: Union[bool, int],
+        *,
+        frame_skip: int = 0,
         **style_args: Any,
     ) -> None:
-        """Displays an animated GIF image in the terminal."""
+        """Displays an animated GIF image in the terminal.
+
+        The number of frames dropped, as allowed by *frame_skip*, is set as
+        :py:attr:`dropped_frames`.
+        """
         lines = max(fmt[-1], self.rendered_height)
         prev_seek_pos = self._seek_position
-        duration = self._frame_duration
+        duration = int(self._frame_duration * 10**9)
+        scheduler = FrameScheduler(frame_skip)
         image_it = ImageIterator(self, repeat, "", cached)
         image_it._animator = image_it._animate(img, alpha, fmt, style_args)
         cursor_up = CURSOR_UP % (lines - 1)
         cursor_down = CURSOR_DOWN % lines
 
         try:
-            print(next(image_it._animator), end="", flush=True)  # First frame
+            frame = next(image_it._animator)
+            scheduler.start(duration)
+            print(frame, end="", flush=True)  # First frame
+            if frame_skip:
+                # Late frames are dropped before they're rendered
+                image_it._skip = lambda: scheduler.skip(duration)
 
             # Render next frame during current frame's duration
-            start = time.time()
             for frame in image_it._animator:  # Renders next frame
                 # Left-over of current frame's duration
-                time.sleep(max(0, duration - (time.time() - start)))
+                if not scheduler.wait(duration):
+                    continue
 
                 # Clear the current frame, if necessary,
                 # move cursor up to the beginning of the first line of the image
                 # and print the new current frame.
                 self._clear_frame()
                 print("\r", cursor_up, frame, sep="", end="", flush=True)
-
-                # Render next frame during current frame's duration
-                start = time.time()
         except KeyboardInterrupt:
             self._handle_interrupted_draw()
         except Exception:
             self._handle_interrupted_draw()
             raise
         finally:
+            self._dropped_frames = scheduler.dropped
             image_it.close()
             self._close_image(img)
             self._seek_position = prev_seek_pos
@@ -1372,6 +2149,31 @@ class BaseImage(metaclass=ImageMeta):
             * All arguments should be passed through ``_check_formatting()`` first.
             * Only **absolute** padding dimensions are expected.
         """
+        return "".join(
+            self._format_render_lines((render,), h_align, width, v_align, height)
+        )
+
+    def _format_render_lines(
+        self,
+        chunks: Iterable[str],
+        h_align: str | None,
+        width: int,
+        v_align: str | None,
+        height: int,
+    ) -> Generator[str, None, None]:
+        """Pads and aligns a primary :term:`render` output given in parts.
+
+        Args:
+            chunks: The parts of the render output, as yielded by
+              ``_render_lines()``.
+
+        Yields:
+            The parts of the formatted output, as soon as the corresponding part of
+            the render output is available. Concatenated, they're the same as the
+            return value of ``_format_render()`` for the entire render output.
+
+        See :py:meth:`_format_render` for the description of the other parameters.
+        """
         cols, lines = self.rendered_size
 
         if width > cols:
@@ -1384,7 +2186,6 @@ class BaseImage(metaclass=ImageMeta):
             else:  # center
                 left = " " * ((width - cols) // 2)
                 right = " " * (width - cols - len(left))
-            render = render.replace("\n", f"{right}\n{left}")
         else:
             left = right = ""
 
@@ -1403,17 +2204,156 @@ class BaseImage(metaclass=ImageMeta):
         else:
             top = bottom = ""
 
-        return (
-            "".join((top, left, render, right, bottom))
-            if width > cols or height > lines
-            else render
-        )
+        if top:
+            yield top
+        if left:
+            yield left
+        if width > cols:
+            for chunk in chunks:
+                yield chunk.replace("\n", f"{right}\n{left}")
+        else:
+            yield from chunks
+        if right:
+            yield right
+        if bottom:
+            yield bottom
 
     @_close_validated
     def _get_image(self) -> PIL.Image.Image:
-        """Returns the PIL image instance corresponding to the image source as-is"""
+        """Returns the PIL image instance corresponding to the image source as-is
+
+        See :py:attr:`decoded_cache_max_bytes`.
+        """
+        if self._source_type is ImageSource.BUFFER:
+            return Image.open(BufferReader(self._source))
+        if not isinstance(self._source, str):
+            return self._source
+        if not _decoded_cache.max_size or self._is_animated:
+            return Image.open(self._source)
+
+        signature = _file_signature(self._source)
+        if not signature:
+            return Image.open(self._source)  # Raises the appropriate exception
+
+        entry = _decoded_cache.get(self._source)
+        if entry and entry[0] == signature:
+            return entry[1]
+
+        img = Image.open(self._source)
+        # Avoid decoding images that can't be cached at full resolution
+        if _sizeof_image(img) <= _decoded_cache.max_size:
+            try:
+                img.load()
+            except Exception:
+                img.close()
+                raise
+            _decoded_cache.put(self._source, (signature, img))
+            if self._source in _decoded_cache:
+                _kept_images[id(img)] = img
+
+        return img
+
+    def _get_mipmap(
+        self, img: PIL.Image.Image, mode: str, level: int
+    ) -> PIL.Image.Image:
+        """Returns a level of the image pyramid, creating it as required.
+
+        Args:
+            img: The source image.
+            mode: The mode of the level.
+            level: The level number. The source is reduced by a factor of
+              ``2 ** level``.
+
+        The returned image must not be closed.
+        See :py:attr:`mipmap_max_bytes`.
+        """
+        levels = self._mipmaps.setdefault(mode, {})
+        if level in levels:
+            return levels[level]
+
+        used = sum(
+            _sizeof_image(level_img)
+            for mode_levels in self._mipmaps.values()
+            for level_img in mode_levels.values()
+        )
+        start = max((n for n in levels if n < level), default=0)
+        if start:
+            level_img = levels[start]
+        else:
+            try:
+                level_img = img.convert(mode)
+            # Possible for images in some modes e.g "La"
+            except Exception as e:
+                raise RenderError("Unable to convert image") from e
+
+        for n in range(start + 1, level + 1):
+            prev_img = level_img
+            level_img = level_img.reduce(2)
+            if n - 1 not in levels:
+                prev_img.close()
+
+            size = _sizeof_image(level_img)
+            if used + size <= self._mipmap_max_bytes:
+                levels[n] = level_img
+                used += size
+
+        return level_img
+
+    def _get_render_cache_key(
+        self, alpha: Union[None, float, str], style_args: Dict[str, Any]
+    ) -> Optional[str]:
+        """Returns the key of a render in the render cache or the frame cache or
+        ``None``, if the render can't be cached.
+
+        See :py:attr:`render_cache_dir` and :py:attr:`frame_cache_max_bytes`.
+        """
+        if self._source_type is ImageSource.PIL_IMAGE:
+            return None
+
+        if self._source_type is ImageSource.FILE_PATH:
+            try:
+                stat = os.stat(self._source)
+            except OSError:
+                return None
+            source = (self._source, stat.st_mtime_ns, stat.st_size)
+        else:
+            try:
+                source = self._source_digest
+            except AttributeError:
+                if self._source_type is ImageSource.URL:
+                    with open(self._source, "rb") as file:
+                        source = sha256(file.read()).hexdigest()
+                else:
+                    source = sha256(self._source).hexdigest()
+                self._source_digest = source
+
+        return repr(
+            (
+                __version__,
+                type(self).__module__,
+                type(self).__qualname__,
+                source,
+                self._is_animated and self._seek_position,
+                self.rendered_size,
+                self._get_render_size(),
+                alpha,
+                sorted(style_args.items()),
+                self._get_render_cache_params(),
+            )
+        )
+
+    def _get_render_cache_params(self) -> Tuple[Any, ...]:
+        """Returns the values, other than the image and render arguments, which the
+        render output depends on.
+
+        The values are part of the key of a render in the render cache. Subclasses
+        whose output depends on other values (e.g class-wide settings) should extend
+        this.
+        """
         return (
-            Image.open(self._source) if isinstance(self._source, str) else self._source
+            self._render_method,
+            get_terminal_name_version(),
+            get_fg_bg_colors(hex=True)[1],
         )
 
     def _get_render_data(
@@ -1423,10 +2363,13 @@ class BaseImage(metaclass=ImageMeta):
         *,
         size: Optional[Tuple[int, int]] = None,
         pixel_data: bool = True,
+        buffer: bool = False,
         round_alpha: bool = False,
         frame: bool = False,
     ) -> Tuple[
-        PIL.Image.Image, Optional[List[Tuple[int, int, int]]], Optional[List[int]]
+        PIL.Image.Image,
+        Union[None, List[Tuple[int, int, int]], PixelBuffer],
+        Optional[List[int]],
     ]:
         """Returns the PIL image instance and pixel data required to render an image.
 
@@ -1434,6 +2377,8 @@ class BaseImage(metaclass=ImageMeta):
             size: If given (in pixels), it is used instead of the pixel-equivalent of
               the image size.
             pixel_data: If ``False``, ``None`` is returned for all pixel data.
+            buffer: If ``True``, the pixel data is returned in buffer mode
+              (see below).
             round_alpha: Only applies when *alpha* is a ``float``.
 
               If ``True``, returned alpha values are bi-level (``0`` or ``255``), based
@@ -1453,11 +2398,29 @@ class BaseImage(metaclass=ImageMeta):
             are integers in the range [0, 255].
           * ``a`` is a list of integers in the range [0, 255] representing the alpha
             channel of the image's pixels in a flattened row-major order.
+
+        In buffer mode, no per-pixel object is created:
+          * ``rgb`` is a :py:class:`PixelBuffer` over the raw data of the returned
+            image, including its alpha channel, if any.
+          * ``a`` is always ``None``.
+          * If the image has no transparency (or *round_alpha* is ``True`` and no
+            pixel is below the alpha threshold), the returned image is in the
+            ``RGB`` mode. Otherwise, it's in the ``RGBA`` mode and, if *round_alpha*
+            is ``True``, its alpha channel is bi-level.
         """
 
         def convert_resize_img(mode: str):
             nonlocal img
 
+            # Reducing first, where possible, leaves fewer pixels to convert.
+            # Reducing premultiplies alpha, which would lose the colours of
+            # transparent pixels if the alpha channel is to be discarded.
+            reduced = (
+                img.mode in _REDUCIBLE_MODES
+                and (mode == "RGBA" or "A" not in img.mode)
+                and reduce_img()
+            )
+
             if img.mode != mode:
                 prev_img = img
                 try:
@@ -1469,10 +2432,13 @@ class BaseImage(metaclass=ImageMeta):
                     if frame_img is not prev_img:
                         self._close_image(prev_img)
 
-            if img.size != size:
+            if not reduced:
+                reduce_img()
+
+            if img.size != size or box:
                 prev_img = img
                 try:
-                    img = img.resize(size, Image.Resampling.BOX)
+                    img = img.resize(size, Image.Resampling.BOX, box)
                 # Highly unlikely since render size can never be zero
                 except Exception as e:
                     raise RenderError("Unable to resize image") from e
@@ -1480,49 +2446,166 @@ class BaseImage(metaclass=ImageMeta):
                     if frame_img is not prev_img:
                         self._close_image(prev_img)
 
+        def reduce_img() -> bool:
+            """Reduces the image by the largest power-of-two factor at which it's still
+            no smaller than twice the render size, leaving the rest to the BOX resize.
+
+            As with drafting, the margin keeps the quality of the output close to
+            that of resizing from the full image.
+            """
+            nonlocal box, img
+
+            factor = min(img.width // size[0], img.height // size[1]) // 2
+            if factor < 2:
+                return False
+
+            # Partial blocks at the right and bottom edges are reduced into whole
+            # pixels, hence the source region for the resize
+            factor = 1 << factor.bit_length() - 1
+            box = tuple(x / factor for x in box or (0, 0, *img.size))
+
+            prev_img = img
+            try:
+                img = img.reduce(factor)
+            finally:
+                if frame_img is not prev_img:
+                    self._close_image(prev_img)
+
+            return True
+
         frame_img = img if frame else None
+        box = None  # The region of the (reduced) image that maps to the source
         if self._is_animated:
             img.seek(self._seek_position)
         if not size:
             size = self._get_render_size()
 
-        if alpha is None or img.mode in {"1", "L", "RGB", "HSV", "CMYK"}:
+        buffer = pixel_data and buffer
+        cache_key = (
+            None
+            # Only images opened directly from the source are cached
+            if frame or not _resize_cache.max_size or not self._is_source_image(img)
+            else (
+                id(self),
+                self.rendered_size,
+                # The source file may be modified between renders
+                isinstance(self._source, str) and _file_signature(self._source),
+                self._is_animated and self._seek_position,
+                size,
+                alpha,
+                round_alpha,
+                buffer,
+                # The only cases in which the terminal's BG color is used
+                (alpha == "#" or isinstance(alpha, float) and round_alpha)
+                and get_fg_bg_colors(hex=True)[1],
+            )
+        )
+        cached_img = cache_key and _resize_cache.get(cache_key)
+
+        mode = (
+            "RGB"
+            if alpha is None or img.mode in {"1", "L", "RGB", "HSV", "CMYK"}
+            else "RGBA"
+        )
+        if (
+            not cached_img
+            and self._mipmap_max_bytes
+            and not frame
+            and not self._is_animated
+        ):
+            factor = min(img.width // size[0], img.height // size[1]) // 2
+            if factor >= 2:
+                # Resize from the nearest level that isn't smaller than twice the
+                # render size (see `reduce_img()`)
+                level = factor.bit_length() - 1
+                source_img = img
+                # Like frames, levels must not be closed
+                img = frame_img = self._get_mipmap(source_img, mode, level)
+                box = (
+                    0,
+                    0,
+                    source_img.width / (1 << level),
+                    source_img.height / (1 << level),
+                )
+                self._close_image(source_img)
+
+        # Let the JPEG decoder scale the image down by up to 8 times, if it hasn't
+        # been loaded yet. Only done for images opened directly from the source,
+        # since the image is modified in-place.
+        # Like `Image.thumbnail()`, the decoded image is kept no smaller than twice the
+        # render size since DCT scaling is less accurate than BOX resampling.
+        if (
+            not cached_img
+            and not frame
+            and img.format == "JPEG"
+            and self._is_source_image(img)
+        ):
+            _, box = img.draft(None, (size[0] * 2, size[1] * 2)) or (None, None)
+
+        if cached_img:
+            self._close_image(img)
+        elif mode == "RGB":
             convert_resize_img("RGB")
-            if pixel_data:
-                rgb = list(img.getdata())
-                a = [255] * mul(*size)
         else:
             convert_resize_img("RGBA")
             if isinstance(alpha, str):
-                if alpha == "#":
-                    alpha = get_fg_bg_colors(hex=True)[1] or "#000000"
-                bg = Image.new("RGBA", img.size, alpha)
+                bg = Image.new(
+                    "RGBA",
+                    img.size,
+                    (
+                        (get_fg_bg_colors(hex=True)[1] or "#000000")
+                        if alpha == "#"
+                        else alpha
+                    ),
+                )
                 bg.alpha_composite(img)
                 if frame_img is not img:
                     self._close_image(img)
                 img = bg.convert("RGB")
-                if pixel_data:
-                    a = [255] * mul(*size)
             else:
-                if pixel_data:
-                    a = list(img.getdata(3))
+                if buffer:
+                    a_band = img.getchannel("A")
                     if round_alpha:
-                        alpha = round(alpha * 255)
-                        a = [0 if val < alpha else 255 for val in a]
+                        threshold = round(alpha * 255)
+                        a_band = a_band.point(
+                            [0] * threshold + [255] * (256 - threshold)
+                        )
                 if round_alpha:
                     bg = Image.new(
                         "RGBA", img.size, get_fg_bg_colors(hex=True)[1] or "#000000"
                     )
                     bg.alpha_composite(img)
-                    bg.putalpha(img.getchannel("A"))
+                    bg.putalpha(a_band if buffer else img.getchannel("A"))
                     if frame_img is not img:
                         self._close_image(img)
                     img = bg
 
-            if pixel_data:
-                rgb = list((img if img.mode == "RGB" else img.convert("RGB")).getdata())
+                # Without transparency, the alpha channel is just dead weight
+                if buffer and a_band.getextrema()[0] == 255:
+                    prev_img = img
+                    img = img.convert("RGB")
+                    if frame_img is not prev_img:
+                        self._close_image(prev_img)
+
+        # Cached images are never returned, since callers may close returned images
+        if cached_img:
+            img = cached_img.copy()
+        elif cache_key:
+            _resize_cache.put(cache_key, img.copy())
+
+        if not pixel_data:
+            return (img, None, None)
+        if buffer:
+            return (img, PixelBuffer.from_image(img), None)
+        if img.mode == "RGB":
+            return (img, list(img.getdata()), [255] * mul(*size))
+
+        a = list(img.getdata(3))
+        if round_alpha:
+            threshold = round(alpha * 255)
+            a = [0 if val < threshold else 255 for val in a]
 
-        return (img, *(pixel_data and (rgb, a) or (None, None)))
+        return (img, list(img.convert("RGB").getdata()), a)
 
     @abstractmethod
     def _get_render_size(self) -> Tuple[int, int]:
@@ -1601,6 +2684,16 @@ class BaseImage(metaclass=ImageMeta):
     def _handle_interrupted_draw():
         """Performs any necessary actions when image drawing is interrupted."""
 
+    def _is_source_image(self, img: PIL.Image.Image) -> bool:
+        """Checks if the given PIL image instance was opened directly from the image
+        source (by :py:meth:`_get_image`).
+        """
+        if self._source_type is ImageSource.BUFFER:
+            fp = getattr(img, "fp", None)
+            return isinstance(fp, BufferReader) and fp.buffer is self._source
+
+        return getattr(img, "filename", None) == self._source
+
     @staticmethod
     @abstractmethod
     def _pixels_cols(
@@ -1621,6 +2714,38 @@ class BaseImage(metaclass=ImageMeta):
         """
         raise NotImplementedError
 
+    def _render_cached(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        **style_args: Any,
+    ) -> str:
+        """Same as ``_render_image()`` but reads the output from or writes it to the
+        render cache, if enabled.
+
+        See :py:attr:`render_cache_dir`.
+
+        NOTE:
+            This method is not meant to be used directly, use it via `_renderer()`
+            instead.
+        """
+        cache = _render_cache
+        key = cache and self._get_render_cache_key(alpha, style_args)
+        if key:
+            render = cache.get(key)
+            if render is not None:
+                self._close_image(img)
+                return render
+
+        render = self._render_image(img, alpha, **style_args)
+        if key:
+            try:
+                cache.put(key, render)
+            except OSError as e:
+                warnings.warn(f"Could not cache the render: {e}", TermImageUserWarning)
+
+        return render
+
     @abstractmethod
     def _render_image(
         self,
@@ -1638,6 +2763,30 @@ class BaseImage(metaclass=ImageMeta):
         """
         raise NotImplementedError
 
+    def _render_lines(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        **kwargs: Any,
+    ) -> Generator[str, None, None]:
+        """Converts an image into parts of a string which reproduces the image when
+        printed to the terminal.
+
+        Yields:
+            The parts of the render output (e.g lines), each as soon as it's ready.
+            Concatenated, they're the same as the return value of
+            ``_render_image()``, given the same arguments.
+
+        The default implementation yields the entire output of ``_render_image()``
+        as a single part. Subclasses which can produce their output progressively
+        should override this.
+
+        NOTE:
+            This method is not meant to be used directly, use it via `_renderer()`
+            instead.
+        """
+        yield self._render_image(img, alpha, **kwargs)
+
     def _renderer(
         self,
         renderer: FunctionType,
@@ -1708,6 +2857,17 @@ class BaseImage(metaclass=ImageMeta):
             if isinstance(_size, Size):
                 self.size = _size
 
+    def _uncache_resized(self, keep: Optional[Tuple[int, int]] = None) -> None:
+        """Evicts the images cached for the instance from the resized image cache.
+
+        Args:
+            keep: If given, the images cached for this :term:`rendered size` are kept.
+        """
+        key = id(self)
+        _resize_cache.discard(
+            lambda cache_key: cache_key[0] == key and cache_key[1] != keep
+        )
+
     def _valid_size(
         self,
         width: Union[int, Size, None] = None,
@@ -1984,7 +3144,13 @@ class ImageIterator:
 
           * a boolean, caching is enabled if ``True``. Otherwise, caching is disabled.
           * a positive integer, caching is enabled only if the framecount of the image
-            is less than or equal to the given number.
+            is less than or equal to the given number or *cache_max_bytes* is
+            non-zero.
+
+        prefetch: The maximum number of frames rendered ahead of their use, in a
+          background thread. If zero, frames are rendered only when required.
+        cache_max_bytes: The maximum total size (in bytes) of the cached frames.
+          If zero, the size is unlimited.
 
     Raises:
         TypeError: An argument is of an inappropriate type.
@@ -1999,6 +3165,13 @@ class ImageIterator:
     * Directly adjusting the seek position of the image doesn't affect iteration.
       Use :py:meth:`ImageIterator.seek` instead.
     * After the iterator is exhausted, the underlying image is set to frame ``0``.
+    * Prefetching is useful when rendering a frame may take longer than the
+      frame's duration. Frames are prefetched only until the first loop is complete,
+      if caching is enabled. Prefetched frames are discarded and rendered afresh
+      when :py:meth:`seek` is called or the image size changes.
+    * When the cached frames reach *cache_max_bytes*, subsequent frames are not
+      cached, except in place of frames rendered at a different size. Hence, the
+      frames that fit are reused in every loop. See :py:attr:`cache_info`.
     """
 
     def __init__(
@@ -2007,6 +3180,8 @@ class ImageIterator:
         repeat: int = -1,
         format_spec: str = "",
         cached: Union[bool, int] = 100,
+        prefetch: int = 0,
+        cache_max_bytes: int = 0,
     ) -> None:
         if not isinstance(image, BaseImage):
             raise arg_type_error("image", image)
@@ -2027,13 +3202,31 @@ class ImageIterator:
         if False is not cached <= 0:
             raise arg_value_error_range("cached", cached)
 
+        if not isinstance(prefetch, int) or isinstance(prefetch, bool):
+            raise arg_type_error("prefetch", prefetch)
+        if prefetch < 0:
+            raise arg_value_error_range("prefetch", prefetch)
+
+        if not isinstance(cache_max_bytes, int) or isinstance(cache_max_bytes, bool):
+            raise arg_type_error("cache_max_bytes", cache_max_bytes)
+        if cache_max_bytes < 0:
+            raise arg_value_error_range("cache_max_bytes", cache_max_bytes)
+
         self._image = image
         self._repeat = repeat
         self._format = format_spec
         self._cached = repeat != 1 and (
-            cached if isinstance(cached, bool) else image.n_frames <= cached
+            cached
+            if isinstance(cached, bool)
+            else bool(cache_max_bytes) or image.n_frames <= cached
         )
+        self._prefetch = prefetch
+        self._cache_max_bytes = cache_max_bytes
         self._loop_no = None
+        self._cache = None
+        # Called before each frame is rendered. If it returns ``True``, the frame is
+        # skipped without being rendered.
+        self._skip = None
         self._animator = image._renderer(
             self._animate, alpha, fmt, style_args, check_size=False
         )
@@ -2064,12 +3257,32 @@ class ImageIterator:
 
     def __repr__(self) -> str:
         return (
-            "{}(image={!r}, repeat={}, format_spec={!r}, cached={}, loop_no={})".format(
+            "{}(image={!r}, repeat={}, format_spec={!r}, cached={}, prefetch={}, "
+            "cache_max_bytes={}, loop_no={})".format(
                 type(self).__name__,
                 *self.__dict__.values(),
             )
         )
 
+    cache_info = property(
+        lambda self: None if self._cache is None else self._cache.info(),
+        doc="""Frame cache statistics
+
+        :type: Optional[NamedTuple]
+
+        GET:
+            Returns:
+
+            * ``None``, if caching is disabled or iteration hasn't started.
+            * Otherwise, a named tuple with the fields ``hits``, ``misses``,
+              ``frames`` (the number of cached frames), ``size`` (the total size of
+              the cached frames, in bytes) and ``max_size`` (*cache_max_bytes*).
+
+        The statistics remain available after the iterator is closed, though the
+        cached frames are evicted.
+        """,
+    )
+
     loop_no = property(
         lambda self: self._loop_no,
         doc="""Iteration repeat countdown
@@ -2101,6 +3314,8 @@ class ImageIterator:
             del self._animator
             self._image._close_image(self._img)
             del self._img
+            if self._cache is not None:
+                self._cache.clear()
         except AttributeError:
             pass
 
@@ -2147,44 +3362,96 @@ class ImageIterator:
         cached = self._cached
         self._loop_no = repeat = self._repeat
         if cached:
-            cache = [(None,) * 2] * image.n_frames
+            self._cache = cache = FrameCache(self._cache_max_bytes, sys.getsizeof)
+            n_frames = image.n_frames
 
+        def render(image: BaseImage) -> Tuple[str, int]:
+            key = _frame_cache.max_size and image._get_render_cache_key(
+                alpha, style_args
+            )
+            if key:
+                key = (key, tuple(fmt))
+                frame = _frame_cache.get(key)
+                if frame is not None:
+                    return frame, hash(image.rendered_size)
+
+            frame = image._format_render(
+                image._render_image(img, alpha, frame=True, **style_args), *fmt
+            )
+            if key:
+                _frame_cache.put(key, frame)
+
+            return frame, hash(image.rendered_size)
+
+        def render_ahead(n: int) -> Tuple[str, int]:
+            # Rendered via a copy, such that the image's seek position remains the
+            # number of the last yielded frame. `__new__()` of some render style
+            # classes requires arguments, hence it's bypassed.
+            frame_image = object.__new__(type(image))
+            frame_image.__dict__.update(vars(image))
+            frame_image._closed = True  # Shares resources with the image
+            frame_image._seek_position = n
+            try:
+                return render(frame_image)
+            finally:
+                # Computed once, for subsequent copies
+                if "_source_digest" in vars(frame_image):
+                    image._source_digest = frame_image._source_digest
+
+        if self._prefetch:
+            # Renders may require these but the terminal must not be queried by the
+            # background thread, while frames are being written by this thread
+            get_fg_bg_colors()
+            get_fg_bg_colors(hex=True)
+        prefetcher = self._prefetch and _FramePrefetcher(render_ahead, self._prefetch)
         sent = None
         n = 0
-        while repeat:
-            if sent is None:
-                image._seek_position = n
-                try:
-                    frame = image._format_render(
-                        image._render_image(img, alpha, frame=True, **style_args), *fmt
-                    )
-                except EOFError:
-                    image._seek_position = n = 0
-                    if repeat > 0:  # Avoid infinitely large negative numbers
-                        self._loop_no = repeat = repeat - 1
-                    if cached:
-                        break
-                    continue
-                else:
-                    if cached:
-                        cache[n] = (frame, hash(image.rendered_size))
+        try:
+            while repeat:
+                if sent is None:
+                    if self._skip and n < image.n_frames and self._skip():
+                        n += 1
+                        continue
 
-            sent = yield frame
-            n = n + 1 if sent is None else sent - 1
+                    image._seek_position = n
+                    size_hash = hash(image.rendered_size)
+                    frame = cache.get(n, size_hash) if cached and n < n_frames else None
+                    if frame is None:
+                        try:
+                            frame, size_hash = (
+                                prefetcher.get(n, size_hash)
+                                if prefetcher
+                                else render(image)
+                            )
+                        except EOFError:
+                            image._seek_position = n = 0
+                            if repeat > 0:  # Avoid infinitely large negative numbers
+                                self._loop_no = repeat = repeat - 1
+                            if cached:
+                                break
+                            continue
+                        else:
+                            if cached:
+                                cache.put(n, size_hash, frame)
+
+                sent = yield frame
+                n = n + 1 if sent is None else sent - 1
+        finally:
+            if prefetcher:
+                prefetcher.close()
 
-        if cached:
-            n_frames = len(cache)
         while repeat:
             while n < n_frames:
                 if sent is None:
+                    if self._skip and self._skip():
+                        n += 1
+                        continue
+
                     image._seek_position = n
-                    frame, size_hash = cache[n]
-                    if hash(image.rendered_size) != size_hash:
-                        frame = image._format_render(
-                            image._render_image(img, alpha, frame=True, **style_args),
-                            *fmt,
-                        )
-                        cache[n] = (frame, hash(image.rendered_size))
+                    frame = cache.get(n, hash(image.rendered_size))
+                    if frame is None:
+                        frame, size_hash = render(image)
+                        cache.put(n, size_hash, frame)
 
                 sent = yield frame
                 n = n + 1 if sent is None else sent - 1
@@ -2198,6 +3465,102 @@ class ImageIterator:
             img.seek(0)
 
 
+class _FramePrefetcher:
+    """Renders frames of an animated image ahead of their use, in a background
+    thread.
+
+    Args:
+        render: Returns the rendered frame with the given number and the hash of the
+          rendered size of the image at which it was rendered. Raises
+          :py:class:`EOFError` for the number after that of the last frame.
+        max_frames: The maximum number of frames rendered ahead.
+
+    Frames are rendered in order, starting from frame ``0``, and continue from
+    frame ``0`` after the last frame.
+    """
+
+    def __init__(
+        self, render: Callable[[int], Tuple[str, int]], max_frames: int
+    ) -> None:
+        self._render = render
+        self._max_frames = max_frames
+        # (number, (frame, size_hash) or None, exception or None)
+        self._frames: Deque[
+            Tuple[int, Optional[Tuple[str, int]], Optional[Exception]]
+        ] = deque()
+        self._condition = Condition()
+        self._next = 0  # ``None`` when paused after an error
+        self._generation = 0  # Incremented whenever rendered frames are discarded
+        self._closed = False
+        self._thread = Thread(target=self._run, name="FramePrefetcher", daemon=True)
+        self._thread.start()
+
+    def close(self) -> None:
+        """Stops the background thread, after the frame being rendered, if any."""
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join()
+
+    def get(self, n: int, size_hash: int) -> Tuple[str, int]:
+        """Returns frame *n* rendered at the rendered size with hash *size_hash*,
+        waiting for it to be rendered, if necessary.
+
+        Also propagates exceptions raised while rendering the frame.
+
+        If the next prefetched frame is not the one required, all prefetched frames
+        are discarded and prefetching restarts from frame *n*.
+        """
+        with self._condition:
+            while True:
+                if self._frames:
+                    number, result, error = self._frames[0]
+                    if number == n and (error or result[1] == size_hash):
+                        self._frames.popleft()
+                        self._condition.notify_all()
+                        if error:
+                            raise error
+                        return result
+                    self._restart(n)
+                elif self._next != n:
+                    self._restart(n)
+                self._condition.wait()
+
+    def _restart(self, n: int) -> None:
+        self._frames.clear()
+        self._next = n
+        self._generation += 1
+        self._condition.notify_all()
+
+    def _run(self) -> None:
+        condition = self._condition
+        with condition:
+            while True:
+                while not self._closed and (
+                    self._next is None or len(self._frames) >= self._max_frames
+                ):
+                    condition.wait()
+                if self._closed:
+                    break
+
+                n, generation = self._next, self._generation
+                condition.release()
+                try:
+                    result, error = self._render(n), None
+                except Exception as e:
+                    result, error = None, e
+                finally:
+                    condition.acquire()
+
+                if generation != self._generation:  # Discarded
+                    continue
+                self._frames.append((n, result, error))
+                self._next = (
+                    0 if isinstance(error, EOFError) else None if error else n + 1
+                )
+                condition.notify_all()
+
+
 @atexit.register
 def _cleanup_temp_dir():
     rmtree(_TEMP_DIR, ignore_errors=True)
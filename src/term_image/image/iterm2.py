@@ -9,7 +9,7 @@ import sys
 import warnings
 from base64 import standard_b64encode
 from operator import mul
-from typing import Any, Dict, Optional, Set, Tuple, Union
+from typing import Any, Dict, Generator, Optional, Set, Tuple, Union
 
 import PIL
 
@@ -26,7 +26,7 @@ from ..utils import (
     get_terminal_name_version,
     write_tty,
 )
-from .common import GraphicsImage, ImageMeta, ImageSource
+from .common import BufferReader, GraphicsImage, ImageMeta, ImageSource
 
 # Constants for render methods
 LINES = "lines"
@@ -426,8 +426,9 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
 
         If the value is:
 
-        * ``True``, image data is read directly from file when possible and no image
-          manipulation is required.
+        * ``True``, image data is read directly from file (or from the buffer, for
+          :py:attr:`~term_image.image.ImageSource.BUFFER` sources) when possible and
+          no image manipulation is required.
         * ``False``, images are always re-encoded (in the PNG format by default).
 
         If **unset** for:
@@ -560,7 +561,64 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
         # Konsole sometimes requires ST to be written twice.
         print(ctlseqs.ST * 2, end="", flush=True)
 
+    def _get_render_cache_params(self) -> Tuple[Any, ...]:
+        return (
+            *super()._get_render_cache_params(),
+            self._TERM,
+            self._TERM_VERSION,
+            self.jpeg_quality,
+            self.read_from_file,
+        )
+
+    def _iter_whole(
+        self,
+        compressed_image: io.IOBase,
+        control_data: str,
+        erase: str,
+        cursor_right: str,
+        cursor_up: str,
+    ) -> Generator[str, None, None]:
+        """Yields the parts of the render output of an image transmitted whole.
+
+        Args:
+            compressed_image: The image file, positioned at the start of the data.
+
+        The image data is read, encoded and yielded in chunks, to avoid holding
+        the entire encoded data at once.
+        """
+        r_height = self.rendered_height
+        is_on_konsole = self._TERM == "konsole"
+
+        yield "".join(
+            (
+                "" if is_on_konsole else f"{erase}{cursor_right}\n" * (r_height - 1),
+                erase,
+                "" if is_on_konsole else cursor_up,
+                ITERM2_START,
+                control_data,
+            )
+        )
+        # A multiple of 3 bytes, such that the encoded chunks need no padding
+        while chunk := compressed_image.read(3 * 2**16):
+            yield standard_b64encode(chunk).decode()
+        yield "".join(
+            (
+                ST,
+                f"{cursor_right}\n" * (r_height - 1) if is_on_konsole else "",
+                cursor_right * is_on_konsole,
+            )
+        )
+
     def _render_image(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        **kwargs: Any,
+    ) -> str:
+        """See :py:meth:`_render_lines`."""
+        return "".join(self._render_lines(img, alpha, **kwargs))
+
+    def _render_lines(
         self,
         img: PIL.Image.Image,
         alpha: Union[None, float, str],
@@ -569,10 +627,13 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
         method: Optional[str] = None,
         mix: bool = False,
         compress: int = 4,
-    ) -> str:
-        # NOTE: It's more efficient to write separate strings to the buffer separately
-        # than concatenate and write together.
+    ) -> Generator[str, None, None]:
+        """See :py:meth:`BaseImage._render_lines` for the description of the method
+        and :py:meth:`draw` for parameters not described here.
 
+        Each line is yielded separately with the LINES render method. Otherwise, the
+        image data is encoded and yielded in chunks.
+        """
         # Using `width=<columns>`, `height=<lines>` and `preserveAspectRatio=0` ensures
         # that an image always occupies the correct amount of columns and lines even if
         # the cell size has changed when it's drawn.
@@ -618,6 +679,8 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
                             "iTerm2 native animation not supported: This image was "
                             "sourced from a PIL image with an unknown format"
                         ) from e
+            elif self._source_type is ImageSource.BUFFER:
+                compressed_image = BufferReader(self._source)
             else:
                 compressed_image = open(self._source, "rb")
 
@@ -639,23 +702,10 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
                     )
                 )
                 compressed_image.seek(0)
-                return "".join(
-                    (
-                        (
-                            ""
-                            if is_on_konsole
-                            else f"{erase}{cursor_right}\n" * (r_height - 1)
-                        ),
-                        erase,
-                        "" if is_on_konsole else cursor_up,
-                        ITERM2_START,
-                        control_data,
-                        standard_b64encode(compressed_image.read()).decode(),
-                        ST,
-                        f"{cursor_right}\n" * (r_height - 1) if is_on_konsole else "",
-                        cursor_right * is_on_konsole,
-                    )
+                yield from self._iter_whole(
+                    compressed_image, control_data, erase, cursor_right, cursor_up
                 )
+                return
 
         width, height = (
             self._get_minimal_render_size()
@@ -678,13 +728,17 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
                 or (isinstance(alpha, float) and img.mode not in {"P", "PA"})
             )
         ):
-            compressed_image = open(
-                (
-                    img.filename
-                    if self._source_type is ImageSource.PIL_IMAGE
-                    else self._source
-                ),
-                "rb",
+            compressed_image = (
+                BufferReader(self._source)
+                if self._source_type is ImageSource.BUFFER
+                else open(
+                    (
+                        img.filename
+                        if self._source_type is ImageSource.PIL_IMAGE
+                        else self._source
+                    ),
+                    "rb",
+                )
             )
             frame_img = None
         else:
@@ -727,6 +781,7 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
             )
 
             with io.StringIO() as buffer, raw_image, compressed_image:
+                buf_write = buffer.write
                 for line in range(1, r_height + 1):
                     compressed_image.seek(0)
                     with PIL.Image.frombytes(
@@ -740,18 +795,19 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
                         )
                     compressed_image.truncate()
 
-                    buffer.write(erase)
-                    buffer.write(ITERM2_START)
-                    buffer.write(f"size={compressed_image.tell()}")
-                    buffer.write(control_data)
-                    buffer.write(
-                        standard_b64encode(compressed_image.getvalue()).decode()
-                    )
-                    buffer.write(ST)
-                    is_on_konsole and buffer.write(cursor_right)
-                    line < r_height and buffer.write("\n")
+                    buffer.seek(0)
+                    buffer.truncate()
+                    buf_write(erase)
+                    buf_write(ITERM2_START)
+                    buf_write(f"size={compressed_image.tell()}")
+                    buf_write(control_data)
+                    buf_write(standard_b64encode(compressed_image.getvalue()).decode())
+                    buf_write(ST)
+                    is_on_konsole and buf_write(cursor_right)
+                    line < r_height and buf_write("\n")
+                    yield buffer.getvalue()
 
-                return buffer.getvalue()
+            return
 
         # WHOLE
         with compressed_image:
@@ -764,22 +820,8 @@ class ITerm2Image(GraphicsImage, metaclass=ITerm2ImageMeta):
                 )
             )
             compressed_image.seek(0)
-            return "".join(
-                (
-                    (
-                        ""
-                        if is_on_konsole
-                        else f"{erase}{cursor_right}\n" * (r_height - 1)
-                    ),
-                    erase,
-                    "" if is_on_konsole else cursor_up,
-                    ITERM2_START,
-                    control_data,
-                    standard_b64encode(compressed_image.read()).decode(),
-                    ST,
-                    f"{cursor_right}\n" * (r_height - 1) if is_on_konsole else "",
-                    cursor_right * is_on_konsole,
-                )
+            yield from self._iter_whole(
+                compressed_image, control_data, erase, cursor_right, cursor_up
             )
 
 
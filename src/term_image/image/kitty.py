@@ -3,25 +3,42 @@ from __future__ import annotations
 __all__ = ("KittyImage",)
 
 import io
+import os
 import re
 import sys
 from base64 import standard_b64encode
+from collections import deque
 from dataclasses import asdict, dataclass
-from typing import Any, Dict, Generator, Optional, Set, Tuple, Union
+from operator import itemgetter
+from random import randrange
+from secrets import token_hex
+from tempfile import mkstemp
+from typing import Any, Deque, Dict, Generator, Optional, Set, Tuple, Union
 from zlib import compress, decompress
 
 import PIL
+from PIL import ImageChops
+
+try:
+    from multiprocessing import resource_tracker
+    from multiprocessing.shared_memory import SharedMemory
+except ImportError:  # No POSIX shared memory support
+    SharedMemory = None
 
 from .. import _ctlseqs as ctlseqs
+from .._cache import LRUCache
 
 # These sequences are used during performance-critical operations that occur often
 from .._ctlseqs import (
     CURSOR_FORWARD,
     ERASE_CHARS,
     KITTY_DELETE_CURSOR,
+    KITTY_DELETE_CURSOR_PLACEMENTS,
+    KITTY_DELETE_ID,
     KITTY_TRANSMISSION,
 )
 from ..utils import (
+    ClassProperty,
     arg_type_error,
     arg_value_error_msg,
     arg_value_error_range,
@@ -29,14 +46,73 @@ from ..utils import (
     query_terminal,
     write_tty,
 )
-from .common import GraphicsImage
+from .common import GraphicsImage, ImageMeta
 
 # Constants for render methods
 LINES = "lines"
 WHOLE = "whole"
+ANIM = "anim"
+
+# IDs of images evicted from `_id_cache`, to be deleted with the next render
+_evicted_ids: Deque[int] = deque()
+
+# Images transmitted with an ID and kept by the terminal emulator for re-placement.
+# Maps (render cache key, part) to (image ID, pixel data size).
+# See `KittyImage._render_lines()` and `KittyImage.id_cache_max_bytes`.
+_id_cache: LRUCache[Tuple[str, int], Tuple[int, int]] = LRUCache(
+    0, itemgetter(1), lambda _, entry: _evicted_ids.append(entry[0])
+)
+
+
+# See `KittyImage.transmission_medium`
+_transmission_medium = "direct"
+_MEDIA = ("direct", "temp_file", "shared_memory", "auto")
+
+# The medium detected for "auto", on first use
+_local_medium: Optional[str] = None
+
+
+class KittyImageMeta(ImageMeta):
+    """Type of kitty render style classes."""
+
+    id_cache_max_bytes = ClassProperty(
+        lambda self: _id_cache.max_size,
+        doc="""Memory budget of transmitted images kept for re-placement
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
+
+    @id_cache_max_bytes.setter
+    def id_cache_max_bytes(self, max_bytes: int):
+        if not isinstance(max_bytes, int):
+            raise arg_type_error("id_cache_max_bytes", max_bytes)
+        if max_bytes < 0:
+            raise arg_value_error_range("id_cache_max_bytes", max_bytes)
+
+        _id_cache.max_size = max_bytes
+
+    transmission_medium = ClassProperty(
+        lambda self: _transmission_medium,
+        doc="""Transmission medium of image data
+
+        See the base instance of this metaclass for the complete description.
+        """,
+    )
 
+    @transmission_medium.setter
+    def transmission_medium(self, medium: str):
+        global _transmission_medium
 
-class KittyImage(GraphicsImage):
+        if not isinstance(medium, str):
+            raise arg_type_error("transmission_medium", medium)
+        if medium not in _MEDIA:
+            raise arg_value_error_msg("Unknown transmission medium", medium)
+
+        _transmission_medium = medium
+
+
+class KittyImage(GraphicsImage, metaclass=KittyImageMeta):
     """A render style using the Kitty terminal graphics protocol.
 
     See :py:class:`GraphicsImage` for the complete description of the constructor.
@@ -45,7 +121,7 @@ class KittyImage(GraphicsImage):
 
     **Render Methods**
 
-    :py:class:`KittyImage` provides two methods of :term:`rendering` images, namely:
+    :py:class:`KittyImage` provides three methods of :term:`rendering` images, namely:
 
     LINES (default)
        Renders an image line-by-line i.e the image is evenly split across the number
@@ -66,6 +142,23 @@ class KittyImage(GraphicsImage):
        * Render results are more compact (i.e less in character count) than with
          the **LINES** method since the entire image is encoded at once.
 
+    ANIM
+       Renders an animated image to utilize the protocol's native animation feature.
+
+       Similar to the **WHOLE** render method, except that all frames are
+       transmitted at once and the terminal emulator animates the image, provided it
+       supports the feature of the protocol. Every frame after the first is
+       transmitted as only the region that changed from the previous frame. The gap
+       after each frame is the frame's own duration, if specified by the image file,
+       otherwise the image's :py:attr:`~BaseImage.frame_duration`.
+       The animation is completely controlled by the terminal emulator and loops
+       indefinitely.
+
+       .. note::
+           * If used with :py:class:`~term_image.image.ImageIterator` or an animation,
+             the **WHOLE** render method is used instead.
+           * If the image is non-animated, the **WHOLE** render method is used instead.
+
     The render method can be set with
     :py:meth:`set_render_method() <BaseImage.set_render_method>` using the names
     specified above.
@@ -123,6 +216,7 @@ class KittyImage(GraphicsImage):
 
       * ``L`` → **LINES** render method (current frame only, for animated images)
       * ``W`` → **WHOLE** render method (current frame only, for animated images)
+      * ``A`` → **ANIM** render method
       * *default* → Current effective render method of the image
 
     * ``z`` → graphics/text stacking order
@@ -173,9 +267,9 @@ class KittyImage(GraphicsImage):
     """
 
     _FORMAT_SPEC: Tuple[re.Pattern] = tuple(
-        map(re.compile, r"[LW] z-?\d+ m[01] c[0-9]".split(" "))
+        map(re.compile, r"[LWA] z-?\d+ m[01] c[0-9]".split(" "))
     )
-    _render_methods: Set[str] = {LINES, WHOLE}
+    _render_methods: Set[str] = {LINES, WHOLE, ANIM}
     _default_render_method: str = LINES
     _render_method: str = LINES
     _style_args = {
@@ -228,6 +322,97 @@ class KittyImage(GraphicsImage):
     _TERM_VERSION: str = ""
     _KITTY_VERSION: Tuple[int, int, int] = ()
 
+    id_cache_max_bytes = ClassProperty(
+        lambda self: _id_cache.max_size,
+        doc="""Memory budget of transmitted images kept for re-placement
+
+        :type: int
+
+        GET:
+            Returns the maximum total size (in bytes) of the pixel data of images
+            kept by the terminal emulator for re-placement.
+
+        SET:
+            A non-negative integer sets the memory budget, deleting images as
+            required. ``0`` disables re-placement.
+
+            Can not be set on an instance.
+
+        When enabled, images are transmitted with an image ID, keyed by the source,
+        frame, size, render method and alpha setting of the image. An image is
+        transmitted only the first time it's rendered; subsequent renders with the
+        same key only place the image already transmitted, without reading, resizing
+        or transmitting the image data again.
+
+        When the budget would be exceeded, the least-recently-rendered images are
+        deleted from the terminal emulator (including their placements still on the
+        screen) by the next render output.
+
+        By **default**, re-placement is disabled.
+
+        NOTE:
+            * The budget is shared by all instances of all *kitty* render style
+              classes.
+            * Images initialized from PIL images, frames of animations and native
+              animations are always transmitted anew.
+            * While enabled, :py:meth:`clear`, ``blend=False`` and
+              :py:meth:`UrwidImageScreen.clear_images()
+              <term_image.widget.UrwidImageScreen.clear_images>` only delete
+              placements, such that the data of kept images remains available for
+              re-placement.
+            * While enabled, renders are not read from or written to the render
+              cache, since they depend on the images already transmitted.
+
+        WARNING:
+            The budget should be well below the terminal emulator's storage quota
+            (320 MiB on Kitty), beyond which it deletes images by itself, leaving
+            their subsequent placements blank.
+        """,
+    )
+
+    transmission_medium = ClassProperty(
+        lambda self: _transmission_medium,
+        doc="""Transmission medium of image data
+
+        :type: str
+
+        GET:
+            Returns the transmission medium in use.
+
+        SET:
+            One of the following sets the transmission medium:
+
+            * ``"direct"``: The image data is encoded and written along with the
+              escape sequences.
+            * ``"temp_file"``: The image data is written to a temporary file, whose
+              path is sent to the terminal emulator.
+            * ``"shared_memory"``: The image data is written to a POSIX shared
+              memory object, whose name is sent to the terminal emulator.
+            * ``"auto"``: The first of ``"shared_memory"`` and ``"temp_file"`` that
+              the :term:`active terminal` can read, else ``"direct"``.
+
+            Can not be set on an instance.
+
+        The local media (``"temp_file"`` and ``"shared_memory"``) avoid compressing,
+        encoding and writing the image data through the terminal, but are only
+        usable when the terminal emulator runs on the same host (i.e not over SSH).
+        With ``"auto"``, this is detected with a query, the first time an image is
+        rendered.
+
+        By **default**, the image data is transmitted directly.
+
+        NOTE:
+            * The terminal emulator deletes the file or shared memory object after
+              reading it. Hence, a render output transmitted through a local medium
+              can be drawn **only once**, and such renders are not read from or
+              written to the render cache.
+            * Frames rendered by :py:class:`~term_image.image.ImageIterator` are
+              always transmitted directly, since they may be cached and redrawn.
+            * If the image data can not be written locally, it's transmitted
+              directly.
+        """,
+    )
+
     @classmethod
     def clear(
         cls, *, cursor: bool = False, z_index: Optional[int] = None, now: bool = False
@@ -274,24 +459,34 @@ class KittyImage(GraphicsImage):
             raise arg_value_error_msg(
                 "Only one argument (aside 'now') may be given", len(given_args)
             )
-        elif given_args:
+
+        # The data of images kept for re-placement must not be freed
+        placements_only = bool(_id_cache.max_size)
+        if given_args:
             arg, _ = given_args.pop()
-            (write_tty if now else _stdout_write)(
-                (ctlseqs.KITTY_DELETE_CURSOR_b if now else ctlseqs.KITTY_DELETE_CURSOR)
-                if arg == "cursor"
-                else (
-                    (
-                        ctlseqs.KITTY_DELETE_Z_INDEX_b
-                        if now
-                        else ctlseqs.KITTY_DELETE_Z_INDEX
-                    )
-                    % z_index
+            if arg == "cursor":
+                delete = (
+                    ctlseqs.KITTY_DELETE_CURSOR_PLACEMENTS
+                    if placements_only
+                    else ctlseqs.KITTY_DELETE_CURSOR
                 )
+            else:
+                delete = (
+                    ctlseqs.KITTY_DELETE_Z_INDEX_PLACEMENTS
+                    if placements_only
+                    else ctlseqs.KITTY_DELETE_Z_INDEX
+                ) % z_index
+        else:
+            delete = (
+                ctlseqs.KITTY_DELETE_ALL_PLACEMENTS
+                if placements_only
+                else ctlseqs.KITTY_DELETE_ALL
             )
-        elif now:
-            write_tty(ctlseqs.KITTY_DELETE_ALL_b)
+
+        if now:
+            write_tty(delete.encode())
         else:
-            _stdout_write(ctlseqs.KITTY_DELETE_ALL)
+            _stdout_write(delete)
 
     @classmethod
     def is_supported(cls) -> bool:
@@ -343,7 +538,7 @@ class KittyImage(GraphicsImage):
         if parent:
             args.update(super()._check_style_format_spec(parent, original))
         if method:
-            args["method"] = LINES if method == "L" else WHOLE
+            args["method"] = {"L": LINES, "W": WHOLE, "A": ANIM}[method]
         if z_index:
             args["z_index"] = int(z_index[1:])
         if mix:
@@ -395,7 +590,128 @@ class KittyImage(GraphicsImage):
         # Konsole sometimes requires ST to be written twice.
         print(ctlseqs.ST * 2 + ctlseqs.KITTY_END_CHUNKED, end="", flush=True)
 
+    def _get_render_cache_params(self) -> Tuple[Any, ...]:
+        return (*super()._get_render_cache_params(), self._TERM, self._TERM_VERSION)
+
+    def _iter_native_anim(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        *,
+        z_index: int,
+        mix: bool,
+        compress: int,
+        blend: bool,
+    ) -> Generator[str, None, None]:
+        """Yields the transmission chunks of a native animation.
+
+        The first frame is transmitted and displayed as the root frame of a new image.
+        Every other frame is transmitted as the region that changed from the previous
+        frame, composed onto a copy of the previous frame by the terminal emulator.
+        Finally, the animation is started.
+        """
+        r_width, r_height = self.rendered_size
+        width, height = self._get_minimal_render_size()
+        image_id = _new_image_id()
+        medium = _get_medium()
+        fill = ("" if mix else ERASE_CHARS % r_width) + (CURSOR_FORWARD % r_width)
+
+        prev_seek_pos = self._seek_position
+        prev_frame = None
+        try:
+            for n in range(self.n_frames):
+                self._seek_position = n
+                frame_img = self._get_render_data(
+                    img, alpha, size=(width, height), pixel_data=False, frame=True
+                )[0]
+                # The frame's own duration, if any, since GIF and WEBP frames may
+                # have different durations
+                gap = round(img.info.get("duration") or self._frame_duration * 1000)
+                if frame_img is img:  # *img* is seeked to the next frame
+                    frame_img = img.copy()
+
+                if prev_frame is None:
+                    control_data = ControlData(
+                        f=getattr(f, frame_img.mode),
+                        t=medium,
+                        s=width,
+                        v=height,
+                        c=r_width,
+                        r=r_height,
+                        z=z_index,
+                        i=image_id,
+                        q=2,
+                    )
+                    if not blend:
+                        yield KITTY_DELETE_CURSOR
+                    yield from Transmission(
+                        control_data, frame_img.tobytes(), compress
+                    ).get_chunks()
+                    # The gap of the root frame
+                    yield KITTY_TRANSMISSION % (f"a=a,i={image_id},r=1,z={gap},q=2", "")
+                else:
+                    if frame_img.mode != prev_frame.mode:
+                        prev_frame, frame_img = (
+                            prev_frame.convert("RGBA"),
+                            frame_img.convert("RGBA"),
+                        )
+                    # An unchanged frame still has to be transmitted
+                    box = _get_changed_box(prev_frame, frame_img) or (0, 0, 1, 1)
+                    with frame_img.crop(box) as region:
+                        control_data = ControlData(
+                            a=a.TRANS_FRAMES,
+                            f=getattr(f, region.mode),
+                            t=medium,
+                            s=region.width,
+                            v=region.height,
+                            z=gap,
+                            C=None,
+                            c=n,  # The previous frame
+                            i=image_id,
+                            q=2,
+                            x=box[0],
+                            y=box[1],
+                            X=X.REPLACE,
+                        )
+                        payload = region.tobytes()
+                    yield from Transmission(
+                        control_data, payload, compress
+                    ).get_chunks()
+                    prev_frame.close()
+
+                prev_frame = frame_img
+        finally:
+            if prev_frame is not None:
+                prev_frame.close()
+            self._seek_position = prev_seek_pos
+            self._close_image(img)
+
+        # Loop indefinitely
+        yield KITTY_TRANSMISSION % (f"a=a,i={image_id},s=3,v=1,q=2", "")
+        yield f"{fill}\n" * (r_height - 1) + fill
+
+    def _render_cached(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        **style_args: Any,
+    ) -> str:
+        # Renders depend on the images already transmitted, while re-placement is
+        # enabled, and can be drawn only once, with a local transmission medium
+        if _id_cache.max_size or _get_medium() != t.DIRECT:
+            return self._render_image(img, alpha, **style_args)
+        return super()._render_cached(img, alpha, **style_args)
+
     def _render_image(
+        self,
+        img: PIL.Image.Image,
+        alpha: Union[None, float, str],
+        **kwargs: Any,
+    ) -> str:
+        """See :py:meth:`_render_lines`."""
+        return "".join(self._render_lines(img, alpha, **kwargs))
+
+    def _render_lines(
         self,
         img: PIL.Image.Image,
         alpha: Union[None, float, str],
@@ -406,18 +722,17 @@ class KittyImage(GraphicsImage):
         mix: bool = False,
         compress: int = 4,
         blend: bool = True,
-    ) -> str:
-        """See :py:meth:`BaseImage._render_image` for the description of the method and
-        :py:meth:`draw` for parameters not described here.
+    ) -> Generator[str, None, None]:
+        """See :py:meth:`BaseImage._render_lines` for the description of the method
+        and :py:meth:`draw` for parameters not described here.
+
+        Each transmission chunk is yielded separately.
 
         Args:
             blend: If ``False``, the rendered image deletes overlapping/intersecting
               images when drawn. Otherwise, the behaviour is dependent on the z-index
               and/or the terminal emulator (for images with the same z-index).
         """
-        # NOTE: It's more efficient to write separate strings to the buffer separately
-        # than concatenate and write together.
-
         # Using `c` and `r` ensures that an image always occupies the correct amount
         # of columns and lines even if the cell size has changed when it's drawn.
         # Since we use `c` and `r` control data keys, there's no need upscaling the
@@ -432,61 +747,99 @@ class KittyImage(GraphicsImage):
         # Hence, this optimization is only used for the WHOLE render method.
 
         render_method = (method or self._render_method).lower()
+        if render_method == ANIM:
+            if self._is_animated and not frame:
+                yield from self._iter_native_anim(
+                    img, alpha, z_index=z_index, mix=mix, compress=compress, blend=blend
+                )
+                return
+            render_method = WHOLE
+
+        # Not with frames, since they may be cached and reused
+        while _evicted_ids and not frame:
+            yield KITTY_DELETE_ID % _evicted_ids.popleft()
+
         r_width, r_height = self.rendered_size
-        width, height = (
-            self._get_minimal_render_size()
-            if render_method == WHOLE
-            else self._get_render_size()
-        )
+        n_parts, rows = (r_height, 1) if render_method == LINES else (1, r_height)
 
-        frame_img = img if frame else None
-        img = self._get_render_data(
-            img, alpha, size=(width, height), pixel_data=False, frame=frame  # fmt: skip
-        )[0]
-        format = getattr(f, img.mode)
-        raw_image = img.tobytes()
+        # See `id_cache_max_bytes`
+        cache_key = (
+            not frame
+            and _id_cache.max_size
+            and self._get_render_cache_key(alpha, {"method": render_method})
+        )
+        if cache_key:
+            delete = KITTY_DELETE_CURSOR_PLACEMENTS
+            entries = [_id_cache.get((cache_key, part)) for part in range(n_parts)]
+        else:
+            delete = KITTY_DELETE_CURSOR
+            entries = [None] * n_parts
 
-        # clean up (ImageIterator uses one PIL image throughout)
-        if frame_img is not img:
+        if all(entries):  # Only placements, the image data isn't required
             self._close_image(img)
+            parts = entries
+        else:
+            width, height = (
+                self._get_minimal_render_size()
+                if render_method == WHOLE
+                else self._get_render_size()
+            )
+
+            frame_img = img if frame else None
+            img = self._get_render_data(
+                img, alpha, size=(width, height), pixel_data=False, frame=frame
+            )[0]
+            format = getattr(f, img.mode)
+            raw_image = img.tobytes()
+
+            # clean up (ImageIterator uses one PIL image throughout)
+            if frame_img is not img:
+                self._close_image(img)
+
+            control_data = ControlData(
+                f=format,
+                t=t.DIRECT if frame else _get_medium(),
+                s=width,
+                c=r_width,
+                z=z_index,
+            )
+            if render_method == LINES:
+                cell_height = height // r_height
+                bytes_per_line = width * cell_height * (format // 8)
+                vars(control_data).update(v=cell_height, r=1)
+                parts = [
+                    raw_image[start : start + bytes_per_line]
+                    for start in range(0, bytes_per_line * r_height, bytes_per_line)
+                ]
+            else:
+                vars(control_data).update(v=height, r=r_height)
+                parts = [raw_image]
 
-        control_data = ControlData(f=format, s=width, c=r_width, z=z_index)
         fill = ("" if mix else ERASE_CHARS % r_width) + (CURSOR_FORWARD % r_width)
         fill_newline = fill + "\n"
 
-        if render_method == LINES:
-            cell_height = height // r_height
-            bytes_per_line = width * cell_height * (format // 8)
-            vars(control_data).update(v=cell_height, r=1)
+        for part, (entry, data) in enumerate(zip(entries, parts)):
+            if not blend:
+                yield delete
 
-            with io.StringIO() as buffer, io.BytesIO(raw_image) as raw_image:
-                trans = Transmission(
-                    control_data, raw_image.read(bytes_per_line), compress
+            if entry:
+                yield KITTY_TRANSMISSION % (
+                    f"a=p,i={entry[0]},c={r_width},r={rows},z={z_index},C=1,q=2",
+                    "",
                 )
-                blend or buffer.write(KITTY_DELETE_CURSOR)
-                for chunk in trans.get_chunks():
-                    buffer.write(chunk)
-                for _ in range(r_height - 1):
-                    buffer.write(fill_newline)
-                    trans = Transmission(
-                        control_data, raw_image.read(bytes_per_line), compress
-                    )
-                    blend or buffer.write(KITTY_DELETE_CURSOR)
-                    for chunk in trans.get_chunks():
-                        buffer.write(chunk)
-                buffer.write(fill)
-
-                return buffer.getvalue()
-
-        vars(control_data).update(v=height, r=r_height)
-        return "".join(
-            (
-                KITTY_DELETE_CURSOR * (not blend),
-                Transmission(control_data, raw_image, compress).get_chunked(),
-                fill_newline * (r_height - 1),
-                fill,
+            # A part larger than the budget would be deleted by the next render
+            elif cache_key and len(data) <= _id_cache.max_size:
+                image_id = control_data.i = _new_image_id()
+                control_data.q = 2
+                yield from Transmission(control_data, data, compress).get_chunks()
+                _id_cache.put((cache_key, part), (image_id, len(data)))
+            else:
+                control_data.i = control_data.q = None
+                yield from Transmission(control_data, data, compress).get_chunks()
+
+            yield fill_newline * (rows - 1) + (
+                fill_newline if part < n_parts - 1 else fill
             )
-        )
 
 
 @dataclass
@@ -509,6 +862,18 @@ class Transmission:
 
     def __post_init__(self):
         self._compressed = False
+        if self.control.t != t.DIRECT:
+            size = len(self.payload)
+            try:
+                self.payload = _write_local(self.control.t, self.payload)
+            except OSError:
+                self.control.t = t.DIRECT
+            else:
+                self.control.S = size
+                self.control.o = None
+                return
+
+        self.control.S = None
         if self.level:
             self.compress()
         else:
@@ -595,6 +960,11 @@ class t:
     SHARED = "s"
 
 
+class X:
+    BLEND = 0
+    REPLACE = 1
+
+
 class z:
     BEHIND = -1
     IN_FRONT = 0
@@ -615,33 +985,186 @@ class ControlData:
 
     # # Image display size in columns and rows/lines
     # # The image is shrunk or enlarged to fit
-    c: Optional[int] = None  # columns
+    c: Optional[int] = None  # columns; base frame number, with a=f
     r: Optional[int] = None  # rows
 
+    i: Optional[int] = None  # image ID
+    q: Optional[int] = None  # response suppression
+
+    # # Frame data origin (px) within the frame, with a=f
+    x: Optional[int] = None
+    y: Optional[int] = None
+    X: Optional[int] = None  # frame composition mode, with a=f
+
+    S: Optional[int] = None  # data size in bytes; with t=s or t=t
+
     def __post_init__(self):
         if self.f == f.PNG:
             self.s = self.v = None
 
 
 class _ControlData:  # Currently Unused
-    i: Optional[int] = None  # image ID
     d: Optional[str] = None  # delete images
     m: Optional[int] = None  # payload chunk
     O: Optional[int] = None  # data start offset; with t=s or t=f
-    S: Optional[int] = None  # data size in bytes; with f=100,o=z or t=s or t=f
+    # `S` (data size) is used by `ControlData`
 
     # Origin offset (px) within the current cell; Must be less than the cell size
     # (0, 0) == Top-left corner of the cell; Not used with `c` and `r`.
-    X: Optional[int] = None
+    # `X` is also used by `ControlData`, as the frame composition mode.
     Y: Optional[int] = None
 
     # Image crop (px)
-    # # crop origin; (0, 0) == top-left corner of the image
-    x: Optional[int] = None
-    y: Optional[int] = None
+    # # crop origin (`x`, `y`) is used by `ControlData`, as the frame data origin
     # # crop rectangle size
     w: Optional[int] = None
     h: Optional[int] = None
 
 
+def _get_changed_box(
+    prev: PIL.Image.Image, image: PIL.Image.Image
+) -> Optional[Tuple[int, int, int, int]]:
+    """Returns the bounding box of the region of *image* that differs from *prev*
+    or ``None``, if they're identical.
+
+    Both images must be of the same mode and size.
+    """
+    boxes = [
+        box
+        for band in ImageChops.difference(prev, image).split()
+        if (box := band.getbbox())
+    ]
+    if not boxes:
+        return None
+
+    lefts, tops, rights, bottoms = zip(*boxes)
+    return min(lefts), min(tops), max(rights), max(bottoms)
+
+
+def _new_image_id() -> int:
+    """Returns a random image ID.
+
+    A random ID makes it unlikely to replace images transmitted by other programs.
+    """
+    return randrange(1, 1 << 32)
+
+
+def _detect_local_medium() -> str:
+    """Returns the first local transmission medium the active terminal can read
+    from or ``"direct"``, if it can read from none (e.g it's on another host) or
+    doesn't respond.
+    """
+    names = {}
+    for medium in (t.SHARED, t.TEMP):
+        try:
+            names[medium] = _write_local(medium, b"\0\0\0")
+        except OSError:
+            pass
+    if not names:
+        return "direct"
+
+    # Kitty graphics queries + terminal attribute query (see `is_supported()`)
+    query = "".join(
+        KITTY_TRANSMISSION
+        % (
+            f"a=q,t={medium},i={image_id},f=24,s=1,v=1,S=3",
+            standard_b64encode(name).decode(),
+        )
+        for image_id, (medium, name) in enumerate(names.items(), 32)
+    )
+    try:
+        response = query_terminal(
+            query.encode() + ctlseqs.DA1_b, lambda s: not s.endswith(b"c")
+        )
+    finally:
+        # Not deleted by the terminal emulator if not read
+        for medium, name in names.items():
+            _remove_local(medium, name)
+
+    readable = {
+        int(match["id"])
+        for match in ctlseqs.KITTY_RESPONSE_re.finditer(
+            (response or b"").decode(errors="replace")
+        )
+        if match["message"] == "OK"
+    }
+    for image_id, medium in enumerate(names, 32):
+        if image_id in readable:
+            return {t.SHARED: "shared_memory", t.TEMP: "temp_file"}[medium]
+
+    return "direct"
+
+
+def _get_medium() -> str:
+    """Returns the value of the ``t`` control data key for the transmission medium
+    in use.
+    """
+    global _local_medium
+
+    medium = _transmission_medium
+    if medium == "auto":
+        if _local_medium is None:
+            _local_medium = _detect_local_medium()
+        medium = _local_medium
+
+    return {"direct": t.DIRECT, "temp_file": t.TEMP, "shared_memory": t.SHARED}[medium]
+
+
+def _remove_local(medium: str, name: bytes) -> None:
+    """Removes a file or shared memory object written by :py:func:`_write_local`."""
+    try:
+        if medium == t.TEMP:
+            os.remove(name)
+        else:
+            # `SharedMemory` prepends the leading slash itself
+            shm = SharedMemory(name.decode().lstrip("/"))
+            shm.close()
+            shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+def _write_local(medium: str, data: bytes) -> bytes:
+    """Writes *data* to a temporary file or a POSIX shared memory object.
+
+    Args:
+        medium: The value of the ``t`` control data key; either ``t.TEMP`` or
+          ``t.SHARED``.
+        data: The data to be written.
+
+    Returns:
+        The path of the file or the name of the shared memory object.
+
+    Raises:
+        OSError: The data could not be written.
+
+    The file or object is left for the terminal emulator to delete, after reading it.
+    """
+    if medium == t.TEMP:
+        # The path must contain this string for the terminal emulator to delete it
+        fd, path = mkstemp(prefix="tty-graphics-protocol-")
+        with os.fdopen(fd, "wb") as file:
+            file.write(data)
+        return os.fsencode(path)
+
+    if SharedMemory is None:
+        raise OSError("POSIX shared memory is not supported")
+
+    # Short enough for the name length limit on macOS.
+    # `SharedMemory` prepends the leading slash required by `shm_open()`.
+    name = f"term-image-{token_hex(8)}"
+    if sys.version_info >= (3, 13):
+        shm = SharedMemory(name, create=True, size=len(data), track=False)
+    else:
+        shm = SharedMemory(name, create=True, size=len(data))
+        # Otherwise, it's unlinked when this process exits, possibly before it's read
+        resource_tracker.unregister(shm._name, "shared_memory")
+    try:
+        shm.buf[: len(data)] = data
+    finally:
+        shm.close()
+
+    return f"/{name}".encode()
+
+
 _stdout_write = sys.stdout.write
@@ -6,10 +6,12 @@ from __future__ import annotations
 
 __all__ = ("RenderIterator", "RenderIteratorError", "FinalizedIteratorError")
 
-from collections.abc import Generator
+import sys
+from collections.abc import Callable, Generator
 
 from typing_extensions import Any, Self
 
+from .._cache import CacheInfo, FrameCache
 from ..exceptions import TermImageError
 from ..geometry import Size, _Size
 from ..padding import AlignedPadding, ExactPadding, Padding
@@ -58,13 +60,22 @@ class RenderIterator:
         cache: Determines if :term:`rendered` frames are cached.
 
           If the value is ``True`` or a positive integer greater than or equal to the
-          frame count of *renderable*, caching is enabled. Otherwise i.e ``False`` or
-          a positive integer less than the frame count, caching is disabled.
+          frame count of *renderable* (or any positive integer, if *cache_max_bytes*
+          is non-zero), caching is enabled. Otherwise i.e ``False`` or a positive
+          integer less than the frame count, caching is disabled.
 
           .. note::
             The value is ignored and taken to be ``False``, if *renderable* has
             :py:class:`~term_image.renderable.FrameCount.INDEFINITE` frame count.
 
+        cache_max_bytes: The maximum total size (in bytes) of the :term:`render
+          outputs` of cached frames. If zero, the size is unlimited.
+
+          When the cached frames reach this size, subsequent frames are not cached,
+          except in place of frames rendered with different render size, frame
+          duration or render arguments. Hence, the frames that fit are reused in
+          every loop. See :py:attr:`cache_info`.
+
     Raises:
         ValueError: An argument has an invalid value.
         IncompatibleRenderArgsError: Incompatible render arguments.
@@ -113,6 +124,8 @@ class RenderIterator:
         Modifying this doesn't affect the iterator.
     """
 
+    _cache: FrameCache[Frame] | None
+    _cache_max_bytes: int
     _cached: bool
     _closed: bool
     _finalize_data: bool
@@ -124,6 +137,9 @@ class RenderIterator:
     _render_data: RenderData
     _renderable: Renderable
     _renderable_data: RenderableData
+    # Called before each frame is rendered, if the frame count is *definite*. If it
+    # returns ``True``, the frame is skipped without being rendered.
+    _skip: Callable[[], bool] | None
 
     # Special Methods ==========================================================
 
@@ -134,8 +150,9 @@ class RenderIterator:
         padding: Padding = ExactPadding(),
         loops: int = 1,
         cache: bool | int = 100,
+        cache_max_bytes: int = 0,
     ) -> None:
-        self._init(renderable, render_args, padding, loops, cache)
+        self._init(renderable, render_args, padding, loops, cache, cache_max_bytes)
         self._iterator, self._padding = renderable._init_render_(
             self._iterate, render_args, padding, iteration=True, finalize=False
         )
@@ -175,6 +192,26 @@ class RenderIterator:
             f"loop={self.loop}, cached={self._cached}>"
         )
 
+    # Properties ===============================================================
+
+    @property
+    def cache_info(self) -> CacheInfo | None:
+        """Frame cache statistics
+
+        GET:
+            Returns either
+
+            * ``None``, if caching is disabled, or
+            * a named tuple with the fields ``hits``, ``misses``, ``frames`` (the
+              number of cached frames), ``size`` (the total size of the render
+              outputs of the cached frames, in bytes) and ``max_size``
+              (*cache_max_bytes*).
+
+        The statistics remain available after the iterator is finalized, though the
+        cached frames are evicted.
+        """
+        return None if self._cache is None else self._cache.info()
+
     # Public Methods ===========================================================
 
     def close(self) -> None:
@@ -194,6 +231,8 @@ class RenderIterator:
             if self._finalize_data:
                 self._render_data.finalize()
             del self._render_data
+            if self._cache is not None:
+                self._cache.clear()
             self._closed = True
 
     def seek(self, offset: int, whence: Seek = Seek.START) -> None:
@@ -512,6 +551,7 @@ class RenderIterator:
         padding: Padding = ExactPadding(),
         loops: int = 1,
         cache: bool | int = 100,
+        cache_max_bytes: int = 0,
     ) -> None:
         """Partially initializes an instance.
 
@@ -523,6 +563,8 @@ class RenderIterator:
             raise arg_value_error("loops", loops)
         if False is not cache <= 0:
             raise arg_value_error_range("cache", cache)
+        if cache_max_bytes < 0:
+            raise arg_value_error_range("cache_max_bytes", cache_max_bytes)
 
         indefinite = renderable.frame_count is FrameCount.INDEFINITE
         self._closed = False
@@ -536,9 +578,15 @@ class RenderIterator:
                 # `isinstance` is much costlier on failure and `bool` cannot be
                 # subclassed
                 if type(cache) is bool
-                else renderable.frame_count <= cache  # type: ignore[operator]
+                else (
+                    bool(cache_max_bytes)
+                    or renderable.frame_count <= cache  # type: ignore[operator]
+                )
             )
         )
+        self._cache_max_bytes = cache_max_bytes
+        self._cache = None
+        self._skip = None
 
     def _iterate(
         self,
@@ -562,9 +610,11 @@ class RenderIterator:
         loop = self.loop
         CURRENT = Seek.CURRENT
         renderable_data.frame_offset = 0
-        cache: list[tuple[Frame | None, Size, int | FrameDuration, RenderArgs]] | None
-        cache = (
-            [(None,) * 4] * frame_count  # type: ignore[list-item]
+        cache: FrameCache[Frame] | None
+        self._cache = cache = (
+            FrameCache(
+                self._cache_max_bytes, lambda frame: sys.getsizeof(frame.render_output)
+            )
             if self._cached
             else None
         )
@@ -578,17 +628,24 @@ class RenderIterator:
         frame_no = renderable_data.frame_offset * definite
         while loop:
             while frame_no < frame_count:
-                if cache:
-                    frame = (cache_entry := cache[frame_no])[0]
-                    frame_details = cache_entry[1:]
-                else:
-                    frame = None
-
-                if not frame or frame_details != (
-                    renderable_data.size,
-                    renderable_data.duration,
-                    self._render_args,
-                ):
+                if definite and self._skip and self._skip():
+                    frame_no = renderable_data.frame_offset = frame_no + 1
+                    continue
+
+                frame = (
+                    None
+                    if cache is None
+                    else cache.get(
+                        frame_no,
+                        (
+                            renderable_data.size,
+                            renderable_data.duration,
+                            self._render_args,
+                        ),
+                    )
+                )
+
+                if frame is None:
                     # NOTE: Re-render is required even when only `duration` changes
                     # and the new value is *static* because frame duration may affect
                     # the render output of some renderables.
@@ -603,12 +660,15 @@ class RenderIterator:
                         self.loop = 0
                         return
 
-                    if cache:
-                        cache[frame_no] = (
+                    if cache is not None:
+                        cache.put(
+                            frame_no,
+                            (
+                                renderable_data.size,
+                                renderable_data.duration,
+                                self._render_args,
+                            ),
                             frame,
-                            renderable_data.size,
-                            renderable_data.duration,
-                            self._render_args,
                         )
 
                 if self._padded_size != frame.render_size:
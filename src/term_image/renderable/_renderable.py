@@ -9,7 +9,6 @@ __all__ = ("Renderable", "RenderableData", "OptionalPaddingT")
 import sys
 from abc import ABCMeta, abstractmethod
 from collections.abc import Callable
-from time import perf_counter_ns, sleep
 from types import MappingProxyType
 
 from typing_extensions import Any, ClassVar, Literal, TextIO, TypeVar, overload
@@ -18,6 +17,7 @@ import term_image
 
 from .. import geometry
 from .._ctlseqs import HIDE_CURSOR, SHOW_CURSOR, cursor_down, cursor_forward, cursor_up
+from .._scheduler import FrameScheduler
 from ..geometry import Size
 from ..padding import AlignedPadding, ExactPadding, Padding
 from ..utils import arg_value_error_range, get_terminal_size
@@ -341,6 +341,7 @@ been initialized
     animated: bool
     """``True`` if the renderable is :term:`animated`. Otherwise, ``False``."""
 
+    _dropped_frames: int | None
     _frame: int
     _frame_count: int | FrameCount
     _frame_duration: int | FrameDuration
@@ -363,6 +364,7 @@ been initialized
         self.animated = frame_count != 1
         self._frame_count = frame_count
         self._frame = 0
+        self._dropped_frames = None
 
     def __iter__(self) -> term_image.render.RenderIterator:
         """Returns a render iterator.
@@ -403,6 +405,22 @@ been initialized
 
     # Properties ===============================================================
 
+    @property
+    def dropped_frames(self) -> int | None:
+        """Frames dropped by the last animation
+
+        GET:
+            Returns either
+
+            * the number of frames dropped (i.e not drawn) by the last animation of
+              the renderable drawn with :py:meth:`draw`, to keep it in sync with the
+              wall clock, or
+            * ``None``, if the renderable has never been animated.
+
+        See the *frame_skip* parameter of :py:meth:`draw`.
+        """
+        return self._dropped_frames
+
     @property
     def frame_count(self) -> int | Literal[FrameCount.INDEFINITE]:
         """Frame count
@@ -480,6 +498,7 @@ been initialized
         animate: bool = True,
         loops: int = -1,
         cache: bool | int = 100,
+        frame_skip: int = 0,
         check_size: bool = True,
         allow_scroll: bool = False,
         hide_cursor: bool = True,
@@ -496,6 +515,10 @@ been initialized
               (applies to **animations only**).
             cache: See :py:class:`~term_image.render.RenderIterator`.
               (applies to **animations only**).
+            frame_skip: The maximum number of consecutive frames that may be dropped
+              (i.e not drawn), when they're rendered only after their duration has
+              elapsed, to keep the animation in sync with the wall clock (applies to
+              **animations only**). See :py:attr:`dropped_frames`.
             check_size: Whether to validate the padded :term:`render size` of
               **non-animations**.
             allow_scroll: Whether to validate the padded :term:`render height` of
@@ -563,7 +586,14 @@ been initialized
 
             if animation:
                 self._animate_(
-                    render_data, real_render_args, padding, loops, cache, output
+                    render_data,
+                    real_render_args,
+                    padding,
+                    loops,
+                    cache,
+                    output,
+                    # Overrides predating the parameter don't accept it
+                    **({"frame_skip": frame_skip} if frame_skip else {}),
                 )
             else:
                 frame = self._render_(render_data, real_render_args)
@@ -703,6 +733,8 @@ been initialized
         loops: int,
         cache: bool | int,
         output: TextIO,
+        *,
+        frame_skip: int = 0,
     ) -> None:
         """Animates frames of a renderable.
 
@@ -722,13 +754,18 @@ been initialized
             * :term:`Render size` validation is expected to have been performed by
               the caller.
             * When called by :py:meth:`draw` (at least, the base implementation),
-              *loops* and *cache* wouldn't have been validated.
+              *loops*, *cache* and *frame_skip* wouldn't have been validated.
+            * :py:meth:`draw` passes *frame_skip* only if it's non-zero, such that
+              overrides without the parameter remain compatible.
+            * The base implementation sets the number of frames dropped as
+              :py:attr:`dropped_frames`.
         """
         from term_image.render import RenderIterator
 
         render_size: Size = render_data[Renderable].size
         height = render_size.height
         pad_left, _, _, pad_bottom = padding._get_exact_dimensions_(render_size)
+        scheduler = FrameScheduler(frame_skip)
         render_iter = RenderIterator._from_render_data_(
             self,
             render_data,
@@ -753,6 +790,7 @@ been initialized
             except StopIteration:  # `INDEFINITE` frame count
                 return
 
+            scheduler.start(frame.duration * 10**6)
             try:
                 write(frame.render_output)
                 flush()
@@ -773,15 +811,17 @@ been initialized
             # needed henceforth.
             render_iter.set_padding(NO_PADDING)
 
-            # render next frame during previous frame's duration
-            duration_ms = frame.duration
-            start_ns = perf_counter_ns()
+            if frame_skip:
+                # Late frames are dropped before they're rendered. The duration of
+                # a frame is unknown until it's rendered, hence that of the last
+                # rendered frame is assumed.
+                render_iter._skip = lambda: scheduler.skip(frame.duration * 10**6)
 
+            # render next frame during previous frame's duration
             for frame in render_iter:  # Render next frame
                 # left-over of previous frame's duration
-                sleep(
-                    max(0, duration_ms * 10**6 - (perf_counter_ns() - start_ns)) / 10**9
-                )
+                if not scheduler.wait(frame.duration * 10**6):
+                    continue
 
                 # clear previous frame, if necessary
                 self._clear_frame_(render_data, render_args, pad_left + 1, output)
@@ -797,15 +837,12 @@ been initialized
                 write(cursor_to_render_top_left)
                 flush()
 
-                # render next frame during previous frame's duration
-                start_ns = perf_counter_ns()
-                duration_ms = frame.duration
-
             # left-over of last frame's duration
-            sleep(max(0, duration_ms * 10**6 - (perf_counter_ns() - start_ns)) / 10**9)
+            scheduler.finish()
         except KeyboardInterrupt:
             pass
         finally:
+            self._dropped_frames = scheduler.dropped
             render_iter.close()
             if first_frame_written:
                 # Move the cursor to the last line to prevent "overlaid" output
@@ -146,7 +146,7 @@ class UrwidImage(urwid.Widget):
         try:
             render = image._format_render(
                 image._renderer(
-                    image._render_image, self._ti_alpha, **self._ti_style_args
+                    image._render_cached, self._ti_alpha, **self._ti_style_args
                 ),
                 self._ti_h_align,
                 size[0],
@@ -535,6 +535,15 @@ class UrwidImageScreen(urwid.raw_display.Screen):
         if not (KittyImage.forced_support or KittyImage.is_supported()):
             return
 
+        # The data of images kept for re-placement must not be freed
+        # See `KittyImage.id_cache_max_bytes`
+        if KittyImage.id_cache_max_bytes:
+            delete_z_index = ctlseqs.KITTY_DELETE_Z_INDEX_PLACEMENTS
+            delete_all = ctlseqs.KITTY_DELETE_ALL_PLACEMENTS
+        else:
+            delete_z_index = ctlseqs.KITTY_DELETE_Z_INDEX
+            delete_all = ctlseqs.KITTY_DELETE_ALL
+
         if widgets:
             # Better to send the delete commands in a batch than individually
             kitty_widgets = []
@@ -547,25 +556,18 @@ class UrwidImageScreen(urwid.raw_display.Screen):
                     widget._ti_change_disguise()
 
             if kitty_widgets:
+                delete = "".join(
+                    delete_z_index % widget._ti_z_index for widget in kitty_widgets
+                )
                 if now:
-                    write_tty(
-                        b"".join(
-                            ctlseqs.KITTY_DELETE_Z_INDEX_b % widget._ti_z_index
-                            for widget in kitty_widgets
-                        )
-                    )
+                    write_tty(delete.encode())
                 else:
-                    self.write(
-                        "".join(
-                            ctlseqs.KITTY_DELETE_Z_INDEX % widget._ti_z_index
-                            for widget in kitty_widgets
-                        )
-                    )
+                    self.write(delete)
         else:
             if now:
-                write_tty(ctlseqs.KITTY_DELETE_ALL_b)
+                write_tty(delete_all.encode())
             else:
-                self.write(ctlseqs.KITTY_DELETE_ALL)
+                self.write(delete_all)
             UrwidImageCanvas._ti_change_disguise()
 
     # `@lock_tty` prevents queries during a synced update.
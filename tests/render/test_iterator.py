@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import sys
 from itertools import zip_longest
 from typing import Iterator
 
@@ -310,6 +311,60 @@ class TestCache:
             tuple(render_iter)
             assert cache_frame_fill.n_renders == n_renders
 
+        @pytest.mark.parametrize("cache", [True, 9, 10])
+        def test_max_bytes(self, cache):
+            cache_frame_fill = CacheFrameFill(Size(1, 1))
+            render_iter = RenderIterator(
+                cache_frame_fill,
+                loops=3,
+                cache=cache,
+                cache_max_bytes=sys.getsizeof("0") * 5,
+            )
+            assert render_iter._cached is True
+
+            # First loop
+            frames = [next(render_iter) for _ in range(10)]
+            assert cache_frame_fill.n_renders == 10
+            assert render_iter.cache_info == (
+                0,
+                10,
+                5,
+                sys.getsizeof("0") * 5,
+                sys.getsizeof("0") * 5,
+            )
+
+            # Other loops; only the frames that fit are reused
+            for _ in range(2):
+                for n, frame in enumerate(frames):
+                    assert (next(render_iter) is frame) is (n < 5)
+            assert cache_frame_fill.n_renders == 20
+            assert render_iter.cache_info[:3] == (10, 20, 5)
+
+            render_iter.close()
+            assert render_iter.cache_info[:3] == (10, 20, 0)
+
+        def test_max_bytes_size_change(self):
+            cache_frame_fill = CacheFrameFill(Size(1, 1))
+            render_iter = RenderIterator(
+                cache_frame_fill, loops=2, cache_max_bytes=sys.getsizeof("00") * 10
+            )
+            frames = [next(render_iter) for _ in range(10)]
+
+            # Frames rendered at the previous size are evicted to make room
+            render_iter.set_render_size(Size(2, 1))
+            for frame in frames:
+                assert next(render_iter) is not frame
+            assert render_iter.cache_info.frames == 10
+            assert cache_frame_fill.n_renders == 20
+
+        def test_disabled(self):
+            render_iter = RenderIterator(anim_space, cache=False)
+            assert render_iter.cache_info is None
+
+        def test_invalid_max_bytes(self):
+            with pytest.raises(ValueError, match="'cache_max_bytes'"):
+                RenderIterator(anim_space, cache_max_bytes=-1)
+
     class TestIndefinite:
         @pytest.mark.parametrize("n_frames", [99, 100, 101])
         def test_default(self, n_frames):
@@ -993,7 +993,15 @@ class TestDraw:
     class TestAnimation:
         class AnimateChar(Char):
             def _animate_(
-                self, render_data, render_args, padding, loops, cache, output
+                self,
+                render_data,
+                render_args,
+                padding,
+                loops,
+                cache,
+                output,
+                *,
+                frame_skip=0,
             ):
                 self.anim_args = SimpleNamespace(
                     render_data=render_data,
@@ -1002,6 +1010,7 @@ class TestDraw:
                     loops=loops,
                     cache=cache,
                     output=output,
+                    frame_skip=frame_skip,
                 )
 
         @capture_stdout()
@@ -1014,6 +1023,7 @@ class TestDraw:
             assert animate_char.anim_args.loops == -1
             assert animate_char.anim_args.cache == 100
             assert animate_char.anim_args.output is sys.stdout
+            assert animate_char.anim_args.frame_skip == 0
             assert STDOUT.getvalue().count("\n") == 1
             assert STDOUT.getvalue().endswith("\n")
 
@@ -1021,13 +1031,16 @@ class TestDraw:
         def test_non_default(self):
             animate_char = self.AnimateChar(2, 1)
             render_args = RenderArgs(self.AnimateChar, Char.Args("#"))
-            animate_char.draw(+Char.Args("#"), ExactPadding(), loops=2, cache=False)
+            animate_char.draw(
+                +Char.Args("#"), ExactPadding(), loops=2, cache=False, frame_skip=2
+            )
             assert animate_char.anim_args.render_data.render_cls is self.AnimateChar
             assert animate_char.anim_args.render_args == render_args
             assert animate_char.anim_args.padding == ExactPadding()
             assert animate_char.anim_args.loops == 2
             assert animate_char.anim_args.cache is False
             assert animate_char.anim_args.output is sys.stdout
+            assert animate_char.anim_args.frame_skip == 2
             assert STDOUT.getvalue().count("\n") == 1
             assert STDOUT.getvalue().endswith("\n")
 
@@ -1379,6 +1392,50 @@ class TestAnimate:
         assert STDOUT.getvalue().count("\n") == anim_n_eol(1, padded_height, 2, 1)
         assert not STDOUT.getvalue().endswith("\n")
 
+    @pytest.mark.parametrize("frame_skip", [0, 1, 2, 10])
+    @capture_stdout()
+    def test_frame_skip(self, frame_skip):
+        anim_space = Space(10, 1)
+        render_data = anim_space._get_render_data_(iteration=True)
+        render_data[Renderable].duration = 0  # Every frame is late
+        assert anim_space.dropped_frames is None
+
+        anim_space._animate_(
+            render_data,
+            RenderArgs(Space),
+            self.padding,
+            1,
+            False,
+            STDOUT,
+            frame_skip=frame_skip,
+        )
+        assert anim_space.dropped_frames == 9 - 9 // (frame_skip + 1)
+
+    @pytest.mark.parametrize("frame_skip", [1, 2, 10])
+    @capture_stdout()
+    def test_frame_skip_render(self, frame_skip):
+        # Dropped frames are not rendered
+        anim_space = Space(10, 1)
+        render_data = anim_space._get_render_data_(iteration=True)
+        render_data[Renderable].duration = 0  # Every frame is late
+        rendered = []
+
+        def render(render_data, render_args):
+            rendered.append(render_data[Renderable].frame_offset)
+            return Space._render_(anim_space, render_data, render_args)
+
+        anim_space._render_ = render
+        anim_space._animate_(
+            render_data,
+            RenderArgs(Space),
+            self.padding,
+            1,
+            False,
+            STDOUT,
+            frame_skip=frame_skip,
+        )
+        assert rendered == list(range(0, 10, frame_skip + 1))
+
     @pytest.mark.parametrize("loops", [1, 2, 10])
     class TestLoops:
         anim_space = Space(2, 1)
@@ -0,0 +1,173 @@
+import pytest
+
+from term_image._cache import DiskCache, FrameCache, LRUCache
+
+
+def new_cache(max_size=10):
+    return LRUCache(max_size, len)
+
+
+class TestMaxSize:
+    def test_args(self):
+        for value in (None, 1.0, "1"):
+            with pytest.raises(TypeError, match="'max_size'"):
+                new_cache(value)
+        with pytest.raises(ValueError, match="'max_size'"):
+            new_cache(-1)
+
+    def test_zero(self):
+        cache = new_cache(0)
+        cache.put("a", "x")
+        assert "a" not in cache
+        assert cache.size == 0
+
+    def test_shrink(self):
+        cache = new_cache()
+        cache.put("a", "xxx")
+        cache.put("b", "xxx")
+        cache.put("c", "xxx")
+        cache.max_size = 6
+        assert "a" not in cache
+        assert "b" in cache and "c" in cache
+        assert cache.size == 6
+
+
+def test_get_put():
+    cache = new_cache()
+    assert cache.get("a") is None
+    cache.put("a", "xxx")
+    assert cache.get("a") == "xxx"
+    assert len(cache) == 1
+    assert cache.size == 3
+
+    # Replacement
+    cache.put("a", "yy")
+    assert cache.get("a") == "yy"
+    assert len(cache) == 1
+    assert cache.size == 2
+
+
+def test_eviction_order():
+    cache = new_cache()
+    for key in "abc":
+        cache.put(key, "xxx")
+    cache.get("a")  # "b" becomes the least-recently-used
+    cache.put("d", "xxx")
+    assert "b" not in cache
+    assert all(key in cache for key in "acd")
+    assert cache.size == 9
+
+
+def test_oversized_value():
+    cache = new_cache()
+    cache.put("a", "xxx")
+    cache.put("b", "x" * 11)
+    assert "b" not in cache
+    assert "a" in cache
+
+
+def test_discard():
+    cache = new_cache()
+    for key in ("a1", "a2", "b1"):
+        cache.put(key, "xx")
+    cache.discard(lambda key: key.startswith("a"))
+    assert len(cache) == 1
+    assert "b1" in cache
+    assert cache.size == 2
+
+
+def test_clear():
+    cache = new_cache()
+    cache.put("a", "xx")
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.size == 0
+
+
+def test_on_evict():
+    evicted = []
+    cache = LRUCache(6, len, lambda key, value: evicted.append((key, value)))
+    cache.put("a", "xxx")
+    cache.put("b", "xxx")
+    cache.put("c", "xxx")  # Evicts "a"
+    cache.put("b", "yy")  # Replaces "b"
+    cache.put("d", "z" * 7)  # Never cached
+    assert evicted == [("a", "xxx"), ("b", "xxx")]
+
+    cache.discard(lambda key: key == "c")
+    assert evicted[-1] == ("c", "xxx")
+    cache.clear()
+    assert evicted[-1] == ("b", "yy")
+    cache.put("e", "xx")
+    cache.max_size = 0
+    assert evicted[-1] == ("e", "xx")
+    assert len(evicted) == 5
+
+
+class TestFrameCache:
+    def test_get_put(self):
+        cache = FrameCache(0, len)
+        assert cache.get(0, "a") is None
+        cache.put(0, "a", "xx")
+        assert cache.get(0, "a") == "xx"
+        assert cache.get(0, "b") is None  # Invalid
+        assert cache[0] == ("xx", "a")
+        assert cache.info() == (1, 2, 1, 2, 0)
+
+    def test_valid_frames_not_evicted(self):
+        cache = FrameCache(4, len)
+        for n in range(4):
+            cache.put(n, "a", "xx")
+        assert len(cache) == 2
+        assert [cache.get(n, "a") for n in range(4)] == ["xx", "xx", None, None]
+
+    def test_invalid_frames_evicted(self):
+        cache = FrameCache(4, len)
+        cache.put(0, "a", "xx")
+        cache.put(1, "a", "xx")
+        cache.put(2, "b", "xxx")
+        assert cache[2] == ("xxx", "b")
+        assert len(cache) == 1
+        assert cache.info().size == 3
+
+    def test_replace(self):
+        cache = FrameCache(4, len)
+        cache.put(0, "a", "xx")
+        cache.put(0, "b", "xxxx")
+        assert cache[0] == ("xxxx", "b")
+        assert cache.info().size == 4
+
+    def test_oversized_frame(self):
+        cache = FrameCache(4, len)
+        cache.put(0, "a", "xxxxx")
+        assert len(cache) == 0
+
+    def test_clear(self):
+        cache = FrameCache(0, len)
+        cache.put(0, "a", "xx")
+        cache.get(0, "a")
+        cache.clear()
+        assert len(cache) == 0
+        assert cache.info() == (1, 0, 0, 0, 0)
+
+
+class TestDiskCache:
+    def test_get_put(self, tmp_path):
+        cache = DiskCache(str(tmp_path / "cache"))
+        assert cache.get("a") is None
+        cache.put("a", "\u2580x")
+        cache.put("b", "y")
+        assert cache.get("a") == "\u2580x"
+        assert cache.get("b") == "y"
+        cache.put("a", "z")
+        assert cache.get("a") == "z"
+        assert len(list((tmp_path / "cache").iterdir())) == 2
+
+    def test_shared(self, tmp_path):
+        DiskCache(str(tmp_path)).put("a", "x")
+        assert DiskCache(str(tmp_path)).get("a") == "x"
+
+    def test_empty_file(self, tmp_path):
+        cache = DiskCache(str(tmp_path))
+        cache.put("a", "")
+        assert cache.get("a") is None
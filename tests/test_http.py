@@ -0,0 +1,128 @@
+import os
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from threading import Thread
+
+import pytest
+
+from term_image._http import CacheEntry, HTTPCache, fetch
+from term_image.exceptions import TermImageError, URLNotFoundError
+
+with open("tests/images/python.png", "rb") as f:
+    python_data = f.read()
+LAST_MODIFIED = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+
+class Handler(BaseHTTPRequestHandler):
+    # path -> (data, headers)
+    files = {
+        "/etag.png": (python_data, {"ETag": '"abc"'}),
+        "/last-modified.png": (python_data, {"Last-Modified": LAST_MODIFIED}),
+        "/no-validator.png": (python_data, {}),
+        "/no-store.png": (python_data, {"ETag": '"abc"', "Cache-Control": "no-store"}),
+    }
+    requests = []
+
+    def do_GET(self):
+        self.requests.append((self.path, dict(self.headers)))
+        if self.path not in self.files:
+            self.send_error(404)
+            return
+
+        data, headers = self.files[self.path]
+        if (
+            headers.get("ETag", object()) == self.headers["If-None-Match"]
+            or headers.get("Last-Modified", object())
+            == self.headers["If-Modified-Since"]
+        ):
+            self.send_response(304)
+            self.end_headers()
+            return
+
+        self.send_response(200)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *_):
+        pass
+
+
+@pytest.fixture(scope="module")
+def server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def requests():
+    Handler.requests.clear()
+    return Handler.requests
+
+
+class TestFetch:
+    def test_fetch(self, server, requests):
+        assert fetch(f"{server}/etag.png") == python_data
+        assert fetch(f"{server}/etag.png") == python_data
+        assert len(requests) == 2
+
+    def test_not_found(self, server):
+        with pytest.raises(URLNotFoundError):
+            fetch(f"{server}/missing.png")
+
+    def test_max_bytes(self, server):
+        url = f"{server}/etag.png"
+        assert fetch(url, len(python_data)) == python_data
+        with pytest.raises(TermImageError, match="larger than"):
+            fetch(url, len(python_data) - 1)
+
+
+class TestCache:
+    @pytest.mark.parametrize(
+        "path, header",
+        [("/etag.png", "If-None-Match"), ("/last-modified.png", "If-Modified-Since")],
+    )
+    def test_revalidation(self, server, requests, tmp_path, path, header):
+        cache = HTTPCache(str(tmp_path))
+        assert fetch(server + path, cache=cache) == python_data
+        assert header not in requests[-1][1]
+        assert cache.get(server + path).data == python_data
+
+        assert fetch(server + path, cache=cache) == python_data
+        assert header in requests[-1][1]
+        assert len(requests) == 2
+
+    def test_not_cached(self, server, tmp_path):
+        cache = HTTPCache(str(tmp_path))
+        for path in ("/no-validator.png", "/no-store.png"):
+            assert fetch(server + path, cache=cache) == python_data
+            assert cache.get(server + path) is None
+
+    def test_content_addressed(self, server, tmp_path):
+        cache = HTTPCache(str(tmp_path))
+        fetch(f"{server}/etag.png", cache=cache)
+        fetch(f"{server}/last-modified.png", cache=cache)
+        assert len(os.listdir(tmp_path / "urls")) == 2
+        assert len(os.listdir(tmp_path / "data")) == 1
+
+    def test_changed(self, server, tmp_path):
+        cache = HTTPCache(str(tmp_path))
+        url = f"{server}/etag.png"
+        cache.put(url, CacheEntry('"old"', None, b"old"))
+        assert fetch(url, cache=cache) == python_data
+        assert cache.get(url) == CacheEntry('"abc"', None, python_data)
+
+    def test_corrupted(self, tmp_path):
+        cache = HTTPCache(str(tmp_path))
+        cache.put("http://a", CacheEntry('"abc"', None, b"data"))
+        (data_file,) = (tmp_path / "data").iterdir()
+        data_file.write_bytes(b"corrupted")
+        assert cache.get("http://a") is None
+
+    def test_missing(self, tmp_path):
+        assert HTTPCache(str(tmp_path / "missing")).get("http://a") is None
@@ -1,6 +1,7 @@
 """Render-style-dependent (though shared, not specific) tests"""
 
 import atexit
+import re
 from operator import gt, lt, mul
 from types import SimpleNamespace
 
@@ -28,6 +29,7 @@ dummy._original_size = (1, 1)
 _width = _height = _width_px = _height_px = None  # Set by `setup_common()`
 
 _size = 20
+
 ImageClass = None  # Set by `setup_common()`
 python_img = Image.open("tests/images/python.png")
 
@@ -450,6 +452,76 @@ class TestCellRatio_Graphics:
             assert self.image.size == size
 
 
+class VirtualTerminal:
+    """Interprets the subset of control sequences used by BlockImage renders"""
+
+    _ctlseq_re = re.compile(r"\033\[([\d;]*)([A-Za-z])")
+
+    def __init__(self):
+        self.screen = {}
+        self.x = self.y = 0
+        self.fg = self.bg = None
+
+    def write(self, output):
+        pos = 0
+        while pos < len(output):
+            match = self._ctlseq_re.match(output, pos)
+            if match:
+                params, final = match.groups()
+                if final == "m":
+                    params = iter(int(x or 0) for x in params.split(";"))
+                    for param in params:
+                        if param == 0:
+                            self.fg = self.bg = None
+                        elif param in {38, 48}:
+                            color = (
+                                (next(params), next(params), next(params))
+                                if next(params) == 2
+                                else next(params)
+                            )
+                            if param == 38:
+                                self.fg = color
+                            else:
+                                self.bg = color
+                        elif param == 39:
+                            self.fg = None
+                        else:
+                            self.bg = None
+                elif final == "A":
+                    self.y = max(0, self.y - int(params or 1))
+                elif final == "B":
+                    self.y += int(params or 1)
+                elif final == "C":
+                    self.x += int(params or 1)
+                else:  # REP
+                    self.write(self.last_char * int(params or 1))
+                pos = match.end()
+                continue
+
+            char = output[pos]
+            if char == "\r":
+                self.x = 0
+            elif char == "\n":
+                self.x = 0
+                self.y += 1
+            else:
+                self.last_char = char
+                self.screen[self.x, self.y] = (
+                    char,
+                    self.fg if char != " " else None,
+                    self.bg,
+                )
+                self.x += 1
+            pos += 1
+
+
+def interpret_line(line):
+    """Returns the character and effective colors of each cell of a rendered line"""
+    terminal = VirtualTerminal()
+    terminal.write(line)
+    return [terminal.screen[x, 0] for x in range(terminal.x)]
+
+
 class TestRender_Text:
     def test_setup(self):
         type(self).trans = ImageClass.from_file("tests/images/trans.png", height=_size)
@@ -516,7 +588,21 @@ class TestRender_Text:
         for line, str_line in zip(render.splitlines(), str(python_image).splitlines()):
             cells = line.split("\0")
             assert len(cells) == _size
-            assert "".join(cells) == str_line
+            expected = interpret_line(str_line)
+            assert interpret_line("".join(cells)) == expected
+
+            # `UrwidImageCanvas` trims lines at any cell and, if the first cell left
+            # sets no color, begins with the SGR sequence of the nearest preceding
+            # cell that does
+            for start in range(1, _size):
+                first_color = ""
+                if not cells[start].startswith("\033"):
+                    for cell in reversed(cells[:start]):
+                        if cell.startswith("\033"):
+                            first_color = cell[: cell.rindex("m") + 1]
+                            break
+                trimmed = first_color + "".join(cells[start:])
+                assert interpret_line(trimmed) == expected[start:]
 
 
 def test_render_clean_up_All():
@@ -547,6 +633,18 @@ def test_render_clean_up_All():
         img.load()
 
 
+def test_render_lines_All():
+    image = ImageClass(python_img)
+    image.set_size(height=8)
+    for method in ImageClass._render_methods:
+        for alpha in (_ALPHA_THRESHOLD, None, "#ffffff"):
+            chunks = list(image._renderer(image._render_lines, alpha, method=method))
+            assert all(isinstance(chunk, str) for chunk in chunks)
+            assert "".join(chunks) == image._renderer(
+                image._render_image, alpha, method=method
+            )
+
+
 def test_style_args_All():
     image = ImageClass(python_img)
     with pytest.raises(StyleError):
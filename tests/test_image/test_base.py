@@ -2,19 +2,26 @@
 
 import atexit
 import io
+import mmap
 import os
 import sys
 from operator import floordiv, mul
 from pathlib import Path
 
 import pytest
-from PIL import Image, UnidentifiedImageError
+from PIL import Image, ImageChops, ImageStat, UnidentifiedImageError
+from PIL.JpegImagePlugin import JpegImageFile
 
 from term_image import set_cell_ratio
 from term_image._ctlseqs import ESC
 from term_image.exceptions import InvalidSizeError, TermImageError
 from term_image.image import BaseImage, BlockImage, ImageIterator, ImageSource, Size
-from term_image.image.common import _ALPHA_THRESHOLD
+from term_image.image.common import (
+    _ALPHA_THRESHOLD,
+    PixelBuffer,
+    _decoded_cache,
+    _resize_cache,
+)
 
 from .. import reset_cell_size_ratio
 from .common import _size, columns, lines, python_img, setup_common
@@ -137,6 +144,105 @@ class TestFromFile:
         assert image._source_type is ImageSource.FILE_PATH
 
 
+class TestFromFiles:
+    def test_args(self):
+        for value in (None, python_image, python_image.encode(), 1):
+            with pytest.raises(TypeError, match="'filepaths'"):
+                BlockImage.from_files(value)
+        for value in (1.0, True):
+            with pytest.raises(TypeError, match="'max_workers'"):
+                BlockImage.from_files([], max_workers=value)
+        with pytest.raises(ValueError, match="'max_workers'"):
+            BlockImage.from_files([], max_workers=0)
+        assert BlockImage.from_files([]) == []
+
+    def test_results(self):
+        paths = [python_image, Path("tests/images/lion.gif"), python_image + "e"]
+        paths += ["LICENSE", "tests", python_img] + [BytesPath(python_image)]
+        for max_workers in (1, 3, 16):
+            results = BlockImage.from_files(iter(paths), max_workers=max_workers)
+            assert len(results) == len(paths)
+            assert results[0].source == os.path.abspath(python_image)
+            assert results[1].source == os.path.abspath("tests/images/lion.gif")
+            assert results[1].is_animated
+            assert isinstance(results[2], FileNotFoundError)
+            assert isinstance(results[3], UnidentifiedImageError)
+            assert isinstance(results[4], OSError)
+            assert isinstance(results[5], TypeError)
+            assert results[6].source == os.path.abspath(python_image)
+
+    def test_size_args(self):
+        (image,) = BlockImage.from_files([python_image], width=10)
+        assert image.width == 10
+        (error,) = BlockImage.from_files([python_image], width=1, height=Size.FIT)
+        assert isinstance(error, TypeError)
+
+    def test_lazy_frame_count(self):
+        (image,) = BlockImage.from_files(["tests/images/lion.gif"])
+        assert image._n_frames is None
+        assert image.n_frames > 1
+
+
+class TestFromBuffer:
+    with open(python_image, "rb") as f:
+        data = f.read()
+
+    def test_args(self):
+        for value in (python_image, python_img, [1, 2]):
+            with pytest.raises(TypeError, match=r"'buffer'"):
+                BlockImage.from_buffer(value)
+        with pytest.raises(TypeError, match=r"'data'"):
+            BlockImage.from_bytes(python_image)
+        with pytest.raises(UnidentifiedImageError):
+            BlockImage.from_bytes(b"not an image")
+
+        # Ensure size arguments get through
+        with pytest.raises(TypeError, match="'width' and 'height'"):
+            BlockImage.from_buffer(self.data, width=1, height=Size.FIT)
+
+    def test_bytes(self):
+        for data in (self.data, bytearray(self.data), memoryview(self.data)):
+            image = BlockImage.from_bytes(data)
+            assert isinstance(image, BlockImage)
+            assert isinstance(image.source, bytes)
+            assert image.source == self.data
+            assert image.source_type is ImageSource.BUFFER
+
+        assert BlockImage.from_bytes(self.data).source is self.data
+
+    def test_buffer(self):
+        data = bytearray(self.data)
+        image = BlockImage.from_buffer(data)
+        assert image.source is data
+        assert image.source_type is ImageSource.BUFFER
+
+    def test_mmap(self):
+        with open(python_image, "rb") as f:
+            buffer = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        image = BlockImage.from_buffer(buffer, width=20)
+        assert image.source is buffer
+        assert image.original_size == python_img.size
+
+        # Same render as from the file
+        assert str(image) == str(BlockImage.from_file(python_image, width=20))
+
+        # The buffer is released after each render
+        image.close()
+        buffer.close()
+
+    def test_render(self):
+        image = BlockImage.from_bytes(self.data, width=20)
+        with image._get_image() as img:
+            assert image._is_source_image(img)
+            assert img.size == python_img.size
+        assert str(image) == str(BlockImage.from_file(python_image, width=20))
+        assert any(key[0] == id(image) for key in _resize_cache._entries)
+
+        # Opened anew for each render
+        with image._get_image() as img, image._get_image() as img2:
+            assert img is not img2
+
+
 class TestProperties:
     def test_closed(self):
         image = BlockImage(python_img)
@@ -193,6 +299,16 @@ class TestProperties:
         assert B.forced_support
         assert not C.forced_support
 
+    def test_dropped_frames(self):
+        image = BlockImage(python_img)
+        assert image.dropped_frames is None
+
+        image = BlockImage(anim_img)
+        assert image.dropped_frames is None
+
+        with pytest.raises(AttributeError):
+            image.dropped_frames = 0
+
     def test_frame_duration(self):
         image = BlockImage(python_img)
         assert image.frame_duration is None
@@ -627,6 +743,56 @@ class TestRenderData:
             assert rgb is None
             assert rgb is None
 
+    def test_buffer(self):
+        for alpha in (_ALPHA_THRESHOLD, "#", None):
+            img, rgb, a = self.get_render_data(alpha=alpha, buffer=True)
+            assert isinstance(rgb, PixelBuffer)
+            assert a is None
+            assert rgb.size == img.size
+            assert rgb.bands == len(img.mode)
+            assert rgb.stride == img.width * rgb.bands
+            assert len(rgb.data) == rgb.stride * img.height
+            assert rgb.data == img.tobytes()
+
+            img, rgb, a = self.get_render_data(
+                alpha=alpha, buffer=True, pixel_data=False
+            )
+            assert rgb is None
+            assert a is None
+
+    def test_buffer_alpha(self):
+        # Transparent
+        img, rgb, _ = self.get_render_data(alpha=_ALPHA_THRESHOLD, buffer=True)
+        assert img.mode == "RGBA"
+        assert rgb.bands == 4
+
+        # No transparency; alpha data is skipped
+        for alpha in ("#", None):
+            img, rgb, _ = self.get_render_data(alpha=alpha, buffer=True)
+            assert img.mode == "RGB"
+            assert rgb.bands == 3
+
+        opaque_img = self.trans._get_image().copy()
+        opaque_img.putalpha(255)
+        img, rgb, _ = self.get_render_data(opaque_img, _ALPHA_THRESHOLD, buffer=True)
+        assert img.mode == "RGB"
+        assert rgb.bands == 3
+
+        # Rounded alpha
+        image = BlockImage(python_img, height=_size)
+        img, rgb, _ = image._get_render_data(
+            python_img, _ALPHA_THRESHOLD, buffer=True, round_alpha=True
+        )
+        assert img.mode == "RGBA"
+        assert set(rgb.data[3 :: rgb.bands]) == {0, 255}
+        _, list_rgb, a = image._get_render_data(
+            python_img, _ALPHA_THRESHOLD, round_alpha=True
+        )
+        assert bytes(rgb.data[3 :: rgb.bands]) == bytes(a)
+        assert [tuple(rgb.data[i : i + 3]) for i in range(0, len(rgb.data), 4)] == (
+            list_rgb
+        )
+
     def test_round_alpha(self):
         image = BlockImage(python_img, height=_size)
         img, rgb, a = image._get_render_data(python_img, alpha=_ALPHA_THRESHOLD)
@@ -931,6 +1097,20 @@ class TestFormatting:
         self.check_padding((7, 7, 8, 8), "|", 30, "-", 30)
         self.check_padding((15, 15, 0, 0), ">", 30, "_", 30)
 
+    def test_format_render_lines(self):
+        chunks = self.render.splitlines(keepends=True)
+        for fmt in (
+            (None, 1, None, 1),
+            ("<", 30, "^", 30),
+            ("|", 30, "-", 30),
+            (">", 30, "_", 30),
+            ("|", 15, "-", 20),
+        ):
+            fmt = self.check_formatting(*fmt)
+            assert "".join(
+                self.image._format_render_lines(iter(chunks), *fmt)
+            ) == self.image._format_render(self.render, *fmt)
+
     def test_format_spec(self):
         for spec in (
             "1<",
@@ -993,6 +1173,502 @@ class TestFormatting:
             assert isinstance(fmt, tuple)
 
 
+class TestResizeCache:
+    def cached_keys(self, image):
+        return [key for key in _resize_cache._entries if key[0] == id(image)]
+
+    def render(self, image, alpha=_ALPHA_THRESHOLD):
+        return image._renderer(image._render_image, alpha)
+
+    def test_max_bytes(self):
+        max_bytes = BaseImage.resize_cache_max_bytes
+        assert isinstance(max_bytes, int)
+        assert BlockImage.resize_cache_max_bytes == max_bytes
+
+        for value in (None, 1.0, "1"):
+            with pytest.raises(TypeError):
+                BaseImage.resize_cache_max_bytes = value
+        with pytest.raises(ValueError):
+            BaseImage.resize_cache_max_bytes = -1
+
+        image = BlockImage.from_file(python_image)
+        with pytest.raises(AttributeError):
+            image.resize_cache_max_bytes = 0
+
+    def test_cached(self):
+        image = BlockImage.from_file(python_image, width=20)
+        render = self.render(image)
+        assert len(self.cached_keys(image)) == 1
+        assert self.render(image) == render
+        assert len(self.cached_keys(image)) == 1
+
+        # Different transparency settings
+        assert self.render(image, None) != render
+        assert self.render(image, "#ff0000") != render
+        assert len(self.cached_keys(image)) == 3
+        assert self.render(image) == render
+
+    def test_file_modified(self, tmp_path):
+        path = str(tmp_path / "python.png")
+        with Image.open(python_image) as img:
+            img.save(path)
+        image = BlockImage.from_file(path, width=20)
+        render = self.render(image)
+
+        with Image.open(python_image) as img:
+            img.transpose(Image.Transpose.FLIP_LEFT_RIGHT).save(path)
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        assert self.render(image) != render
+        assert len(self.cached_keys(image)) == 2
+
+    def test_returned_image_is_a_copy(self):
+        image = BlockImage.from_file(python_image, width=20)
+        img = image._get_render_data(image._get_image(), None)[0]
+        img.close()
+        img = image._get_render_data(image._get_image(), None)[0]
+        img.load()  # Not closed
+
+    def test_set_size(self):
+        image = BlockImage.from_file(python_image, width=20)
+        self.render(image)
+        image.set_size(width=20)
+        assert len(self.cached_keys(image)) == 1
+        image.set_size(width=10)
+        assert not self.cached_keys(image)
+
+    def test_dynamic_size(self):
+        image = BlockImage.from_file(python_image)
+        render = self.render(image)
+        assert len(self.cached_keys(image)) == 1
+        assert self.render(image) == render
+        assert len(self.cached_keys(image)) == 1
+
+    def test_close(self):
+        image = BlockImage.from_file(python_image, width=20)
+        self.render(image)
+        image.close()
+        assert not self.cached_keys(image)
+
+    def test_seek(self):
+        image = BlockImage.from_file("tests/images/lion.gif", width=20)
+        renders = []
+        for n in range(3):
+            image.seek(n)
+            renders.append(self.render(image))
+        assert len(self.cached_keys(image)) == 3
+        for n in range(3):
+            image.seek(n)
+            assert self.render(image) == renders[n]
+
+    def test_not_cached(self):
+        # PIL image source
+        image = BlockImage(python_img, width=20)
+        self.render(image)
+        assert not self.cached_keys(image)
+
+        # Frame
+        image = BlockImage.from_file("tests/images/lion.gif", width=20)
+        img = image._get_image()
+        image._get_render_data(img, None, frame=True)[0].close()
+        img.close()
+        assert not self.cached_keys(image)
+
+    def test_disabled(self):
+        max_bytes = BaseImage.resize_cache_max_bytes
+        BaseImage.resize_cache_max_bytes = 0
+        try:
+            assert len(_resize_cache) == 0
+            image = BlockImage.from_file(python_image, width=20)
+            self.render(image)
+            assert not self.cached_keys(image)
+        finally:
+            BaseImage.resize_cache_max_bytes = max_bytes
+
+
+class TestRenderCache:
+    @pytest.fixture(autouse=True)
+    def enabled(self, tmp_path):
+        BaseImage.render_cache_dir = tmp_path
+        yield
+        BaseImage.render_cache_dir = None
+
+    @pytest.fixture
+    def renders(self, monkeypatch):
+        renders = []
+        render_image = BlockImage._render_image
+
+        def render_image_wrapper(self, *args, **kwargs):
+            renders.append(args[1:])
+            return render_image(self, *args, **kwargs)
+
+        monkeypatch.setattr(BlockImage, "_render_image", render_image_wrapper)
+        return renders
+
+    def test_render_cache_dir(self, tmp_path):
+        assert BaseImage.render_cache_dir == BlockImage.render_cache_dir
+        assert BaseImage.render_cache_dir == str(tmp_path)
+        for value in (1, b"dir"):
+            with pytest.raises(TypeError):
+                BaseImage.render_cache_dir = value
+
+        image = BlockImage(python_img)
+        with pytest.raises(AttributeError):
+            image.render_cache_dir = None
+
+        BaseImage.render_cache_dir = None
+        assert BaseImage.render_cache_dir is None
+
+    def test_cached(self, renders):
+        image = BlockImage.from_file(python_image, width=20)
+        render = str(image)
+        assert len(renders) == 1
+        assert str(image) == render
+        assert str(BlockImage.from_file(python_image, width=20)) == render
+        # Padding is applied to the cached output
+        assert f"{image:1.1}" == render
+        assert len(renders) == 1
+
+        # Different render parameters
+        image.set_size(width=10)
+        str(image)
+        assert f"{image:1.1#}" != f"{image:1.1}"
+        assert f"{image:1.1#ff0000}" != f"{image:1.1#}"
+        assert len(renders) == 4
+
+    def test_draw(self, renders):
+        image = BlockImage.from_file(python_image, width=20)
+        for _ in range(2):
+            clear_stdout()
+            image.draw(check_size=False)
+        assert len(renders) == 1
+
+    def test_file_modified(self, renders, tmp_path):
+        path = str(tmp_path / "python.png")
+        with Image.open(python_image) as img:
+            img.save(path)
+        image = BlockImage.from_file(path, width=20)
+        str(image)
+        str(image)
+        assert len(renders) == 1
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        str(image)
+        assert len(renders) == 2
+
+    def test_buffer(self, renders):
+        with open(python_image, "rb") as f:
+            data = f.read()
+        render = str(BlockImage.from_bytes(data, width=20))
+        assert str(BlockImage.from_bytes(data, width=20)) == render
+        assert len(renders) == 1
+
+    def test_seek(self, renders):
+        image = BlockImage.from_file("tests/images/lion.gif", width=20)
+        frames = []
+        for n in range(2):
+            image.seek(n)
+            frames.append(str(image))
+            assert str(image) == frames[n]
+        assert frames[0] != frames[1]
+        assert len(renders) == 2
+
+    def test_not_cached(self, renders):
+        image = BlockImage(python_img, width=20)
+        str(image)
+        str(image)
+        assert len(renders) == 2
+
+        BaseImage.render_cache_dir = None
+        image = BlockImage.from_file(python_image, width=20)
+        str(image)
+        str(image)
+        assert len(renders) == 4
+
+
+class TestDecodedCache:
+    @pytest.fixture(autouse=True)
+    def enabled(self):
+        BaseImage.decoded_cache_max_bytes = 2**24
+        yield
+        BaseImage.decoded_cache_max_bytes = 0
+
+    def test_max_bytes(self):
+        BaseImage.decoded_cache_max_bytes = 0
+        assert BaseImage.decoded_cache_max_bytes == 0
+        assert BlockImage.decoded_cache_max_bytes == 0
+
+        for value in (None, 1.0, "1"):
+            with pytest.raises(TypeError):
+                BaseImage.decoded_cache_max_bytes = value
+        with pytest.raises(ValueError):
+            BaseImage.decoded_cache_max_bytes = -1
+
+        image = BlockImage.from_file(python_image)
+        with pytest.raises(AttributeError):
+            image.decoded_cache_max_bytes = 0
+
+    def test_kept(self):
+        image = BlockImage.from_file(python_image)
+        img = image._get_image()
+        assert image._source in _decoded_cache
+        image._close_image(img)
+        img.load()  # Not closed
+        assert image._get_image() is img
+
+        # Shared by instances with the same source
+        assert BlockImage.from_file(python_image)._get_image() is img
+
+        # Not closed by renders
+        image._renderer(image._render_image, _ALPHA_THRESHOLD)
+        img.load()
+
+    def test_revalidation(self, tmp_path):
+        path = str(tmp_path / "python.png")
+        with Image.open(python_image) as img:
+            img.save(path)
+        image = BlockImage.from_file(path)
+        img = image._get_image()
+        assert image._get_image() is img
+
+        stat = os.stat(path)
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        new_img = image._get_image()
+        assert new_img is not img
+        assert image._get_image() is new_img
+
+    def test_not_cached(self):
+        # Animated
+        image = BlockImage.from_file("tests/images/lion.gif")
+        image._close_image(image._get_image())
+        assert image._source not in _decoded_cache
+
+        # Over budget
+        BaseImage.decoded_cache_max_bytes = 1
+        image = BlockImage.from_file(python_image)
+        img = image._get_image()
+        assert image._source not in _decoded_cache
+        image._close_image(img)
+        with pytest.raises(ValueError):
+            img.load()  # Closed
+
+    def test_disabled(self):
+        BaseImage.decoded_cache_max_bytes = 0
+        assert len(_decoded_cache) == 0
+        image = BlockImage.from_file(python_image)
+        with image._get_image() as img, image._get_image() as img2:
+            assert img2 is not img
+        assert image._source not in _decoded_cache
+
+
+class TestDownscale:
+    @pytest.fixture
+    def reduce_factors(self, monkeypatch):
+        factors = []
+        reduce = Image.Image.reduce
+
+        def reduce_wrapper(img, factor, *args, **kwargs):
+            # Excludes internal calls with premultiplied alpha
+            if img.mode not in {"La", "RGBa"}:
+                factors.append((img.mode, factor))
+            return reduce(img, factor, *args, **kwargs)
+
+        monkeypatch.setattr(Image.Image, "reduce", reduce_wrapper)
+        return factors
+
+    @pytest.fixture
+    def draft_sizes(self, monkeypatch):
+        sizes = []
+        draft = JpegImageFile.draft
+
+        def draft_wrapper(img, mode, size):
+            sizes.append(size)
+            return draft(img, mode, size)
+
+        monkeypatch.setattr(JpegImageFile, "draft", draft_wrapper)
+        return sizes
+
+    def get_render_img(self, image, size, alpha=_ALPHA_THRESHOLD, **kwargs):
+        return image._get_render_data(
+            image._get_image(), alpha, size=size, pixel_data=False, **kwargs
+        )[0]
+
+    @pytest.mark.parametrize(
+        "size, factor", [((60, 50), 4), ((30, 25), 8), ((100, 100), 2)]
+    )
+    def test_reduce(self, reduce_factors, size, factor):
+        image = BlockImage.from_file("tests/images/elephant.png")
+        assert self.get_render_img(image, size).size == size
+        # Reduced before conversion
+        assert reduce_factors == [("RGBA", factor)]
+
+    def test_no_reduce(self, reduce_factors):
+        image = BlockImage.from_file("tests/images/elephant.png")
+        # At least twice the render size is left to the resize
+        assert self.get_render_img(image, (200, 150)).size == (200, 150)
+        assert self.get_render_img(image, (300, 250)).size == (300, 250)
+        assert self.get_render_img(image, (600, 500)).size == (600, 500)
+        assert not reduce_factors
+
+    def test_reduce_after_conversion(self, reduce_factors):
+        image = BlockImage.from_file("tests/images/lion.gif")  # Palette
+        assert self.get_render_img(image, (70, 56), None).size == (70, 56)
+        assert reduce_factors == [("RGB", 4)]
+
+        # Alpha channel discarded
+        reduce_factors.clear()
+        image = BlockImage.from_file("tests/images/elephant.png")
+        assert self.get_render_img(image, (60, 50), None).size == (60, 50)
+        assert reduce_factors == [("RGB", 4)]
+
+    def test_draft(self, draft_sizes, reduce_factors):
+        image = BlockImage.from_file("tests/images/hori.jpg")
+        assert self.get_render_img(image, (60, 25)).size == (60, 25)
+        assert draft_sizes == [(120, 50)]
+        # Scaled by 4 (down to 150x63) by the decoder, leaving twice the render size
+        assert not reduce_factors
+
+    @pytest.mark.parametrize("factor", [2, 3, 5, 6, 8])
+    @pytest.mark.parametrize(
+        "path",
+        ["tests/images/elephant.png", "tests/images/hori.jpg", "tests/images/lion.gif"],
+    )
+    def test_quality(self, path, factor):
+        image = BlockImage.from_file(path)
+        with Image.open(path) as img:
+            size = (img.width // factor, img.height // factor)
+            expected = img.convert("RGB").resize(size, Image.Resampling.BOX)
+        img = self.get_render_img(image, size, None)
+        diff = ImageChops.difference(img, expected)
+        if factor < 4:  # Neither reduced nor drafted
+            assert not diff.getbbox()
+        else:
+            # Within about 1.5% of a single-pass resize
+            assert max(ImageStat.Stat(diff).mean) < 4
+
+    def test_source_not_modified(self, draft_sizes):
+        with Image.open("tests/images/hori.jpg") as img:
+            image = BlockImage(img)
+            self.get_render_img(image, (60, 25)).close()
+            assert not draft_sizes
+            assert img.size == (600, 250)
+
+    def test_frame(self, draft_sizes):
+        image = BlockImage.from_file("tests/images/hori.jpg")
+        with image._get_image() as img:
+            image._get_render_data(
+                img, None, size=(60, 25), pixel_data=False, frame=True
+            )[0].close()
+            assert not draft_sizes
+            assert img.size == (600, 250)
+
+
+class TestMipmap:
+    def get_render_img(self, image, size, alpha=_ALPHA_THRESHOLD):
+        return image._get_render_data(
+            image._get_image(), alpha, size=size, pixel_data=False
+        )[0]
+
+    def test_mipmap_max_bytes(self):
+        image = BlockImage.from_file(python_image)
+        assert image.mipmap_max_bytes == 0
+
+        for value in (None, 1.0, "1"):
+            with pytest.raises(TypeError):
+                image.mipmap_max_bytes = value
+        with pytest.raises(ValueError):
+            image.mipmap_max_bytes = -1
+
+        image.mipmap_max_bytes = 2**20
+        assert image.mipmap_max_bytes == 2**20
+        assert BlockImage.from_file(python_image).mipmap_max_bytes == 0
+
+    def test_disabled(self):
+        image = BlockImage.from_file(python_image)
+        self.get_render_img(image, (60, 50))
+        assert not image._mipmaps
+
+    def test_levels(self):
+        image = BlockImage.from_file(python_image)
+        image.mipmap_max_bytes = 2**20
+
+        # Larger than the first level
+        assert self.get_render_img(image, (200, 150)).size == (200, 150)
+        assert not image._mipmaps
+
+        assert self.get_render_img(image, (100, 100)).size == (100, 100)
+        assert not image._mipmaps
+
+        assert self.get_render_img(image, (60, 50)).size == (60, 50)
+        levels = image._mipmaps["RGBA"]
+        assert {n: img.size for n, img in levels.items()} == {1: (144, 144)}
+
+        # Reused
+        level_1 = levels[1]
+        assert self.get_render_img(image, (70, 65)).size == (70, 65)
+        assert levels[1] is level_1
+
+        # Created from the nearest kept level
+        assert self.get_render_img(image, (30, 25)).size == (30, 25)
+        assert levels[1] is level_1
+        assert levels[2].size == (72, 72)
+
+    def test_modes(self):
+        image = BlockImage.from_file(python_image)
+        image.mipmap_max_bytes = 2**20
+        self.get_render_img(image, (60, 50)).close()
+        self.get_render_img(image, (60, 50), None).close()
+        assert image._mipmaps["RGBA"][1].mode == "RGBA"
+        assert image._mipmaps["RGB"][1].mode == "RGB"
+
+    def test_budget(self):
+        image = BlockImage.from_file(python_image)
+        # Fits levels 2 (72x72x4) and 3 (36x36x4) but not level 1 (144x144x4)
+        image.mipmap_max_bytes = 72 * 72 * 4 + 36 * 36 * 4
+        assert self.get_render_img(image, (15, 12)).size == (15, 12)
+        assert sorted(image._mipmaps["RGBA"]) == [2, 3]
+
+        # Levels beyond the budget are still used
+        image.mipmap_max_bytes = 1
+        assert not image._mipmaps
+        assert self.get_render_img(image, (15, 12)).size == (15, 12)
+        assert not image._mipmaps["RGBA"]
+
+    def test_quality(self):
+        image = BlockImage.from_file(python_image)
+        image.mipmap_max_bytes = 2**20
+        for size in ((60, 50), (30, 25), (140, 130)):
+            expected = self.get_render_img(BlockImage.from_file(python_image), size)
+            img = self.get_render_img(image, size)
+            diff = ImageStat.Stat(ImageChops.difference(img, expected)).mean
+            assert max(diff) < 2
+
+    def test_animated(self):
+        image = BlockImage.from_file("tests/images/lion.gif")
+        image.mipmap_max_bytes = 2**20
+        self.get_render_img(image, (70, 56)).close()
+        assert not image._mipmaps
+
+    def test_render(self):
+        image = BlockImage.from_file(python_image, width=20)
+        str(image)
+        image.mipmap_max_bytes = 2**20
+        render = str(image)
+        assert image._mipmaps
+        image.set_size(width=10)
+        str(image)
+        image.set_size(width=20)
+        assert str(image) == render
+
+    def test_close(self):
+        image = BlockImage.from_file(python_image)
+        image.mipmap_max_bytes = 2**20
+        self.get_render_img(image, (60, 50)).close()
+        image.close()
+        assert not image._mipmaps
+
+
 # Testing with one style should suffice for all since it's simply testing the method
 # and nothing perculiar to the style
 class TestDraw:
@@ -1023,7 +1699,13 @@ class TestDraw:
             with pytest.raises(TypeError, match="'animate'"):
                 self.anim_image.draw(animate=value)
 
-        for arg in ("scroll", "check_size"):
+        for value in (1.0, "1", True):
+            with pytest.raises(TypeError, match="'frame_skip'"):
+                self.anim_image.draw(frame_skip=value)
+        with pytest.raises(ValueError, match="'frame_skip'"):
+            self.anim_image.draw(frame_skip=-1)
+
+        for arg in ("scroll", "check_size", "stream"):
             for value in (1, 1.0, "1", (), []):
                 with pytest.raises(TypeError, match=f"{arg!r}"):
                     self.image.draw(**{arg: value})
@@ -1068,6 +1750,17 @@ class TestDraw:
             assert stdout.getvalue().count("\n") == lines
             clear_stdout()
 
+        def test_stream(self):
+            sys.stdout = stdout
+            self.image._size = (20, 10)
+            for kwargs in ({}, {"pad_width": 30, "pad_height": 15, "h_align": "<"}):
+                self.image.draw(**kwargs)
+                output = stdout.getvalue()
+                clear_stdout()
+                self.image.draw(stream=True, **kwargs)
+                assert stdout.getvalue() == output
+                clear_stdout()
+
     class TestAnimatedFalse:
         image = BlockImage(python_img, width=_size)
         anim_image = BlockImage(anim_img, width=_size)
@@ -1139,3 +1832,37 @@ class TestDraw:
                 InvalidSizeError, match="animation cannot .* terminal size"
             ):
                 self.anim_image.draw(scroll=True, check_size=False)
+
+        def test_frame_skip(self):
+            sys.stdout = stdout
+            anim_image = BlockImage(anim_img, width=_size)
+            anim_image.frame_duration = 1e-9  # Every frame is late
+
+            anim_image.draw(repeat=1)
+            assert anim_image.dropped_frames == 0
+
+            anim_image.draw(repeat=1, frame_skip=2)
+            n_frames = anim_image.n_frames
+            assert anim_image.dropped_frames == (n_frames - 1) - (n_frames - 1) // 3
+
+            anim_image.draw(repeat=1, frame_skip=n_frames)
+            assert anim_image.dropped_frames == n_frames - 1
+            clear_stdout()
+
+        def test_frame_skip_render(self, monkeypatch):
+            # Dropped frames are not rendered
+            sys.stdout = stdout
+            anim_image = BlockImage(anim_img, width=_size)
+            anim_image.frame_duration = 1e-9  # Every frame is late
+            render_image = anim_image._render_image
+            rendered = []
+
+            def render(*args, **kwargs):
+                output = render_image(*args, **kwargs)  # Raises past the last frame
+                rendered.append(anim_image._seek_position)
+                return output
+
+            monkeypatch.setattr(anim_image, "_render_image", render)
+            anim_image.draw(repeat=1, frame_skip=2)
+            assert rendered == list(range(0, anim_image.n_frames, 3))
+            clear_stdout()
@@ -1,12 +1,29 @@
 """BlockImage-specific tests"""
 
-from term_image._ctlseqs import SGR_BG_DIRECT, SGR_DEFAULT
-from term_image.image import BlockImage
+from multiprocessing.shared_memory import SharedMemory
+
+import pytest
+
+from term_image._ctlseqs import (
+    REP,
+    SGR,
+    SGR_BG_DIRECT,
+    SGR_BG_INDEXED,
+    SGR_DEFAULT,
+    SGR_FG_BG_DIRECT,
+    SGR_FG_DEFAULT,
+    SGR_FG_DIRECT,
+    SGR_FG_INDEXED,
+    SGRState,
+)
+from term_image.exceptions import StyleError
+from term_image.image import BlockImage, block
+from term_image.image.block import DIRECT, INDEXED
 from term_image.image.common import _ALPHA_THRESHOLD
 
-from .. import set_fg_bg_colors
+from .. import set_fg_bg_colors, set_terminal_name_version, toggle_is_on_kitty
 from . import common
-from .common import _size, setup_common
+from .common import VirtualTerminal, _size, setup_common
 
 
 def test_setup_common():
@@ -33,6 +50,14 @@ class TestRender:
         assert render.count("\n") + 1 == self.trans.height
         assert render.partition("\n")[0].count(" ") == self.trans.width
 
+    def test_render_lines(self):
+        render = self.render_image(_ALPHA_THRESHOLD)
+        chunks = list(self.trans._renderer(self.trans._render_lines, _ALPHA_THRESHOLD))
+        assert len(chunks) == self.trans.height
+        assert "".join(chunks) == render
+        assert chunks[0] == render.partition("\n")[0]
+        assert all(chunk == "\n" + chunks[0] for chunk in chunks[1:])
+
     def test_transparency(self):
         # Transparency enabled
         render = self.render_image(_ALPHA_THRESHOLD)
@@ -90,3 +115,641 @@ class TestRender:
             == SGR_BG_DIRECT % (255, 255, 255) + " " * self.trans.width + SGR_DEFAULT
             for line in render.splitlines()
         )
+
+
+class TestSGRState:
+    red = (255, 0, 0)
+    blue = (0, 0, 255)
+
+    def test_initial(self):
+        # Unknown state; colors are always set explicitly
+        assert SGRState().set_bg(None) == SGR_DEFAULT
+        assert SGRState().set_bg(self.red) == SGR_BG_DIRECT % self.red
+        assert SGRState().set_fg(None) == SGR_FG_DEFAULT
+        assert SGRState().set(None, None) == SGR_DEFAULT
+        assert SGRState().set(self.red, self.blue) == SGR_FG_BG_DIRECT % (
+            *self.red,
+            *self.blue,
+        )
+
+    def test_unchanged(self):
+        sgr = SGRState()
+        sgr.set(self.red, self.blue)
+        assert sgr.set(self.red, self.blue) == ""
+        assert sgr.set_fg(self.red) == ""
+        assert sgr.set_bg(self.blue) == ""
+        sgr.reset()
+        assert sgr.set(None, None) == ""
+
+    def test_partial(self):
+        sgr = SGRState()
+        sgr.set(self.red, self.blue)
+        assert sgr.set(self.blue, self.blue) == SGR_FG_DIRECT % self.blue
+        assert sgr.set(self.blue, self.red) == SGR_BG_DIRECT % self.red
+        assert sgr.set(self.red, None) == SGR % "38;2;255;0;0;49"
+        assert sgr.set_bg(self.blue) == SGR_BG_DIRECT % self.blue
+        assert sgr.set(None, self.red) == SGR % "39;48;2;255;0;0"
+        assert sgr.set_bg(None) == SGR_DEFAULT
+        assert (sgr.fg, sgr.bg) == (None, None)
+
+    def test_indexed(self):
+        sgr = SGRState()
+        assert sgr.set_fg(196) == SGR_FG_INDEXED % 196
+        assert sgr.set_bg(21) == SGR_BG_INDEXED % 21
+        assert sgr.set(21, None) == SGR % "38;5;21;49"
+        assert sgr.set(self.red, 196) == SGR % "38;2;255;0;0;48;5;196"
+
+    def test_invalidate(self):
+        sgr = SGRState()
+        sgr.reset()
+        sgr.invalidate()
+        assert sgr.set(None, None) == SGR_DEFAULT
+
+    def test_render(self):
+        image = BlockImage.from_file("tests/images/python.png")
+        image.set_size(40, 20)
+        render = image._renderer(image._render_image, _ALPHA_THRESHOLD)
+        # No line sets the same color twice in a row
+        for line in render.splitlines():
+            sgr = VirtualTerminal()
+            for seq in VirtualTerminal._ctlseq_re.findall(line):
+                fg_bg = (sgr.fg, sgr.bg)
+                sgr.write("\033[%s%s" % seq)
+                assert (sgr.fg, sgr.bg) != fg_bg or seq == ("", "m")
+
+
+@pytest.mark.skipif(not block.numpy, reason="NumPy is not installed")
+class TestRenderEngines:
+    """The array-backed engine must produce output identical to the pure-Python one"""
+
+    images = [
+        BlockImage.from_file(f"tests/images/{name}")
+        for name in ("python.png", "trans.png", "vert.jpg", "lion.gif")
+    ]
+
+    def render_both(self, image, alpha, **kwargs):
+        numpy = block.numpy
+        try:
+            vectorized = image._renderer(image._render_image, alpha, **kwargs)
+            block.numpy = None
+            pure = image._renderer(image._render_image, alpha, **kwargs)
+        finally:
+            block.numpy = numpy
+        return vectorized, pure
+
+    @pytest.mark.parametrize("image", images)
+    @pytest.mark.parametrize("size", [(1, 1), (7, 3), (40, 20)])
+    @pytest.mark.parametrize(
+        "alpha", [_ALPHA_THRESHOLD, 0.0, 0.9, None, "#", "#ff0000"]
+    )
+    def test_identical(self, image, size, alpha):
+        image.set_size(*size)
+        vectorized, pure = self.render_both(image, alpha)
+        assert vectorized == pure
+
+    @pytest.mark.parametrize("image", images)
+    @pytest.mark.parametrize("alpha", [_ALPHA_THRESHOLD, None])
+    def test_indexed(self, image, alpha):
+        image.set_size(40, 20)
+        vectorized, pure = self.render_both(image, alpha, method=INDEXED)
+        assert vectorized == pure
+
+    @pytest.mark.parametrize("image", images)
+    @pytest.mark.parametrize("alpha", [_ALPHA_THRESHOLD, None])
+    @pytest.mark.parametrize("tolerance", [1, 16, 255])
+    @pytest.mark.parametrize("method", [DIRECT, INDEXED])
+    def test_tolerance(self, image, alpha, tolerance, method):
+        image.set_size(40, 20)
+        vectorized, pure = self.render_both(
+            image, alpha, tolerance=tolerance, method=method
+        )
+        assert vectorized == pure
+
+    @pytest.mark.parametrize("image", images)
+    def test_split_cells(self, image):
+        image.set_size(20, 10)
+        vectorized, pure = self.render_both(image, _ALPHA_THRESHOLD, split_cells=True)
+        assert vectorized == pure
+
+    @pytest.mark.parametrize("image", images)
+    def test_kitty_bg(self, image):
+        image.set_size(20, 10)
+        set_fg_bg_colors(bg=(255, 255, 255))
+        toggle_is_on_kitty()
+        try:
+            vectorized, pure = self.render_both(image, None)
+        finally:
+            toggle_is_on_kitty()
+            set_fg_bg_colors((0, 0, 0), (0, 0, 0))
+        assert vectorized == pure
+
+
+class TestDelta:
+    image = BlockImage.from_file("tests/images/lion.gif")
+
+    def get_screen(self, *outputs):
+        terminal = VirtualTerminal()
+        for output in outputs:
+            terminal.x = terminal.y = 0
+            terminal.write(output)
+        return terminal.screen
+
+    def get_run_writer(self, buf_write, sgr):
+        return block._get_run_writer(buf_write, sgr, self.image._get_capabilities())
+
+    @pytest.mark.parametrize("alpha", [_ALPHA_THRESHOLD, None])
+    @pytest.mark.parametrize("fmt", [(None, 0, None, 0), ("<", 60, "_", 30)])
+    def test_damage(self, alpha, fmt):
+        image = self.image
+        image.set_size(40, 20)
+        fmt = image._check_formatting(*fmt)
+        h_align, width, v_align, height = fmt
+        cols, lines = image.rendered_size
+        left = 0 if h_align == "<" else (width - cols) // 2
+        top = height - lines if v_align == "_" else (height - lines) // 2
+        prev_runs = None
+        try:
+            for n in range(image.n_frames):
+                image.seek(n)
+                runs = image._get_runs(image._get_image(), alpha)
+                full = image._format_render(image._write_runs(runs), *fmt)
+                if prev_runs:
+                    prev_full = image._format_render(image._write_runs(prev_runs), *fmt)
+                    output = block._write_damage(
+                        prev_runs,
+                        runs,
+                        1.0,
+                        top,
+                        left,
+                        self.get_run_writer,
+                    )
+                    assert output is not None
+                    assert self.get_screen(prev_full, output) == self.get_screen(full)
+                prev_runs = runs
+        finally:
+            image.seek(0)
+
+    def test_unchanged(self):
+        self.image.set_size(40, 20)
+        runs = self.image._get_runs(self.image._get_image(), _ALPHA_THRESHOLD)
+        output = block._write_damage(runs, runs, 0.5, 0, 0, self.get_run_writer)
+        assert output == "\r"
+
+    def test_threshold(self):
+        image = self.image
+        image.set_size(40, 20)
+        try:
+            old = image._get_runs(image._get_image(), None)
+            image.seek(image.n_frames // 2)
+            new = image._get_runs(image._get_image(), None)
+        finally:
+            image.seek(0)
+        _, damage = zip(*map(block._get_damage, old, new))
+        ratio = sum(damage) / (40 * 20)
+        assert 0 < ratio < 1
+        assert block._write_damage(old, new, ratio, 0, 0, self.get_run_writer)
+        assert (
+            block._write_damage(old, new, ratio * 0.99, 0, 0, self.get_run_writer)
+            is None
+        )
+
+    def test_exact_threshold(self):
+        black, red = (0, 0, 0), (255, 0, 0)
+        old = [[(black, black, 255, 255, 22)]]
+        new = [[(red, black, 255, 255, 15), (black, black, 255, 255, 7)]]
+        # 15 / 22 * 22 > 15
+        assert block._write_damage(old, new, 15 / 22, 0, 0, self.get_run_writer)
+
+    def test_size_change(self):
+        image = self.image
+        image.set_size(40, 20)
+        old = image._get_runs(image._get_image(), None)
+        image.set_size(20, 10)
+        new = image._get_runs(image._get_image(), None)
+        assert block._write_damage(old, new, 1.0, 0, 0, self.get_run_writer) is None
+
+    @pytest.mark.parametrize("delta", [0.1, 1.0])
+    def test_draw(self, delta, capsys):
+        image = self.image
+        image.set_size(40, 20)
+        duration = image._frame_duration
+        image._frame_duration = 0.0
+        try:
+            image.draw(repeat=1, delta=delta, pad_width=60, pad_height=30)
+            drawn = capsys.readouterr().out
+            image.seek(image.n_frames - 1)
+            last_frame = image._format_render(
+                image._render_image(image._get_image(), _ALPHA_THRESHOLD),
+                *image._check_formatting(None, 60, None, 30),
+            )
+        finally:
+            image.seek(0)
+            image._frame_duration = duration
+        assert self.get_screen(drawn) == self.get_screen(last_frame)
+
+    def test_draw_frame_skip(self, capsys, monkeypatch):
+        image = self.image
+        image.set_size(40, 20)
+        duration = image._frame_duration
+        image._frame_duration = 1e-9  # Every frame is late
+        get_runs = image._get_runs
+        rendered = []
+
+        def render(*args, **kwargs):
+            rendered.append(image._seek_position)
+            return get_runs(*args, **kwargs)
+
+        monkeypatch.setattr(image, "_get_runs", render)
+        try:
+            image.draw(repeat=1, delta=0.5, frame_skip=image.n_frames)
+            drawn = capsys.readouterr().out
+            first_frame = image._format_render(
+                image._render_image(image._get_image(), _ALPHA_THRESHOLD),
+                *image._check_formatting(),
+            )
+        finally:
+            image.seek(0)
+            image._frame_duration = duration
+        assert image.dropped_frames == image.n_frames - 1
+        assert rendered == [0]  # Dropped frames are not rendered
+        assert self.get_screen(drawn) == self.get_screen(first_frame)
+
+
+class TestCompress:
+    image = BlockImage.from_file("tests/images/python.png")
+
+    @pytest.fixture
+    def terminal(self):
+        BlockImage._rep_supported = None
+        yield set_terminal_name_version
+        set_terminal_name_version("")
+        BlockImage._rep_supported = None
+
+    def render(self, **kwargs):
+        return self.image._renderer(
+            self.image._render_image, _ALPHA_THRESHOLD, **kwargs
+        )
+
+    def get_screen(self, output):
+        terminal = VirtualTerminal()
+        terminal.write(output)
+        return terminal.screen
+
+    @pytest.mark.parametrize("name", ["", "konsole", "iterm2"])
+    def test_unsupported(self, terminal, name):
+        terminal(name)
+        self.image.set_size(80, 40)
+        assert self.render(compress=True) == self.render()
+
+    @pytest.mark.parametrize("name", sorted(block.REP_TERMINALS))
+    def test_supported(self, terminal, name):
+        terminal(name)
+        self.image.set_size(80, 40)
+        render = self.render()
+        compressed = self.render(compress=True)
+        assert REP % 1 not in compressed  # Not worth it
+        assert len(compressed.encode()) < len(render.encode())
+        assert self.get_screen(compressed) == self.get_screen(render)
+
+    def test_uniform(self, terminal):
+        terminal("xterm")
+        image = BlockImage.from_file("tests/images/trans.png")
+        image.set_size(80, 40)
+        for alpha in (_ALPHA_THRESHOLD, "#ff0000"):
+            render = image._renderer(image._render_image, alpha)
+            compressed = image._renderer(image._render_image, alpha, compress=True)
+            assert len(compressed) * 3 < len(render)
+            assert self.get_screen(compressed) == self.get_screen(render)
+
+    def test_min_run(self, terminal):
+        terminal("xterm")
+        image = BlockImage.from_file("tests/images/trans.png")
+        for width in range(1, 20):
+            image.set_size(width, 1)
+            render = image._renderer(image._render_image, _ALPHA_THRESHOLD)
+            compressed = image._renderer(
+                image._render_image, _ALPHA_THRESHOLD, compress=True
+            )
+            assert len(compressed) <= len(render)
+            assert self.get_screen(compressed) == self.get_screen(render)
+
+    def test_split_cells(self, terminal):
+        terminal("xterm")
+        self.image.set_size(20, 10)
+        assert self.render(compress=True, split_cells=True) == self.render(
+            split_cells=True
+        )
+
+    def test_format_spec(self, terminal):
+        terminal("xterm")
+        self.image.set_size(20, 10)
+        assert f"{self.image:1.1+c1}" == self.render(compress=True)
+        assert f"{self.image:1.1+c0}" == self.render()
+
+
+class TestIndexed:
+    image = BlockImage.from_file("tests/images/python.png")
+
+    def test_lut(self):
+        lut = block._get_indexed_lut()
+        assert block._get_indexed_lut() is lut  # Built only once
+        assert len(lut) == 1 << block.LUT_BITS * 3
+        assert set(lut) <= set(block.INDEXED_PALETTE)
+
+        palette = block.INDEXED_PALETTE
+        mask = (1 << block.LUT_BITS) - 1
+        step = 1 << 8 - block.LUT_BITS
+        for index in range(0, len(lut), 61):
+            # The centre of the bucket
+            rgb = [
+                (index >> shift & mask) * step + step // 2
+                for shift in (block.LUT_BITS * 2, block.LUT_BITS, 0)
+            ]
+
+            def distance(color):
+                return sum((x - y) ** 2 for x, y in zip(color, rgb))
+
+            assert distance(palette[lut[index]]) == min(map(distance, palette.values()))
+
+    def test_palette(self):
+        assert len(block.INDEXED_PALETTE) == 240
+        assert min(block.INDEXED_PALETTE) == 16
+        assert max(block.INDEXED_PALETTE) == 255
+        assert block.INDEXED_PALETTE[16] == (0, 0, 0)
+        assert block.INDEXED_PALETTE[231] == (255, 255, 255)
+        assert block.INDEXED_PALETTE[232] == (8, 8, 8)
+        assert block.INDEXED_PALETTE[255] == (238, 238, 238)
+
+    @pytest.mark.parametrize("alpha", [_ALPHA_THRESHOLD, None, "#ff0000"])
+    def test_render(self, alpha):
+        image = self.image
+        image.set_size(40, 20)
+        direct = image._renderer(image._render_image, alpha)
+        indexed = image._renderer(image._render_image, alpha, method=INDEXED)
+        assert ";2;" not in indexed
+        assert len(indexed) < len(direct)
+
+        terminal = VirtualTerminal()
+        terminal.write(indexed)
+        direct_terminal = VirtualTerminal()
+        direct_terminal.write(direct)
+        assert terminal.screen.keys() == direct_terminal.screen.keys()
+        for char, fg, bg in terminal.screen.values():
+            assert fg is None or 16 <= fg <= 255
+            assert bg is None or 16 <= bg <= 255
+
+    def test_render_method(self):
+        image = self.image
+        image.set_size(20, 10)
+        try:
+            image.set_render_method(INDEXED)
+            indexed = str(image)
+            assert indexed == image._renderer(
+                image._render_image, _ALPHA_THRESHOLD, method=INDEXED
+            )
+            assert f"{image:1.1+D}" != indexed
+            assert f"{image:1.1+I}" == indexed
+        finally:
+            image.set_render_method()
+        assert str(image) == f"{image:1.1+D}"
+
+
+class TestTolerance:
+    image = BlockImage.from_file("tests/images/vert.jpg")
+
+    def get_runs(self, tolerance, alpha=None):
+        return self.image._renderer(self.image._get_runs, alpha, tolerance=tolerance)
+
+    def test_colors_differ(self):
+        for color in ((0, 0, 0), (255, 255, 255), (10, 200, 30)):
+            assert not block._colors_differ(color, color, 0)
+        assert block._colors_differ((0, 0, 0), (0, 0, 1), 0)
+        assert not block._colors_differ((0, 0, 0), (255, 255, 255), 255)
+        assert block._colors_differ((0, 0, 0), (255, 255, 255), 254)
+        # Green differences are more perceptible than blue differences
+        assert block._colors_differ((0, 0, 0), (0, 25, 0), 15)
+        assert not block._colors_differ((0, 0, 0), (0, 0, 25), 15)
+
+    def test_zero(self):
+        self.image.set_size(40, 20)
+        assert self.get_runs(0) == self.get_runs(None)
+
+    def test_runs(self):
+        self.image.set_size(40, 20)
+        n_runs = []
+        for tolerance in (0, 4, 16, 64, 255):
+            lines = self.get_runs(tolerance)
+            n_runs.append(sum(map(len, lines)))
+            _, rgb, _ = self.image._renderer(
+                self.image._get_render_data, None, round_alpha=True
+            )
+            width = self.image.width
+            for line_no, line in enumerate(lines):
+                col = 0
+                for upper, lower, _, _, n in line:
+                    for x in range(col, col + n):
+                        assert not block._colors_differ(
+                            upper, rgb[line_no * 2 * width + x], tolerance
+                        )
+                        assert not block._colors_differ(
+                            lower, rgb[(line_no * 2 + 1) * width + x], tolerance
+                        )
+                    col += n
+        assert n_runs == sorted(n_runs, reverse=True)
+        assert n_runs[-1] == 20  # One run per line
+        assert n_runs[0] > n_runs[1]
+
+    def test_render(self):
+        image = self.image
+        image.set_size(40, 20)
+        render = image._renderer(image._render_image, None)
+        tolerant = image._renderer(image._render_image, None, tolerance=16)
+        assert len(tolerant) < len(render)
+        assert f"{image:1.1#+t16}" == tolerant
+
+
+class TestWorkers:
+    images = TestRenderEngines.images
+
+    def render_both(self, image, alpha, workers=2, **kwargs):
+        serial = image._renderer(image._render_image, alpha, **kwargs)
+        parallel = image._renderer(
+            image._render_image, alpha, workers=workers, **kwargs
+        )
+        return serial, parallel
+
+    @pytest.mark.parametrize("image", images)
+    @pytest.mark.parametrize("alpha", [_ALPHA_THRESHOLD, None, "#ff0000"])
+    @pytest.mark.parametrize("workers", [2, 3])
+    def test_identical(self, image, alpha, workers):
+        image.set_size(41, 21)
+        serial, parallel = self.render_both(image, alpha, workers)
+        assert serial == parallel
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"method": INDEXED},
+            {"tolerance": 16},
+            {"split_cells": True},
+        ],
+    )
+    def test_style_args(self, kwargs):
+        image = self.images[0]
+        image.set_size(40, 20)
+        serial, parallel = self.render_both(image, _ALPHA_THRESHOLD, **kwargs)
+        assert serial == parallel
+
+    def test_more_workers_than_lines(self):
+        image = self.images[0]
+        image.set_size(height=2)
+        serial, parallel = self.render_both(image, None, workers=5)
+        assert serial == parallel
+
+    def test_render_lines(self):
+        image = self.images[0]
+        image.set_size(40, 20)
+        chunks = list(image._renderer(image._render_lines, None, workers=2))
+        assert len(chunks) == 3
+        assert chunks[1] == "\n"
+        assert chunks[0].count("\n") == chunks[2].count("\n") == 9
+
+    def test_capabilities(self):
+        # The workers should use the terminal properties determined by the parent
+        # process, not query the terminal
+        image = self.images[0]
+        image.set_size(20, 10)
+        self.render_both(image, None)  # Ensure the workers are started
+
+        set_fg_bg_colors(bg=(255, 255, 255))
+        toggle_is_on_kitty()
+        try:
+            serial, parallel = self.render_both(image, None)
+        finally:
+            toggle_is_on_kitty()
+            set_fg_bg_colors((0, 0, 0), (0, 0, 0))
+        assert serial == parallel
+
+    @pytest.mark.parametrize("alpha", [_ALPHA_THRESHOLD, None])
+    def test_render_band(self, alpha):
+        image = self.images[0]
+        image.set_size(20, 10)
+        serial = image._renderer(image._render_image, alpha)
+        _, pixels, _ = image._renderer(
+            image._get_render_data, alpha, round_alpha=True, buffer=True
+        )
+        shared_memory = SharedMemory(create=True, size=len(pixels.data))
+        try:
+            shared_memory.buf[: len(pixels.data)] = pixels.data
+            args = (
+                shared_memory.name,
+                slice(0, len(pixels.data)),
+                pixels.size[0],
+                pixels.bands,
+                image._get_capabilities(),
+            )
+            assert block._render_band(*args) == serial
+            numpy = block.numpy
+            block.numpy = None
+            try:
+                assert block._render_band(*args) == serial
+            finally:
+                block.numpy = numpy
+        finally:
+            shared_memory.close()
+            shared_memory.unlink()
+
+    def test_executor_reuse(self):
+        image = self.images[0]
+        image.set_size(20, 10)
+        self.render_both(image, None, workers=2)
+        executor = block._get_executor(2)
+        self.render_both(image, None, workers=2)
+        assert block._get_executor(2) is executor
+        self.render_both(image, None, workers=3)
+        assert block._get_executor(3) is not executor
+
+
+class TestStyleArgs:
+    def test_workers(self):
+        for value in (None, True, False, 1.0, (), "2"):
+            with pytest.raises(TypeError):
+                BlockImage._check_style_args({"workers": value})
+        with pytest.raises(ValueError):
+            BlockImage._check_style_args({"workers": -1})
+
+        assert BlockImage._check_style_args({"workers": 0}) == {}
+        for value in (1, 2, 8):
+            assert BlockImage._check_style_args({"workers": value}) == {
+                "workers": value
+            }
+
+    def test_tolerance(self):
+        for value in (None, True, False, 1.0, (), "2"):
+            with pytest.raises(TypeError):
+                BlockImage._check_style_args({"tolerance": value})
+        for value in (-1, 256):
+            with pytest.raises(ValueError):
+                BlockImage._check_style_args({"tolerance": value})
+
+        assert BlockImage._check_style_args({"tolerance": 0}) == {}
+        for value in (1, 128, 255):
+            assert BlockImage._check_style_args({"tolerance": value}) == {
+                "tolerance": value
+            }
+
+    def test_method(self):
+        for value in (None, 1.0, (), [], 2):
+            with pytest.raises(TypeError):
+                BlockImage._check_style_args({"method": value})
+        for value in ("", " ", "cool"):
+            with pytest.raises(ValueError):
+                BlockImage._check_style_args({"method": value})
+
+        for value in (DIRECT, INDEXED):
+            assert BlockImage._check_style_args({"method": value}) == {"method": value}
+
+    def test_compress(self):
+        for value in (0, 1, None, (), "1"):
+            with pytest.raises(TypeError):
+                BlockImage._check_style_args({"compress": value})
+
+        assert BlockImage._check_style_args({"compress": False}) == {}
+        assert BlockImage._check_style_args({"compress": True}) == {"compress": True}
+
+    def test_delta(self):
+        for value in (None, True, False, (), "0.5"):
+            with pytest.raises(TypeError):
+                BlockImage._check_style_args({"delta": value})
+        for value in (-0.1, 1.1, -1, 2):
+            with pytest.raises(ValueError):
+                BlockImage._check_style_args({"delta": value})
+
+        assert BlockImage._check_style_args({"delta": 0.0}) == {}
+        assert BlockImage._check_style_args({"delta": 0}) == {}
+        for value in (0.1, 0.5, 1.0, 1):
+            assert BlockImage._check_style_args({"delta": value}) == {"delta": value}
+
+
+def test_style_format_spec():
+    for spec, args in (
+        ("", {}),
+        ("c0", {}),
+        ("c1", {"compress": True}),
+        ("D", {"method": DIRECT}),
+        ("I", {"method": INDEXED}),
+        ("Ic1", {"method": INDEXED, "compress": True}),
+        ("t0", {}),
+        ("t8", {"tolerance": 8}),
+        ("t255", {"tolerance": 255}),
+        ("It8c1", {"method": INDEXED, "tolerance": 8, "compress": True}),
+    ):
+        assert BlockImage._check_style_format_spec(spec, spec) == args
+
+    for spec in ("c", "c2", "1", "cc", "d", "i", "DI", "c1I", "t", "t-1", "c1t1"):
+        with pytest.raises(StyleError):
+            BlockImage._check_style_format_spec(spec, spec)
+
+    for spec in ("t256", "t999"):
+        with pytest.raises(ValueError):
+            BlockImage._check_style_format_spec(spec, spec)
@@ -1152,6 +1152,8 @@ class TestRenderAnim:
     no_file_img = Image.open(open("tests/images/lion.gif", "rb"))
     no_file_image = ITerm2Image(no_file_img, height=_size)
 
+    buffer_image = ITerm2Image.from_bytes(gif_file, height=_size)
+
     def render_native_anim(self, image):
         return image._renderer(image._render_image, 0.0, method=ANIM)
 
@@ -1162,6 +1164,7 @@ class TestRenderAnim:
             (self.webp_image, self.webp_file),
             (self.gif_image, self.gif_file),
             (self.img_image, self.gif_file),
+            (self.buffer_image, self.gif_file),
         ):
             for ITerm2Image._TERM in supported_terminals:
                 assert (
@@ -1213,6 +1216,8 @@ def test_read_from_file():
         jpeg_file = f.read()
     jpeg_image = ITerm2Image.from_file("tests/images/vert.jpg")
     jpeg_image.set_render_method(WHOLE)
+    jpeg_buffer_image = ITerm2Image.from_bytes(jpeg_file)
+    jpeg_buffer_image.set_render_method(WHOLE)
 
     ITerm2Image.read_from_file = True
     try:
@@ -1237,7 +1242,11 @@ def test_read_from_file():
             )[3]
         )
 
-        for image, file in ((png_image, png_file), (jpeg_image, jpeg_file)):
+        for image, file in (
+            (png_image, png_file),
+            (jpeg_image, jpeg_file),
+            (jpeg_buffer_image, jpeg_file),
+        ):
             lines_for_original_height = ITerm2Image._pixels_lines(
                 pixels=image.original_size[1]
             )
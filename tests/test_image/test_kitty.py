@@ -1,16 +1,27 @@
 """KittyImage-specific tests"""
 
 import io
+import os
+import tempfile
 from base64 import standard_b64decode
 from contextlib import contextmanager
 from zlib import decompress
 
+try:
+    from mmap import ACCESS_READ, mmap
+    from multiprocessing import resource_tracker
+
+    import _posixshmem
+except ImportError:
+    _posixshmem = None
+
 import pytest
+from PIL import Image
 
 from term_image import _ctlseqs as ctlseqs
 from term_image.exceptions import StyleError
-from term_image.image import kitty
-from term_image.image.kitty import LINES, WHOLE, KittyImage
+from term_image.image import ImageIterator, kitty
+from term_image.image.kitty import ANIM, LINES, WHOLE, KittyImage
 
 from .. import set_fg_bg_colors
 from . import common
@@ -93,6 +104,7 @@ def test_style_format_spec():
         ("", {}),
         ("L", {"method": LINES}),
         ("W", {"method": WHOLE}),
+        ("A", {"method": ANIM}),
         ("z0", {}),
         ("z1", {"z_index": 1}),
         ("z-1", {"z_index": -1}),
@@ -122,7 +134,7 @@ class TestStyleArgs:
             with pytest.raises(ValueError):
                 KittyImage._check_style_args({"method": value})
 
-        for value in (LINES, WHOLE):
+        for value in (LINES, WHOLE, ANIM):
             assert KittyImage._check_style_args({"method": value}) == {"method": value}
 
     def test_z_index(self):
@@ -607,6 +619,158 @@ class TestRenderWhole:
         assert render.startswith(ctlseqs.KITTY_DELETE_CURSOR)
 
 
+def decode_commands(render):
+    """Returns the control codes and decoded payload of every command in a render,
+    and the fill following the last command.
+    """
+    commands = []
+    for escape in render.split(ctlseqs.KITTY_START)[1:]:
+        transmission, end, fill = escape.partition(ctlseqs.ST)
+        assert end == ctlseqs.ST
+        control_data, payload = transmission.split(";")
+        control_codes = dict(code.split("=") for code in control_data.split(","))
+        if "a" in control_codes:
+            commands.append([control_codes, payload])
+        else:  # Continuation chunk
+            assert set(control_codes) == {"m"}
+            commands[-1][1] += payload
+
+    for command in commands:
+        control_codes, payload = command
+        payload = standard_b64decode(payload.encode())
+        if control_codes.get("o") == "z":
+            payload = decompress(payload)
+        command[1] = payload
+
+    return commands, fill
+
+
+class TestRenderAnim:
+    gif_image = KittyImage.from_file("tests/images/lion.gif", height=_size)
+    trans = KittyImage.from_file("tests/images/trans.png", height=_size)
+
+    def render_native_anim(self, image, **kwargs):
+        return image._renderer(image._render_image, 0.0, method=ANIM, **kwargs)
+
+    def test_frames(self):
+        image = self.gif_image
+        commands, fill = decode_commands(self.render_native_anim(image))
+        (root, root_data), (gap, _), *frames, (start, _) = commands
+        image_id = root["i"]
+
+        cols, lines = image.rendered_size
+        w, h = image._get_minimal_render_size()
+        assert root["a"] == "T"
+        assert (root["s"], root["v"], root["c"], root["r"]) == tuple(
+            map(str, (w, h, cols, lines))
+        )
+        assert gap == {"a": "a", "i": image_id, "r": "1", "z": "100", "q": "2"}
+        assert start == {"a": "a", "i": image_id, "s": "3", "v": "1", "q": "2"}
+        assert len(frames) == image.n_frames - 1
+        assert fill.count("\n") + 1 == lines
+
+        mode = {"24": "RGB", "32": "RGBA"}
+        canvases = [Image.frombytes(mode[root["f"]], (w, h), root_data)]
+        for n, (control_codes, data) in enumerate(frames, 1):
+            assert control_codes["a"] == "f"
+            assert control_codes["i"] == image_id
+            assert control_codes["c"] == str(n)  # Composed onto the previous frame
+            assert control_codes["X"] == "1"
+            assert control_codes["z"] == "100"
+            assert "C" not in control_codes
+
+            size = (int(control_codes["s"]), int(control_codes["v"]))
+            region = Image.frombytes(mode[control_codes["f"]], size, data)
+            canvas = canvases[-1].convert("RGBA")
+            canvas.paste(
+                region.convert("RGBA"),
+                (int(control_codes["x"]), int(control_codes["y"])),
+            )
+            canvases.append(canvas)
+
+        # Every composed frame is the same as the frame rendered on its own
+        try:
+            for n, canvas in enumerate(canvases):
+                image.seek(n)
+                control_codes, whole, _ = decode_image(f"{image:1.1+W}")
+                expected = Image.frombytes(
+                    mode[dict(control_codes)["f"]], (w, h), whole
+                )
+                assert canvas.convert("RGBA") == expected.convert("RGBA")
+        finally:
+            image.seek(0)
+
+    def test_deltas(self):
+        # Only the changed region of each frame is transmitted
+        commands, _ = decode_commands(self.render_native_anim(self.gif_image))
+        w, h = self.gif_image._get_minimal_render_size()
+        assert any(
+            int(control_codes["s"]) * int(control_codes["v"]) < w * h
+            for control_codes, _ in commands[2:-1]
+        )
+
+    @staticmethod
+    def make_gif(path, **kwargs):
+        frames = [
+            Image.new("RGB", (20, 20), color) for color in ("red", "lime", "blue")
+        ]
+        frames[0].save(path, save_all=True, append_images=frames[1:], **kwargs)
+        return KittyImage.from_file(str(path), height=_size)
+
+    def test_frame_duration(self, tmp_path):
+        # Used only for frames without a duration
+        image = self.make_gif(tmp_path / "anim.gif")
+        image.frame_duration = 0.05
+        commands, _ = decode_commands(self.render_native_anim(image))
+        assert commands[1][0]["z"] == "50"
+        assert all(control_codes["z"] == "50" for control_codes, _ in commands[2:-1])
+
+    def test_per_frame_duration(self, tmp_path):
+        image = self.make_gif(tmp_path / "anim.gif", duration=[40, 80, 120])
+        image.frame_duration = 0.05
+        commands, _ = decode_commands(self.render_native_anim(image))
+        assert commands[1][0]["z"] == "40"
+        assert [control_codes["z"] for control_codes, _ in commands[2:-1]] == [
+            "80",
+            "120",
+        ]
+
+    def test_z_index_and_blend(self):
+        render = self.render_native_anim(self.gif_image, z_index=-5, blend=False)
+        assert render.startswith(ctlseqs.KITTY_DELETE_CURSOR)
+        (delete, _), (root, _), *_ = decode_commands(render)[0]
+        assert delete == {"a": "d", "d": "C"}
+        assert root["z"] == "-5"
+
+    def test_seek_position(self):
+        image = self.gif_image
+        image.seek(2)
+        try:
+            self.render_native_anim(image)
+            assert image.tell() == 2
+        finally:
+            image.seek(0)
+
+    def test_unique_image_id(self):
+        assert (
+            decode_commands(self.render_native_anim(self.gif_image))[0][0][0]["i"]
+            != decode_commands(self.render_native_anim(self.gif_image))[0][0][0]["i"]
+        )
+
+    def test_fallback_to_whole(self):
+        # Non-animated
+        assert self.render_native_anim(self.trans) == self.trans._renderer(
+            self.trans._render_image, 0.0, method=WHOLE
+        )
+
+        # Frames of non-native animations
+        image_it = ImageIterator(self.gif_image, 1, "1.1+A")
+        try:
+            assert "a=f" not in next(image_it)
+        finally:
+            image_it.close()
+
+
 class TestClear:
     @contextmanager
     def setup_buffer(self):
@@ -710,5 +874,357 @@ class TestClear:
         finally:
             KittyImage._supported = True
 
+    def test_placements_only(self):
+        KittyImage.id_cache_max_bytes = 2**24
+        try:
+            with self.setup_buffer() as (buf, tty_buf):
+                KittyImage.clear()
+                KittyImage.clear(cursor=True, now=True)
+                KittyImage.clear(z_index=1)
+                assert buf.getvalue() == (
+                    ctlseqs.KITTY_DELETE_ALL_PLACEMENTS
+                    + ctlseqs.KITTY_DELETE_Z_INDEX_PLACEMENTS % 1
+                )
+                assert tty_buf.getvalue() == ctlseqs.KITTY_DELETE_CURSOR_PLACEMENTS_b
+        finally:
+            KittyImage.id_cache_max_bytes = 0
+
+
+class TestIDCache:
+    @pytest.fixture(autouse=True)
+    def enabled(self):
+        KittyImage.id_cache_max_bytes = 2**24
+        yield
+        KittyImage.id_cache_max_bytes = 0
+        kitty._evicted_ids.clear()
+
+    @staticmethod
+    def new_image(method, source="tests/images/python.png"):
+        image = KittyImage.from_file(source, height=_size)
+        image.set_render_method(method)
+        return image
+
+    @staticmethod
+    def render(image, alpha=None, **style_args):
+        return image._renderer(image._render_image, alpha, **style_args)
+
+    @staticmethod
+    def get_ids(render, action):
+        return [
+            control_codes["i"]
+            for control_codes, _ in decode_commands(render)[0]
+            if control_codes["a"] == action
+        ]
+
+    def test_max_bytes(self):
+        KittyImage.id_cache_max_bytes = 0
+        assert KittyImage.id_cache_max_bytes == 0
+
+        for value in (None, 1.0, "1"):
+            with pytest.raises(TypeError):
+                KittyImage.id_cache_max_bytes = value
+        with pytest.raises(ValueError):
+            KittyImage.id_cache_max_bytes = -1
+
+        with pytest.raises(AttributeError):
+            self.new_image(LINES).id_cache_max_bytes = 0
+
+    @pytest.mark.parametrize("method", [LINES, WHOLE])
+    def test_replace(self, method):
+        image = self.new_image(method)
+        first = self.render(image)
+        transmitted = self.get_ids(first, "T")
+        assert len(transmitted) == (image.rendered_height if method == LINES else 1)
+
+        # By other instances with the same source
+        second = self.render(self.new_image(method))
+        assert self.get_ids(second, "p") == transmitted
+        assert self.get_ids(second, "T") == []
+        assert len(second) < len(first) // 10
+        assert second.count("\n") == first.count("\n")
+
+        cols, lines = image.rendered_size
+        for control_codes, payload in decode_commands(second)[0]:
+            assert payload == b""
+            assert control_codes["c"] == str(cols)
+            assert control_codes["r"] == ("1" if method == LINES else str(lines))
+            assert control_codes["C"] == "1"
+            assert control_codes["q"] == "2"
+
+    def test_key(self):
+        image = self.new_image(WHOLE)
+        (image_id,) = self.get_ids(self.render(image), "T")
+
+        # Placement arguments
+        for style_args in ({"z_index": 1}, {"mix": True}, {"compress": 9}):
+            render = self.render(image, **style_args)
+            assert self.get_ids(render, "p") == [image_id]
+        assert decode_commands(self.render(image, z_index=1))[0][0][0]["z"] == "1"
+
+        # Pixel data
+        assert self.get_ids(self.render(image, 0.0), "p") == []
+        assert self.get_ids(self.render(self.new_image(LINES)), "p") == []
+        image.height = _size // 2
+        assert self.get_ids(self.render(image), "p") == []
+
+    def test_blend_false(self):
+        image = self.new_image(WHOLE)
+        for _ in range(2):
+            render = self.render(image, blend=False)
+            assert render.startswith(ctlseqs.KITTY_DELETE_CURSOR_PLACEMENTS)
+
+    def test_eviction(self):
+        image = self.new_image(WHOLE)
+        (image_id,) = self.get_ids(self.render(image), "T")
+        KittyImage.id_cache_max_bytes = kitty._id_cache.size
+
+        # The least-recently-rendered image is deleted by the next render
+        other = self.new_image(WHOLE)
+        other.height = _size // 2
+        render = self.render(other)
+        assert not render.startswith(ctlseqs.KITTY_DELETE_ID % int(image_id))
+        render = self.render(other)
+        assert render.startswith(ctlseqs.KITTY_DELETE_ID % int(image_id))
+        assert self.get_ids(self.render(image), "T")
+
+    def test_oversized(self):
+        KittyImage.id_cache_max_bytes = 1
+        image = self.new_image(WHOLE)
+        for _ in range(2):
+            assert "i" not in decode_commands(self.render(image))[0][0][0]
+        assert not kitty._evicted_ids
+
+    def test_pil_image(self):
+        image = KittyImage(python_img, height=_size)
+        for _ in range(2):
+            assert "i" not in decode_commands(self.render(image))[0][0][0]
+
+    def test_frames(self):
+        image = self.new_image(WHOLE, "tests/images/lion.gif")
+        image_it = ImageIterator(image, 1, "1.1")
+        try:
+            for frame in image_it:
+                assert "i" not in decode_commands(frame)[0][0][0]
+        finally:
+            image_it.close()
+
+    def test_render_cache(self, tmp_path):
+        KittyImage.render_cache_dir = tmp_path
+        try:
+            image = self.new_image(WHOLE)
+            for action in ("T", "p"):
+                render = image._renderer(image._render_cached, None)
+                assert self.get_ids(render, action)
+            assert not any(tmp_path.iterdir())
+        finally:
+            KittyImage.render_cache_dir = None
+
+
+def read_local(control_codes, name):
+    """Reads and deletes the file or shared memory object read by the terminal
+    emulator for a transmission through a local medium.
+    """
+    size = int(control_codes["S"])
+    if control_codes["t"] == "t":
+        with open(name, "rb") as file:
+            data = file.read()
+        os.remove(name)
+    else:
+        # As the terminal emulator would, with the name as transmitted
+        fd = _posixshmem.shm_open(name.decode(), os.O_RDONLY)
+        try:
+            with mmap(fd, size, access=ACCESS_READ) as buf:
+                data = buf[:]
+        finally:
+            os.close(fd)
+            _posixshmem.shm_unlink(name.decode())
+
+    assert len(data) == size
+    return data
+
+
+class TestTransmissionMedium:
+    image = KittyImage.from_file("tests/images/python.png", height=_size)
+
+    @pytest.fixture(autouse=True)
+    def reset(self, monkeypatch, tmp_path, capfd):
+        monkeypatch.setattr(tempfile, "tempdir", str(tmp_path))
+
+        # Shared memory objects registered with the resource tracker, which would
+        # unlink them when this process exits
+        registered = set()
+        if _posixshmem:
+            register, unregister = (
+                resource_tracker.register,
+                resource_tracker.unregister,
+            )
+
+            def track(name, rtype):
+                registered.add(name)
+                register(name, rtype)
+
+            def untrack(name, rtype):
+                registered.remove(name)  # KeyError, as in the tracker process
+                unregister(name, rtype)
+
+            monkeypatch.setattr(resource_tracker, "register", track)
+            monkeypatch.setattr(resource_tracker, "unregister", untrack)
+
+        yield
+        KittyImage.transmission_medium = "direct"
+        kitty._local_medium = None
+        assert not registered
+        assert capfd.readouterr().err == ""
+
+    @staticmethod
+    def terminal(readable):
+        """Returns a stand-in for `query_terminal()`, for a terminal emulator that
+        can read local data if *readable* is true.
+        """
+
+        def query_terminal(request, more, timeout=None):
+            response = []
+            for escape in request.decode().split(ctlseqs.KITTY_START)[1:]:
+                control_data, name = escape.partition(ctlseqs.ST)[0].split(";")
+                control_codes = dict(
+                    code.split("=") for code in control_data.split(",")
+                )
+                if readable:
+                    assert read_local(control_codes, standard_b64decode(name)) == bytes(
+                        3
+                    )
+                response.append(
+                    ctlseqs.KITTY_START
+                    + f"i={control_codes['i']};"
+                    + ("OK" if readable else "ENOENT:No such file or directory")
+                    + ctlseqs.ST
+                )
+            return ("".join(response) + "\033[?62;c").encode()
+
+        return query_terminal
+
+    def render(self, image=None, **style_args):
+        image = image or self.image
+        return image._renderer(image._render_image, None, method=WHOLE, **style_args)
+
+    def test_medium(self):
+        assert KittyImage.transmission_medium == "direct"
+        for value in ("direct", "temp_file", "shared_memory", "auto"):
+            KittyImage.transmission_medium = value
+            assert KittyImage.transmission_medium == value
+
+        for value in (None, 1, b"auto"):
+            with pytest.raises(TypeError):
+                KittyImage.transmission_medium = value
+        for value in ("", "file", "Direct"):
+            with pytest.raises(ValueError):
+                KittyImage.transmission_medium = value
+
+        with pytest.raises(AttributeError):
+            self.image.transmission_medium = "auto"
+
+    @pytest.mark.parametrize("medium", ["temp_file", "shared_memory"])
+    def test_local(self, medium):
+        (direct, direct_data), *_ = decode_commands(self.render(compress=0))[0]
+
+        KittyImage.transmission_medium = medium
+        render = self.render()
+        ((control_codes, name),), fill = decode_commands(render)
+        assert control_codes["t"] == ("t" if medium == "temp_file" else "s")
+        assert "o" not in control_codes
+        assert read_local(control_codes, name) == direct_data
+        assert {
+            key: value
+            for key, value in control_codes.items()
+            if key not in {"t", "S", "m"}
+        } == {key: value for key, value in direct.items() if key not in {"t", "m"}}
+
+    def test_local_lines(self):
+        KittyImage.transmission_medium = "temp_file"
+        image = KittyImage.from_file("tests/images/python.png", height=_size)
+        image.set_render_method(LINES)
+        render = image._renderer(image._render_image, None)
+        commands = decode_commands(render)[0]
+        assert len(commands) == image.rendered_height
+        for control_codes, name in commands:
+            assert control_codes["t"] == "t"
+            read_local(control_codes, name)
+
+    def test_fallback(self, monkeypatch):
+        def fail(*_):
+            raise OSError
+
+        monkeypatch.setattr(kitty, "_write_local", fail)
+        KittyImage.transmission_medium = "shared_memory"
+        (control_codes, _), *_ = decode_commands(self.render())[0]
+        assert control_codes["t"] == "d"
+        assert "S" not in control_codes
+
+    def test_auto_local(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(kitty, "query_terminal", self.terminal(True))
+        KittyImage.transmission_medium = "auto"
+        (control_codes, name), *_ = decode_commands(self.render())[0]
+        expected = "s" if kitty.SharedMemory else "t"
+        assert control_codes["t"] == expected
+        read_local(control_codes, name)
+        assert kitty._local_medium in {"shared_memory", "temp_file"}
+
+        # Detected only once
+        monkeypatch.setattr(kitty, "query_terminal", None)
+        (control_codes, name), *_ = decode_commands(self.render())[0]
+        assert control_codes["t"] == expected
+        read_local(control_codes, name)
+        assert not any(tmp_path.iterdir())
+
+    @pytest.mark.parametrize("response", [False, None])
+    def test_auto_remote(self, monkeypatch, tmp_path, response):
+        monkeypatch.setattr(
+            kitty,
+            "query_terminal",
+            self.terminal(False) if response is False else lambda *_: None,
+        )
+        KittyImage.transmission_medium = "auto"
+        (control_codes, _), *_ = decode_commands(self.render())[0]
+        assert control_codes["t"] == "d"
+        assert kitty._local_medium == "direct"
+        # Probes are cleaned up
+        assert not any(tmp_path.iterdir())
+
+    def test_frames(self):
+        KittyImage.transmission_medium = "temp_file"
+        image = KittyImage.from_file("tests/images/lion.gif", height=_size)
+        image_it = ImageIterator(image, 1, "1.1")
+        try:
+            for frame in image_it:
+                assert decode_commands(frame)[0][0][0]["t"] == "d"
+        finally:
+            image_it.close()
+
+    def test_native_anim(self):
+        KittyImage.transmission_medium = "temp_file"
+        image = KittyImage.from_file("tests/images/lion.gif", height=_size)
+        render = image._renderer(image._render_image, 0.0, method=ANIM)
+        for control_codes, name in decode_commands(render)[0]:
+            if control_codes["a"] in {"T", "f"}:
+                assert control_codes["t"] == "t"
+                read_local(control_codes, name)
+
+    def test_render_cache(self, tmp_path):
+        KittyImage.transmission_medium = "temp_file"
+        KittyImage.render_cache_dir = tmp_path / "cache"
+        try:
+            names = set()
+            for _ in range(2):
+                render = self.image._renderer(
+                    self.image._render_cached, None, method=WHOLE
+                )
+                ((control_codes, name),), _ = decode_commands(render)
+                names.add(name)
+                read_local(control_codes, name)
+            assert len(names) == 2
+            assert not (tmp_path / "cache").exists()
+        finally:
+            KittyImage.render_cache_dir = None
+
 
 FILL = ctlseqs.ERASE_CHARS + ctlseqs.CURSOR_FORWARD
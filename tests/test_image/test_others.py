@@ -2,7 +2,16 @@ from pathlib import Path
 
 import pytest
 
-from term_image.image import AutoImage, BaseImage, ImageSource, Size, from_file
+from term_image.image import (
+    AutoImage,
+    BaseImage,
+    ImageSource,
+    Size,
+    from_buffer,
+    from_bytes,
+    from_file,
+    from_files,
+)
 
 from .test_base import BytesPath, python_image, python_img
 
@@ -18,6 +27,20 @@ class TestFactoryFunctions:
 
         assert isinstance(AutoImage(python_img), BaseImage)
 
+    def test_from_buffer_bytes(self):
+        with open(python_image, "rb") as f:
+            data = f.read()
+
+        for from_data, name in ((from_buffer, "buffer"), (from_bytes, "data")):
+            with pytest.raises(TypeError, match=rf"'{name}'"):
+                from_data(python_image)
+
+            # Ensure size arguments get through
+            with pytest.raises(TypeError, match="'width' and 'height'"):
+                from_data(data, width=1, height=Size.FIT)
+
+            assert isinstance(from_data(data), BaseImage)
+
     def test_from_file(self):
         with pytest.raises(TypeError, match=r"'filepath'"):
             from_file(python_img)
@@ -29,7 +52,15 @@ class TestFactoryFunctions:
         for path in (python_image, Path(python_image), BytesPath(python_image)):
             assert isinstance(from_file(path), BaseImage)
 
+    def test_from_files(self):
+        with pytest.raises(TypeError, match=r"'filepaths'"):
+            from_files(python_image)
+
+        results = from_files([python_image, python_image + "e"], max_workers=2)
+        assert isinstance(results[0], BaseImage)
+        assert isinstance(results[1], FileNotFoundError)
+
 
 def test_image_source():
-    assert len(ImageSource) == 3
+    assert len(ImageSource) == 4
     assert all(member.name == name for name, member in ImageSource.__members__.items())
@@ -4,8 +4,17 @@ import os
 import pytest
 from PIL import Image, UnidentifiedImageError
 
-from term_image.exceptions import URLNotFoundError
-from term_image.image import BaseImage, BlockImage, ImageSource, Size, from_url
+from term_image.exceptions import TermImageError, URLNotFoundError
+from term_image.image import (
+    BaseImage,
+    BlockImage,
+    ImageSource,
+    Size,
+    from_url,
+    from_urls,
+)
+
+from ..test_http import Handler, python_data, server  # noqa: F401
 
 python_image = "tests/images/python.png"
 python_url = (
@@ -59,6 +68,105 @@ def test_close():
         image._url
 
 
+def test_url_max_bytes():
+    assert BaseImage.url_max_bytes == BlockImage.url_max_bytes == 64 * 2**20
+    for value in (None, 1.0, "1"):
+        with pytest.raises(TypeError):
+            BaseImage.url_max_bytes = value
+    with pytest.raises(ValueError):
+        BaseImage.url_max_bytes = -1
+
+    image = BlockImage(python_img)
+    with pytest.raises(AttributeError):
+        image.url_max_bytes = 0
+
+
+def test_url_cache_dir(tmp_path):
+    assert BaseImage.url_cache_dir is None
+    for value in (1, b"dir"):
+        with pytest.raises(TypeError):
+            BaseImage.url_cache_dir = value
+
+    image = BlockImage(python_img)
+    with pytest.raises(AttributeError):
+        image.url_cache_dir = None
+
+    try:
+        BaseImage.url_cache_dir = tmp_path
+        assert BlockImage.url_cache_dir == str(tmp_path)
+        BaseImage.url_cache_dir = os.path.relpath(tmp_path)
+        assert BaseImage.url_cache_dir == str(tmp_path)
+    finally:
+        BaseImage.url_cache_dir = None
+    assert BaseImage.url_cache_dir is None
+
+
+class TestLocal:
+    def test_from_url(self, server):  # noqa: F811
+        url = f"{server}/etag.png"
+        image = BlockImage.from_url(url)
+        assert image.source == url
+        with open(image._source, "rb") as f:
+            assert f.read() == python_data
+
+        with pytest.raises(URLNotFoundError):
+            BlockImage.from_url(f"{server}/missing.png")
+
+    def test_max_bytes(self, server):  # noqa: F811
+        try:
+            BaseImage.url_max_bytes = len(python_data) - 1
+            with pytest.raises(TermImageError, match="larger than"):
+                BlockImage.from_url(f"{server}/etag.png")
+            BaseImage.url_max_bytes = 0
+            BlockImage.from_url(f"{server}/etag.png")
+        finally:
+            BaseImage.url_max_bytes = 64 * 2**20
+
+    def test_cache(self, server, tmp_path):  # noqa: F811
+        url = f"{server}/etag.png"
+        Handler.requests.clear()
+        try:
+            BaseImage.url_cache_dir = tmp_path
+            BlockImage.from_url(url)
+            BlockImage.from_url(url)
+        finally:
+            BaseImage.url_cache_dir = None
+        assert "If-None-Match" in Handler.requests[-1][1]
+        assert os.listdir(tmp_path / "data")
+
+    def test_from_urls(self, server):  # noqa: F811
+        for urls in (None, python_url, 1):
+            with pytest.raises(TypeError, match="'urls'"):
+                BlockImage.from_urls(urls)
+        for value in (1.0, True):
+            with pytest.raises(TypeError, match="'max_workers'"):
+                BlockImage.from_urls([], max_workers=value)
+        with pytest.raises(ValueError, match="'max_workers'"):
+            BlockImage.from_urls([], max_workers=0)
+        assert BlockImage.from_urls([]) == []
+
+        urls = [f"{server}/etag.png", f"{server}/missing.png", python_image] * 5
+        for max_workers in (1, 4, 16):
+            results = BlockImage.from_urls(iter(urls), max_workers=max_workers)
+            assert len(results) == len(urls)
+            for image, url in zip(results[::3], urls[::3]):
+                assert isinstance(image, BlockImage)
+                assert image.source == url
+            assert all(isinstance(e, URLNotFoundError) for e in results[1::3])
+            assert all(isinstance(e, ValueError) for e in results[2::3])
+
+        # Ensure size arguments get through
+        (image,) = BlockImage.from_urls([f"{server}/etag.png"], width=10)
+        assert image.width == 10
+        (error,) = from_urls([f"{server}/etag.png"], width=1, height=Size.FIT)
+        assert isinstance(error, TypeError)
+
+        assert all(
+            isinstance(image, BaseImage)
+            for image in from_urls([f"{server}/etag.png"] * 3, max_workers=2)
+        )
+
+
 class TestFactoryFunction:
     def test_from_url(self):
         with pytest.raises(TypeError, match=r"'url'"):
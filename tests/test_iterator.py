@@ -1,12 +1,27 @@
 import atexit
+import shutil
+import sys
+from hashlib import sha256
+from threading import current_thread, main_thread
 from types import GeneratorType
 
 import pytest
 from PIL import Image
 
+from term_image import utils
 from term_image._ctlseqs import SGR_DEFAULT
 from term_image.exceptions import TermImageError
-from term_image.image import BlockImage, ImageIterator, Size
+from term_image.image import (
+    BaseImage,
+    BlockImage,
+    ImageIterator,
+    ImageSource,
+    ITerm2Image,
+    KittyImage,
+    Size,
+    common,
+)
+from term_image.image.common import _frame_cache
 
 _size = (30, 15)
 
@@ -53,6 +68,20 @@ def test_args():
         with pytest.raises(ValueError, match="'cached'"):
             ImageIterator(gif_image, cached=value)
 
+    for value in (None, 2.0, "2", True):
+        with pytest.raises(TypeError, match="'prefetch'"):
+            ImageIterator(gif_image, prefetch=value)
+    for value in (-1, -10):
+        with pytest.raises(ValueError, match="'prefetch'"):
+            ImageIterator(gif_image, prefetch=value)
+
+    for value in (None, 2.0, "2", True):
+        with pytest.raises(TypeError, match="'cache_max_bytes'"):
+            ImageIterator(gif_image, cache_max_bytes=value)
+    for value in (-1, -10):
+        with pytest.raises(ValueError, match="'cache_max_bytes'"):
+            ImageIterator(gif_image, cache_max_bytes=value)
+
 
 class TestInit:
     def test_defaults(self):
@@ -62,6 +91,7 @@ class TestInit:
             assert image_it._repeat == -1
             assert image_it._format == ""
             assert image_it._cached is (image.n_frames <= 100)
+            assert image_it._prefetch == 0
             assert isinstance(image_it._animator, GeneratorType)
 
     def test_with_args(self):
@@ -413,3 +443,214 @@ class TestSeek:
         assert frame_1 == next(image_it) is cache[1][0]
         image_it.seek(6)
         assert frame_6 == next(image_it) is cache[6][0]
+
+
+class TestCacheMaxBytes:
+    def test_cached(self):
+        image_it = ImageIterator(gif_image, 2, cached=1, cache_max_bytes=1)
+        assert image_it._cached is True
+        image_it = ImageIterator(gif_image, 1, cached=1, cache_max_bytes=1)
+        assert image_it._cached is False
+        image_it = ImageIterator(gif_image, 2, cached=False, cache_max_bytes=1)
+        assert image_it._cached is False
+
+    def test_partial(self):
+        frames = tuple(ImageIterator(gif_image, 1, "1.1"))
+        n_frames = gif_image.n_frames
+        max_bytes = sum(map(sys.getsizeof, frames[:5]))
+        image_it = ImageIterator(gif_image, 3, "1.1", cache_max_bytes=max_bytes)
+        assert image_it.cache_info is None
+
+        assert tuple(image_it) == frames * 3
+        # Only the first 5 frames fit
+        assert image_it.cache_info == (10, n_frames * 3 - 10, 0, 0, max_bytes)
+
+    def test_cache_info(self):
+        image_it = ImageIterator(gif_image, 2, "1.1", cached=True)
+        for _ in range(gif_image.n_frames + 2):
+            next(image_it)
+        hits, misses, n_frames, size, max_size = image_it.cache_info
+        assert (hits, misses, n_frames) == (2, gif_image.n_frames, gif_image.n_frames)
+        assert size > 0
+        assert max_size == 0
+
+        image_it.close()
+        assert image_it.cache_info[:4] == (2, gif_image.n_frames, 0, 0)
+
+
+class TestSharedFrameCache:
+    @pytest.fixture(autouse=True)
+    def enabled(self):
+        BaseImage.frame_cache_max_bytes = 2**24
+        yield
+        BaseImage.frame_cache_max_bytes = 0
+
+    @staticmethod
+    def counting_image(calls, source="tests/images/lion.gif"):
+        def render(*args, **kwargs):
+            calls.append(image.tell())
+            return BlockImage._render_image(image, *args, **kwargs)
+
+        image = BlockImage.from_file(source)
+        image._size = _size
+        image._render_image = render
+        return image
+
+    def test_max_bytes(self):
+        BaseImage.frame_cache_max_bytes = 0
+        assert BaseImage.frame_cache_max_bytes == 0
+        assert BlockImage.frame_cache_max_bytes == 0
+
+        for value in (None, 1.0, "1"):
+            with pytest.raises(TypeError):
+                BaseImage.frame_cache_max_bytes = value
+        with pytest.raises(ValueError):
+            BaseImage.frame_cache_max_bytes = -1
+
+        with pytest.raises(AttributeError):
+            gif_image.frame_cache_max_bytes = 0
+
+    def test_shared(self):
+        calls = []
+        frames = tuple(ImageIterator(self.counting_image(calls), 1, "1.1"))
+        n_frames = len(frames)
+        assert len(calls) == n_frames + 1  # +1 for EOF call
+
+        # By other iterators over other instances with the same source
+        calls.clear()
+        assert tuple(ImageIterator(self.counting_image(calls), 1, "1.1")) == frames
+        assert len(calls) == 1  # EOF call
+
+        # Not with a different format specifier or size
+        calls.clear()
+        tuple(ImageIterator(self.counting_image(calls), 1, "1.1#"))
+        assert len(calls) == n_frames + 1
+        calls.clear()
+        image = self.counting_image(calls)
+        image._size = (20, 10)
+        tuple(ImageIterator(image, 1, "1.1"))
+        assert len(calls) == n_frames + 1
+
+    def test_pil_image(self):
+        _frame_cache.clear()
+        tuple(ImageIterator(gif_image, 1, "1.1"))
+        assert len(_frame_cache) == 0
+
+    def test_disabled(self):
+        BaseImage.frame_cache_max_bytes = 0
+        calls = []
+        tuple(ImageIterator(self.counting_image(calls), 1, "1.1"))
+        tuple(ImageIterator(self.counting_image(calls), 1, "1.1"))
+        assert len(calls) == (gif_image.n_frames + 1) * 2
+
+
+class TestPrefetch:
+    def test_frames(self):
+        for image in (gif_image, webp_image):
+            for cached in (False, True):
+                frames = tuple(ImageIterator(image, 2, "1.1", cached))
+                assert tuple(ImageIterator(image, 2, "1.1", cached, 4)) == frames
+
+    @pytest.mark.parametrize("cls", [ITerm2Image, KittyImage])
+    def test_graphics_styles(self, cls):
+        image = cls(gif_img)
+        image._size = _size
+        frames = tuple(ImageIterator(image, 1, "1.1"))
+        assert tuple(ImageIterator(image, 1, "1.1", prefetch=4)) == frames
+
+    def test_seek_position(self):
+        image_it = ImageIterator(gif_image, 1, prefetch=4)
+        for n in range(gif_image.n_frames):
+            next(image_it)
+            assert gif_image.tell() == n
+        image_it.close()
+
+    def test_seek(self):
+        frames = tuple(ImageIterator(gif_image, 1, "1.1"))
+        for cached in (False, True):
+            image_it = ImageIterator(gif_image, 2, "1.1", cached, 4)
+            assert next(image_it) == frames[0]
+            assert next(image_it) == frames[1]
+
+            image_it.seek(6)
+            assert gif_image.tell() == 1
+            assert next(image_it) == frames[6]
+            assert gif_image.tell() == 6
+            assert next(image_it) == frames[7]
+
+            image_it.seek(0)
+            assert next(image_it) == frames[0]
+            assert next(image_it) == frames[1]
+            image_it.close()
+
+    def test_sizing(self):
+        gif_image2 = BlockImage(gif_img)  # Need to change image size
+        gif_image2._size = (20, 10)
+        image_it = ImageIterator(gif_image2, 1, "1.1", prefetch=4)
+        assert next(image_it).count("\n") + 1 == 10
+        gif_image2._size = (40, 20)
+        for _ in range(3):
+            assert next(image_it).count("\n") + 1 == 20
+        image_it.close()
+
+    def test_error(self):
+        def render(*args, **kwargs):
+            nonlocal n_calls
+            n_calls += 1
+            if n_calls == 3:  # Frames are rendered in order
+                raise ValueError("render")
+            return ""
+
+        n_calls = 0
+        gif_image2 = BlockImage(gif_img)
+        gif_image2._size = _size
+        gif_image2._render_image = render
+        image_it = ImageIterator(gif_image2, 1, "1.1", prefetch=4)
+        next(image_it)
+        next(image_it)
+        with pytest.raises(ValueError, match="render"):
+            next(image_it)
+        assert not hasattr(image_it, "_animator")
+
+    def test_source_digest(self, monkeypatch, tmp_path):
+        def count_sha256(data):
+            n_hashes.append(None)
+            return sha256(data)
+
+        n_hashes = []
+        path = str(tmp_path / "lion.gif")
+        shutil.copy("tests/images/lion.gif", path)
+        image = BlockImage.from_file(path, width=20)
+        image._source_type = ImageSource.URL  # The digest is computed from the file
+        monkeypatch.setattr(common, "sha256", count_sha256)
+        BaseImage.frame_cache_max_bytes = 2**20
+        try:
+            tuple(ImageIterator(image, 1, "1.1", prefetch=4))
+        finally:
+            BaseImage.frame_cache_max_bytes = 0
+            _frame_cache.clear()
+        assert len(n_hashes) == 1
+
+    def test_fg_bg_colors(self, monkeypatch):
+        @utils.cached
+        def get_fg_bg_colors(*, hex=False):  # Queries the terminal, when not cached
+            threads.add(current_thread())
+            return ("#000000",) * 2 if hex else ((0, 0, 0),) * 2
+
+        threads = set()
+        monkeypatch.setattr(common, "get_fg_bg_colors", get_fg_bg_colors)
+        image = BlockImage.from_file("tests/images/lion.gif", width=20)
+        BaseImage.frame_cache_max_bytes = 2**20  # Render cache keys require them
+        try:
+            tuple(ImageIterator(image, 1, "1.1", prefetch=4))
+        finally:
+            BaseImage.frame_cache_max_bytes = 0
+            _frame_cache.clear()
+        assert threads == {main_thread()}
+
+    def test_close(self):
+        image_it = ImageIterator(gif_image, 1, prefetch=4)
+        next(image_it)
+        prefetcher = image_it._animator.gi_frame.f_locals["prefetcher"]
+        image_it.close()
+        assert not prefetcher._thread.is_alive()
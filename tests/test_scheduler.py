@@ -0,0 +1,101 @@
+import pytest
+
+from term_image import _scheduler
+from term_image._scheduler import FrameScheduler
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    class Clock:
+        now = 0
+        slept = []
+
+        def sleep(self, seconds):
+            self.slept.append(seconds)
+            self.now += round(seconds * 10**9)
+
+    clock = Clock()
+    monkeypatch.setattr(_scheduler, "perf_counter_ns", lambda: clock.now)
+    monkeypatch.setattr(_scheduler, "sleep", clock.sleep)
+    return clock
+
+
+def test_args():
+    for value in (None, 1.0, "1", True):
+        with pytest.raises(TypeError, match="'frame_skip'"):
+            FrameScheduler(value)
+    for value in (-1, -10):
+        with pytest.raises(ValueError, match="'frame_skip'"):
+            FrameScheduler(value)
+
+
+def test_no_drift(clock):
+    scheduler = FrameScheduler()
+    scheduler.start(100)
+    for _ in range(10):
+        clock.now += 30  # Rendering and drawing
+        assert scheduler.wait(100)
+    scheduler.finish()
+    assert clock.now == 1100
+    assert scheduler.dropped == 0
+
+
+def test_late_within_duration(clock):
+    scheduler = FrameScheduler()
+    scheduler.start(100)
+    clock.now += 150
+    assert scheduler.wait(100)
+    assert clock.slept == []
+    # The timeline is unchanged
+    clock.now += 10
+    assert scheduler.wait(100)
+    assert clock.now == 200
+
+
+@pytest.mark.parametrize("frame_skip", [0, 1, 2, 3])
+def test_drop(clock, frame_skip):
+    scheduler = FrameScheduler(frame_skip)
+    scheduler.start(100)
+    drawn = []
+    for n in range(1, 11):
+        clock.now += 250  # Always late
+        if scheduler.wait(100):
+            drawn.append(n)
+
+    assert drawn == list(range(frame_skip + 1, 11, frame_skip + 1))
+    assert scheduler.dropped == 10 - len(drawn)
+
+
+def test_resync(clock):
+    scheduler = FrameScheduler(1)
+    scheduler.start(100)
+    clock.now += 1000  # A single stall
+    assert not scheduler.wait(100)
+    assert scheduler.wait(100)  # Timeline restarts from this frame
+    assert scheduler.wait(100)
+    assert clock.now == 1100
+    assert scheduler.dropped == 1
+
+
+@pytest.mark.parametrize("frame_skip", [0, 1, 2, 3])
+def test_skip(clock, frame_skip):
+    scheduler = FrameScheduler(frame_skip)
+    scheduler.start(100)
+    rendered = []
+    for n in range(1, 11):
+        clock.now += 250  # Always late, even before rendering
+        if not scheduler.skip(100):
+            rendered.append(n)
+            assert scheduler.wait(100)
+
+    assert rendered == list(range(frame_skip + 1, 11, frame_skip + 1))
+    assert scheduler.dropped == 10 - len(rendered)
+
+
+def test_skip_on_time(clock):
+    scheduler = FrameScheduler(1)
+    scheduler.start(100)
+    clock.now += 150  # Late, but within the next frame's duration
+    assert not scheduler.skip(100)
+    assert scheduler.wait(100)
+    assert scheduler.dropped == 0
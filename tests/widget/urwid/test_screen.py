@@ -194,6 +194,21 @@ class TestClearImages:
         finally:
             KittyImage._supported = True
 
+    def test_placements_only(self):
+        image_w = UrwidImage(kitty_image)
+        try:
+            KittyImage.id_cache_max_bytes = 2**24
+            with setup_clear_buffers() as (buf, tty_buf):
+                screen.clear_images(image_w)
+                screen.clear_images(now=True)
+                assert (
+                    buf.getvalue()
+                    == ctlseqs.KITTY_DELETE_Z_INDEX_PLACEMENTS % image_w._ti_z_index
+                )
+                assert tty_buf.getvalue() == ctlseqs.KITTY_DELETE_ALL_PLACEMENTS_b
+        finally:
+            KittyImage.id_cache_max_bytes = 0
+
     def test_disguise_state(self):
         image_w = UrwidImage(kitty_image)
         assert image_w._ti_disguise_state == 0